@@ -1,15 +1,26 @@
 import json
+import hashlib
 import re
 import pprint
 import os
 import subprocess
 import shutil
 from sys import platform
+from string import Template
+from functools import lru_cache
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import time
 
 # dict that keeps the order of insertion
 from collections import OrderedDict
 
+# optional: faster parsing of the api.json, falls back to the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def create_folder(path):
     os.mkdir(path)
 
@@ -28,17 +39,44 @@ def zip_directory(output_filename, dir_name):
 def copy_file(src, dest):
     shutil.copyfile(src, dest)
 
+# Hardlinks dest to src (no data is copied), falls back to copying
+# if the file system or the platform doesn't support hardlinks
+def link_or_copy_file(src, dest):
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+# files are read once per run (patches and headers are shared by several generators)
+@lru_cache(maxsize=None)
 def read_file(path):
     text_file = open(path, 'r')
     text_file_contents = text_file.read()
     text_file.close()
     return text_file_contents
 
+# serializes JSON with orjson if available, otherwise with the json module
+# (the fallback writes the same compact, non-escaped UTF-8 as orjson, so the
+# output and the hashes of it don't depend on whether orjson is installed)
+def dump_json(obj):
+    if orjson is None:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(obj).decode("utf-8")
+
+# note: reading a new api file drops the class caches of the previous one
 def read_api_file(path):
+    clear_class_caches()
     api_file_contents = read_file(path)
-    apiData = json.loads(api_file_contents)
+    if orjson is None:
+        apiData = json.loads(api_file_contents)
+    else:
+        apiData = orjson.loads(api_file_contents)
     return apiData
 
+# returns the newest version in the api.json (the last key)
+def get_latest_version(api_data):
+    return next(reversed(api_data))
+
 html_root = "https://azul.rs"
 root_folder = os.path.abspath(os.path.join(__file__, os.pardir))
 prefix = "Az"
@@ -63,6 +101,7 @@ rust_api_patches = {
 
 # ---------------------------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def snake_case_to_lower_camel(snake_str):
     first, *others = snake_str.split('_')
     return ''.join([first.lower(), *map(str.title, others)])
@@ -90,9 +129,11 @@ def write_file(string, path):
     text_file.write(string)
     text_file.close()
 
+@lru_cache(maxsize=None)
 def is_primitive_arg(arg):
     return get_stripped_arg(arg) in basic_types
 
+@lru_cache(maxsize=None)
 def get_stripped_arg(arg):
     arg = arg.replace("&", "")
     arg = arg.replace("&mut", "")
@@ -103,12 +144,12 @@ def get_stripped_arg(arg):
     return arg
 
 def search_imports_arg_type(c, search_type, arg_types_to_search):
-    if search_type in c.keys():
+    if search_type in c:
         for fn_name in c[search_type]:
             const = c[search_type][fn_name]
-            if "fn_args" in const.keys():
+            if "fn_args" in const:
                 for arg_object in const["fn_args"]:
-                    arg_name = list(arg_object.keys())[0]
+                    arg_name = next(iter(arg_object))
                     if arg_name == "self":
                         continue
                     arg_type = arg_object[arg_name]
@@ -120,7 +161,7 @@ def get_all_imports(apiData, module, module_name):
 
     arg_types_to_search = []
 
-    for class_name in module.keys():
+    for class_name in module:
         c = module[class_name]
         search_imports_arg_type(c, "constructors", arg_types_to_search)
         search_imports_arg_type(c, "functions", arg_types_to_search)
@@ -149,7 +190,7 @@ def get_all_imports(apiData, module, module_name):
 
     imports_str = ""
 
-    for module_name in imports.keys():
+    for module_name in imports:
         classes = list(imports[module_name])
         use_str = ""
         if len(classes) == 1:
@@ -170,7 +211,7 @@ def fn_args_c_api(f, class_name, class_ptr_name, self_as_first_arg, apiData):
     fn_args = ""
 
     if self_as_first_arg:
-        self_val = list(f["fn_args"][0].values())[0]
+        self_val = next(iter(f["fn_args"][0].values()))
         if (self_val == "value"):
             fn_args += class_name.lower() + ": " + class_ptr_name + ", "
         elif (self_val == "mut value"):
@@ -182,9 +223,9 @@ def fn_args_c_api(f, class_name, class_ptr_name, self_as_first_arg, apiData):
         else:
             raise Exception("wrong self value " + self_val + " " + class_name)
 
-    if "fn_args" in f.keys():
+    if "fn_args" in f:
         for arg_object in f["fn_args"]:
-            arg_name = list(arg_object.keys())[0]
+            arg_name = next(iter(arg_object))
             if arg_name == "self":
                 continue
             arg_type = arg_object[arg_name]
@@ -210,7 +251,7 @@ def c_fn_args_c_api(f, class_name, class_ptr_name, self_as_first_arg):
     fn_args = ""
 
     if self_as_first_arg:
-        self_val = list(f["fn_args"][0].values())[0]
+        self_val = next(iter(f["fn_args"][0].values()))
         if (self_val == "value"):
             fn_args += "const " + class_ptr_name + " " + class_name.lower() + ", "
         elif (self_val == "mut value"):
@@ -222,9 +263,9 @@ def c_fn_args_c_api(f, class_name, class_ptr_name, self_as_first_arg):
         else:
             raise Exception("wrong self value " + self_val)
 
-    if "fn_args" in f.keys():
+    if "fn_args" in f:
         for arg_object in f["fn_args"]:
-            arg_name = list(arg_object.keys())[0]
+            arg_name = next(iter(arg_object))
             if arg_name == "self":
                 continue
             arg_type = arg_object[arg_name]
@@ -247,6 +288,9 @@ def c_fn_args_c_api(f, class_name, class_ptr_name, self_as_first_arg):
 
     return fn_args
 
+# Splits a type into (pointer / array prefix, type name, array postfix),
+# memoized since the same types are analyzed over and over again
+@lru_cache(maxsize=None)
 def analyze_type(arg):
     starts = ""
     arg_type = ""
@@ -278,45 +322,124 @@ def analyze_type(arg):
         arg_type = arg_type_array[0]
         ends += ";" + arg_type_array[1]
 
-    return [starts, arg_type, ends]
+    return (starts, arg_type, ends)
 
 def class_is_small_enum(c):
-    return "enum_fields" in c.keys()
+    return "enum_fields" in c
 
 def class_is_small_struct(c):
-    return "struct_fields" in c.keys()
+    return "struct_fields" in c
 
 def class_is_typedef(c):
-    return "callback_typedef" in c.keys()
+    return "callback_typedef" in c
 
 def class_is_stack_allocated(c):
-    class_is_boxed_object = not("external" in c.keys() and ("struct_fields" in c.keys() or "enum_fields" in c.keys() or "callback_typedef" in c.keys() or "const" in c.keys()))
+    class_is_boxed_object = not("external" in c and ("struct_fields" in c or "enum_fields" in c or "callback_typedef" in c or "const" in c))
     return not(class_is_boxed_object)
 
+# Returns the kind of the class: "struct", "enum", "callback" or "typedef"
+def get_class_kind(c):
+    if "struct_fields" in c:
+        return "struct"
+    elif "enum_fields" in c:
+        return "enum"
+    elif "callback_typedef" in c:
+        return "callback"
+    else:
+        return "typedef"
+
+# Walks the API once and returns a {class_name: class_kind} map, so that
+# the code generators don't have to re-probe the class for "enum_fields" / "struct_fields"
+def get_class_kinds(api_data):
+    class_kind = {}
+    for module_name in api_data:
+        for class_name, c in api_data[module_name]["classes"].items():
+            class_kind[class_name] = get_class_kind(c)
+    return class_kind
+
 # Same as calling get_class(search_class_by_name())
 def quick_get_class(api_data, searched_class_name):
-    field_type_class_path = search_for_class_by_class_name(api_data, searched_class_name)
-    if field_type_class_path is None:
+    found = get_class_index(api_data).get(searched_class_name)
+    if found is None:
         print("quick_get_class: could not find: " + searched_class_name)
         raise "quick_get_class: could not find: " + searched_class_name
-    found_c = get_class(api_data, field_type_class_path[0], field_type_class_path[1])
-    if found_c is None:
-        print("quick_get_class: could not find: " + searched_class_name)
-        raise "quick_get_class: could not find: " + searched_class_name
-    return found_c
+    return found[1]
+
+# Index of {class_name: (module_name, class)} for each api data, indexed by the id() of the api data
+# (the api data is kept alive in the cache, so the id cannot be reused for another object)
+#
+# The index is built on the first lookup, so the api data must not gain or lose
+# classes afterwards. Both class caches are only valid until clear_class_caches()
+# is called, which read_api_file() does before returning a new api data.
+class_index_cache = {}
+
+# Returns the {class_name: (module_name, class)} index of the api data,
+# built once on the first lookup (class names are unique across modules)
+def get_class_index(api_data):
+    if id(api_data) in class_index_cache:
+        return class_index_cache[id(api_data)][1]
+
+    class_index = {}
+    for module_name in api_data:
+        classes = api_data[module_name]["classes"]
+        for class_name in classes:
+            if not(class_name in class_index):
+                class_index[class_name] = (module_name, classes[class_name])
+
+    class_index_cache[id(api_data)] = (api_data, class_index)
+    return class_index
+
+# Per-class flags that the generators need, derived once from the class dict
+# so that the emitters don't have to re-probe the class for each flag
+def get_class_meta(class_name, c):
+    constructors = c.get("constructors", {})
+    functions = c.get("functions", {})
+    constants = c.get("constants", [])
+    is_const = "const" in c
+    is_callback_typedef = len(c.get("callback_typedef", {})) > 0
+    return {
+        "is_boxed_object": not(class_is_stack_allocated(c)),
+        "is_const": is_const,
+        "is_callback_typedef": is_callback_typedef,
+        "has_custom_destructor": c.get("custom_destructor", False),
+        "treat_external_as_ptr": "external" in c and c.get("is_boxed_object", False),
+        "can_be_cloned": c.get("clone", True),
+        "ptr_name": prefix + class_name,
+        "doc": c.get("doc"),
+        "constructors": constructors,
+        "functions": functions,
+        "constants": constants,
+        "should_emit_impl": len(constructors) > 0 or len(functions) > 0 or len(constants) > 0 and not(is_const or is_callback_typedef),
+    }
+
+# {class_name: class_meta} for each api data, indexed by the id() of the api data
+class_meta_cache = {}
+
+# Returns the {class_name: class_meta} map of the api data, built once on the first call
+# (same lifetime as the class index, the flags must not be changed after the first call)
+def get_class_metas(api_data):
+    if id(api_data) in class_meta_cache:
+        return class_meta_cache[id(api_data)][1]
+
+    class_metas = {}
+    for (class_name, (module_name, c)) in get_class_index(api_data).items():
+        class_metas[class_name] = get_class_meta(class_name, c)
+
+    class_meta_cache[id(api_data)] = (api_data, class_metas)
+    return class_metas
+
+# Drops the class index and class metadata of all api data objects
+def clear_class_caches():
+    class_index_cache.clear()
+    class_meta_cache.clear()
 
 # Find the [module, classname] given a class_name, returns None if not found
 # Then you can use get_class() to get the class object
 def search_for_class_by_class_name(api_data, searched_class_name):
-    for module_name in api_data.keys():
-        module = api_data[module_name]
-        for class_name in module["classes"].keys():
-            c = module["classes"][class_name]
-            class_name = class_name
-            if class_name == searched_class_name or class_name == searched_class_name:
-                return [module_name, class_name]
-
-    return None
+    found = get_class_index(api_data).get(searched_class_name)
+    if found is None:
+        return None
+    return [found[0], searched_class_name]
 
 def get_class(api_data, module_name, class_name):
     return api_data[module_name]["classes"][class_name]
@@ -332,13 +455,13 @@ def is_stack_allocated_type(api_data, class_name):
 # Returns if the class is "pure virtual", i.e. if it is an
 # object consisting of patches instead of being defined in the API
 def class_is_virtual(api_data, className, api):
-    for module_name in api_data.keys():
+    for module_name in api_data:
         module = api_data[module_name]["classes"]
-        for class_name in module.keys():
+        for class_name in module:
             if class_name != className:
                 continue
             c = module[class_name]
-            if "use_patches" in c.keys() and api in c["use_patches"]:
+            if "use_patches" in c and api in c["use_patches"]:
                 return True
 
     return False
@@ -348,7 +471,7 @@ def rust_bindings_fn_args(f, class_name, class_ptr_name, self_as_first_arg, api_
     fn_args = ""
 
     if self_as_first_arg:
-        self_val = list(f["fn_args"][0].values())[0]
+        self_val = next(iter(f["fn_args"][0].values()))
         if (self_val == "value") or (self_val == "mut value"):
             fn_args += "self, "
         elif (self_val == "refmut"):
@@ -358,9 +481,9 @@ def rust_bindings_fn_args(f, class_name, class_ptr_name, self_as_first_arg, api_
         else:
             raise Exception("wrong self value " + self_val)
 
-    if "fn_args" in f.keys():
+    if "fn_args" in f:
         for arg_object in f["fn_args"]:
-            arg_name = list(arg_object.keys())[0]
+            arg_name = next(iter(arg_object))
             if arg_name == "self":
                 continue
             arg_type = arg_object[arg_name]
@@ -391,12 +514,12 @@ def rust_bindings_fn_args(f, class_name, class_ptr_name, self_as_first_arg, api_
 def rust_bindings_call_fn_args(f, class_name, class_ptr_name, self_as_first_arg, api_data, class_is_boxed_object):
     fn_args = ""
     if self_as_first_arg:
-        self_val = list(f["fn_args"][0].values())[0]
+        self_val = next(iter(f["fn_args"][0].values()))
         fn_args += "self, "
 
-    if "fn_args" in f.keys():
+    if "fn_args" in f:
         for arg_object in f["fn_args"]:
-            arg_name = list(arg_object.keys())[0]
+            arg_name = next(iter(arg_object))
             if arg_name == "self":
                 continue
 
@@ -446,7 +569,7 @@ def rust_bindings_call_fn_args(f, class_name, class_ptr_name, self_as_first_arg,
 #
 def generate_rust_dll(api_data):
 
-    version = list(api_data.keys())[-1]
+    version = get_latest_version(api_data)
     code = ""
     code += "//! WARNING: autogenerated code for azul api version " + str(version) + "\r\n"
     code += "\r\n"
@@ -469,36 +592,36 @@ def generate_rust_dll(api_data):
     structs_map = OrderedDict({})
     rust_functions_map = OrderedDict({})
 
-    for module_name in myapi_data.keys():
+    for module_name in myapi_data:
         module = myapi_data[module_name]["classes"]
 
-        for class_name in module.keys():
+        for class_name in module:
             c = module[class_name]
 
             code += "\r\n"
 
             class_is_boxed_object = not(class_is_stack_allocated(c))
-            class_is_const = "const" in c.keys()
+            class_is_const = "const" in c
             class_can_be_cloned = True
-            if "clone" in c.keys():
+            if "clone" in c:
                 class_can_be_cloned = c["clone"]
 
             struct_derive = []
-            if "derive" in c.keys():
+            if "derive" in c:
                 struct_derive = c["derive"]
 
-            class_can_derive_debug = "derive" in c.keys() and "Debug" in c["derive"]
-            class_can_be_copied = "derive" in c.keys() and "Copy" in c["derive"]
-            class_has_partialeq = "derive" in c.keys() and "PartialEq" in c["derive"]
-            class_has_eq = "derive" in c.keys()and "Eq" in c["derive"]
-            class_has_partialord = "derive" in c.keys()and "PartialOrd" in c["derive"]
-            class_has_ord = "derive" in c.keys() and "Ord" in c["derive"]
-            class_can_be_hashed = "derive" in c.keys() and "Hash" in c["derive"]
+            class_can_derive_debug = "Debug" in c.get("derive", ())
+            class_can_be_copied = "Copy" in c.get("derive", ())
+            class_has_partialeq = "PartialEq" in c.get("derive", ())
+            class_has_eq = "Eq" in c.get("derive", ())
+            class_has_partialord = "PartialOrd" in c.get("derive", ())
+            class_has_ord = "Ord" in c.get("derive", ())
+            class_can_be_hashed = "Hash" in c.get("derive", ())
 
-            class_has_custom_destructor = ("custom_destructor" in c.keys() and c["custom_destructor"])
-            class_is_callback_typedef = "callback_typedef" in c.keys() and (len(c["callback_typedef"].keys()) > 0)
-            is_boxed_object = "is_boxed_object" in c.keys() and c["is_boxed_object"]
-            treat_external_as_ptr = "external" in c.keys() and is_boxed_object
+            class_has_custom_destructor = ("custom_destructor" in c and c["custom_destructor"])
+            class_is_callback_typedef = "callback_typedef" in c and (len(c["callback_typedef"]) > 0)
+            is_boxed_object = "is_boxed_object" in c and c["is_boxed_object"]
+            treat_external_as_ptr = "external" in c and is_boxed_object
 
             # Small structs and enums are stack-allocated in order to save on indirection
             # They don't have destructors, since they
@@ -514,7 +637,7 @@ def generate_rust_dll(api_data):
             class_has_recursive_destructor = has_recursive_destructor(myapi_data, c)
 
             struct_doc = ""
-            if "doc" in c.keys():
+            if "doc" in c:
                 struct_doc = c["doc"]
             else:
                 if c_is_stack_allocated:
@@ -525,10 +648,10 @@ def generate_rust_dll(api_data):
             code += "/// " + struct_doc  + "\r\n"
 
             struct_serde = ""
-            if "serde" in c.keys():
+            if "serde" in c:
                 struct_serde = c["serde"]
 
-            if "external" in c.keys():
+            if "external" in c:
                 external_path = c["external"]
                 if class_is_const:
                     code += "pub static " + class_ptr_name + ": " + prefix + c["const"] + " = " + external_path + ";\r\n"
@@ -552,7 +675,7 @@ def generate_rust_dll(api_data):
                     else:
                         code += "#[repr(C)] pub struct " + class_ptr_name + " { pub ptr: *mut c_void }\r\n"
                 else:
-                    if "struct_fields" in c.keys():
+                    if "struct_fields" in c:
                         structs_map[class_ptr_name] = {
                             "external": external_path,
                             "clone": class_can_be_cloned,
@@ -565,7 +688,7 @@ def generate_rust_dll(api_data):
                         }
                         if len(struct_serde) > 0:
                             structs_map[class_ptr_name]["serde"] = struct_serde
-                    elif "enum_fields" in c.keys():
+                    elif "enum_fields" in c:
                         structs_map[class_ptr_name] = {
                             "external": external_path,
                             "clone": class_can_be_cloned,
@@ -583,7 +706,7 @@ def generate_rust_dll(api_data):
                     code += "pub use " + class_ptr_name + "TT as " + class_ptr_name + ";\r\n"
             else:
                 raise Exception("structs without 'external' key are not allowed! " + class_name)
-            if "constructors" in c.keys():
+            if "constructors" in c:
                 for fn_name in c["constructors"]:
 
                     const = c["constructors"][fn_name]
@@ -597,14 +720,14 @@ def generate_rust_dll(api_data):
                         fn_body += "let ptr = Box::into_raw(Box::new(object)) as *mut c_void; "
                         fn_body += class_ptr_name + " { ptr }"
 
-                    if "doc" in const.keys():
+                    if "doc" in const:
                         code += "/// " + const["doc"] + "\r\n"
                     else:
                         code += "/// Creates a new `" + class_name + "` instance whose memory is owned by the rust allocator\r\n"
                         code += "/// Equivalent to the Rust `" + class_name  + "::" + fn_name + "()` constructor.\r\n"
 
                     returns = class_ptr_name
-                    if "returns" in const.keys():
+                    if "returns" in const:
                         return_type = const["returns"]["type"]
                         analyzed_return_type = analyze_type(return_type)
                         if is_primitive_arg(analyzed_return_type[1]):
@@ -619,19 +742,20 @@ def generate_rust_dll(api_data):
 
                     fn_args = fn_args_c_api(const, class_name, class_ptr_name, False, myapi_data)
 
-                    rust_functions_map[str(class_ptr_name + "_" + snake_case_to_lower_camel(fn_name))] = [fn_args, returns];
-                    code += "#[no_mangle] pub extern \"C\" fn " + class_ptr_name + "_" + snake_case_to_lower_camel(fn_name) + "(" + fn_args + ") -> " + returns + " { "
+                    c_fn_name = class_ptr_name + "_" + snake_case_to_lower_camel(fn_name)
+                    rust_functions_map[c_fn_name] = [fn_args, returns];
+                    code += "#[no_mangle] pub extern \"C\" fn " + c_fn_name + "(" + fn_args + ") -> " + returns + " { "
                     code += fn_body
                     code += " }\r\n"
 
-            if "functions" in c.keys():
+            if "functions" in c:
                 for fn_name in c["functions"]:
 
                     f = c["functions"][fn_name]
 
                     fn_body = f["fn_body"]
 
-                    if "doc" in f.keys():
+                    if "doc" in f:
                         code += "/// " + f["doc"] + "\r\n"
                     else:
                         code += "/// Equivalent to the Rust `" + class_name  + "::" + fn_name + "()` function.\r\n"
@@ -639,7 +763,7 @@ def generate_rust_dll(api_data):
                     fn_args = fn_args_c_api(f, class_name, class_ptr_name, True, myapi_data)
 
                     returns = ""
-                    if "returns" in f.keys():
+                    if "returns" in f:
                         return_type = f["returns"]["type"]
                         analyzed_return_type = analyze_type(return_type)
                         if is_primitive_arg(analyzed_return_type[1]):
@@ -651,9 +775,10 @@ def generate_rust_dll(api_data):
 
                             returns = analyzed_return_type[0] + prefix + return_type_class[1] + analyzed_return_type[2] # no postfix
 
-                    rust_functions_map[str(class_ptr_name + "_" + snake_case_to_lower_camel(fn_name))] = [fn_args, returns];
+                    c_fn_name = class_ptr_name + "_" + snake_case_to_lower_camel(fn_name)
+                    rust_functions_map[c_fn_name] = [fn_args, returns];
                     return_arrow = "" if returns == "" else " -> "
-                    code += "#[no_mangle] pub extern \"C\" fn " + class_ptr_name + "_" + snake_case_to_lower_camel(fn_name) + "(" + fn_args + ")" + return_arrow + returns + " { "
+                    code += "#[no_mangle] pub extern \"C\" fn " + c_fn_name + "(" + fn_args + ")" + return_arrow + returns + " { "
                     code += fn_body
                     code += " }\r\n"
 
@@ -700,22 +825,22 @@ def generate_rust_dll(api_data):
 # @returns bool
 def has_recursive_destructor(myapi_data, c):
 
-    class_is_callback_typedef = "callback_typedef" in c.keys() and (len(c["callback_typedef"].keys()) > 0)
+    class_is_callback_typedef = "callback_typedef" in c and (len(c["callback_typedef"]) > 0)
 
     if class_is_callback_typedef:
         return False
 
-    class_has_custom_destructor = ("custom_destructor" in c.keys() and c["custom_destructor"])
-    is_boxed_object = "is_boxed_object" in c.keys() and c["is_boxed_object"]
-    treat_external_as_ptr = "external" in c.keys() and is_boxed_object
+    class_has_custom_destructor = ("custom_destructor" in c and c["custom_destructor"])
+    is_boxed_object = "is_boxed_object" in c and c["is_boxed_object"]
+    treat_external_as_ptr = "external" in c and is_boxed_object
 
     if class_has_custom_destructor or treat_external_as_ptr:
         return True
 
     # loop through fields and recurse
-    if "struct_fields" in c.keys():
+    if "struct_fields" in c:
         for field in c["struct_fields"]:
-            field_name = list(field.keys())[0]
+            field_name = next(iter(field))
             if not "type" in field[field_name]:
                 print("error: struct " + str(c) + " field " + field_name + " has no \"type\"!")
             field_type = field[field_name]["type"]
@@ -724,11 +849,10 @@ def has_recursive_destructor(myapi_data, c):
                 continue
             if has_recursive_destructor(myapi_data, quick_get_class(myapi_data, field_type_analyzed[1])):
                 return True
-    elif "enum_fields" in c.keys():
+    elif "enum_fields" in c:
         for enum_name in c["enum_fields"]:
-            variant_name = list(enum_name.keys())[0]
-            variant = enum_name[variant_name]
-            if "type" in variant.keys():
+            (variant_name, variant), = enum_name.items()
+            if "type" in variant:
                 field_type_analyzed = analyze_type(variant["type"])
                 if is_primitive_arg(field_type_analyzed[1]):
                     continue
@@ -746,9 +870,9 @@ def has_recursive_destructor(myapi_data, c):
 # This function generates a list of all these imports
 def generate_list_of_struct_imports(structs_map):
     import_str = ""
-    for struct_name in structs_map.keys():
+    for struct_name in structs_map:
         struct = structs_map[struct_name]
-        if "external" in struct.keys():
+        if "external" in struct:
             external_ref = struct["external"]
             import_str += "use " + external_ref + " as " + struct_name + ";\r\n"
     return import_str
@@ -781,21 +905,20 @@ def sort_structs_map(api_data, structs_map):
     classes_not_found = OrderedDict([])
 
     # first, insert all types that only have primitive types as fields
-    for class_name in structs_map.keys():
+    for class_name in structs_map:
         clazz = structs_map[class_name]
         should_insert_struct = True
 
-        found_c_is_callback_typedef = "callback_typedef" in clazz.keys() and (len(clazz["callback_typedef"].keys()) > 0)
-        found_c_is_boxed_object = "is_boxed_object" in clazz.keys() and clazz["is_boxed_object"]
-        class_in_forward_decl = class_name in forward_delcarations.keys()
+        found_c_is_callback_typedef = "callback_typedef" in clazz and (len(clazz["callback_typedef"]) > 0)
+        found_c_is_boxed_object = "is_boxed_object" in clazz and clazz["is_boxed_object"]
+        class_in_forward_decl = class_name in forward_delcarations
 
         if found_c_is_callback_typedef:
             pass
-        elif "struct" in clazz.keys():
+        elif "struct" in clazz:
             struct = clazz["struct"]
             for field in struct:
-                field_name = list(field.keys())[0]
-                field_type = list(field.values())[0]
+                (field_name, field_type), = field.items()
                 if not "type" in field_type:
                     raise Exception("missing type field in " + class_name + " " + field_name)
                 field_type = analyze_type(field_type["type"])[1]
@@ -806,12 +929,11 @@ def sort_structs_map(api_data, structs_map):
                     field_is_fn_ptr = class_is_typedef(get_class(api_data, found_c[0], found_c[1]))
                     if not(class_in_forward_decl and field_type == forward_delcarations[class_name]) and not(field_is_fn_ptr):
                         should_insert_struct = False
-        elif "enum" in clazz.keys():
+        elif "enum" in clazz:
             enum = clazz["enum"]
             for variant in enum:
-                variant_name = list(variant.keys())[0]
-                variant_type = list(variant.values())[0]
-                if "type" in variant_type.keys():
+                (variant_name, variant_type), = variant.items()
+                if "type" in variant_type:
                     variant_type = analyze_type(variant_type["type"])[1]
                     if not(is_primitive_arg(variant_type)):
                         found_c = search_for_class_by_class_name(api_data, variant_type)
@@ -831,43 +953,41 @@ def sort_structs_map(api_data, structs_map):
     # Now loop through every class that was not a primitive type
     # usually this should resolve in 9 - 10 iterations
     iteration_count = 0;
-    while not(len(classes_not_found.keys()) == 0):
+    while not(len(classes_not_found) == 0):
         # classes not found in this iteration
         current_classes_not_found = OrderedDict([])
 
-        for class_name in classes_not_found.keys():
+        for class_name in classes_not_found:
             clazz = classes_not_found[class_name]
             should_insert_struct = True
-            found_c_is_callback_typedef = "callback_typedef" in clazz.keys() and (len(clazz["callback_typedef"].keys()) > 0)
-            class_in_forward_decl = class_name in forward_delcarations.keys()
+            found_c_is_callback_typedef = "callback_typedef" in clazz and (len(clazz["callback_typedef"]) > 0)
+            class_in_forward_decl = class_name in forward_delcarations
             if found_c_is_callback_typedef:
                 pass
-            elif "struct" in clazz.keys():
+            elif "struct" in clazz:
                 struct = clazz["struct"]
                 for field in struct:
-                    field_name = list(field.keys())[0]
-                    field_type = list(field.values())[0]
+                    (field_name, field_type), = field.items()
                     field_type = analyze_type(field_type["type"])[1]
                     if not(is_primitive_arg(field_type)):
                         found_c = search_for_class_by_class_name(api_data, field_type)
                         field_is_fn_ptr = class_is_typedef(get_class(api_data, found_c[0], found_c[1]))
                         if not(class_in_forward_decl and field_type == forward_delcarations[class_name]) and not(field_is_fn_ptr):
                             field_type = prefix + field_type
-                            if not(field_type in sorted_class_map.keys()):
+                            if not(field_type in sorted_class_map):
                                 should_insert_struct = False
-            elif "enum" in clazz.keys():
+            elif "enum" in clazz:
                 enum = clazz["enum"]
                 for variant in enum:
-                    variant_name = list(variant.keys())[0]
-                    variant_type = list(variant.values())[0]
-                    if "type" in variant_type.keys():
+                    (variant_name, variant_type), = variant.items()
+                    if "type" in variant_type:
                         variant_type = analyze_type(variant_type["type"])[1]
                         if not(is_primitive_arg(variant_type)):
                             found_c = search_for_class_by_class_name(api_data, variant_type)
                             field_is_fn_ptr = class_is_typedef(get_class(api_data, found_c[0], found_c[1]))
                             if not(class_in_forward_decl and variant_type == forward_delcarations[class_name]) and not(field_is_fn_ptr):
                                 variant_type = prefix + variant_type
-                                if not(variant_type in sorted_class_map.keys()):
+                                if not(variant_type in sorted_class_map):
                                     should_insert_struct = False
             else:
                 raise Exception("sort_structs_map: not enum nor struct " + class_name + "")
@@ -884,60 +1004,57 @@ def sort_structs_map(api_data, structs_map):
         # NOTE: if the iteration count is extremely high,
         # something is wrong with the script
         if iteration_count > 500:
-            raise Exception("infinite recursion detected in sort_structs_map: " + str(len(current_classes_not_found.keys())) + " unresolved structs = " + str(current_classes_not_found.keys()) + "\r\n")
+            raise Exception("infinite recursion detected in sort_structs_map: " + str(len(current_classes_not_found)) + " unresolved structs = " + str(current_classes_not_found.keys()) + "\r\n")
 
     return [sorted_class_map, forward_delcarations, extra_forward_delcarations]
 
 # Generate the RUST code for the struct layout of the final API
 # This function has to be called twice in order to ensure that the layout of the struct
 # matches the layout in the binary
-def generate_structs(api_data, structs_map, autoderive, indent = 4, private_pointers=True,no_derive=False,wrapper_postfix=""):
+def generate_structs(api_data, structs_map, autoderive, indent = 4, private_pointers=True,no_derive=False,wrapper_postfix="",newline="\r\n"):
 
     indent_str = " " * indent
 
     code = ""
 
-    for struct_name in structs_map.keys():
+    for struct_name in structs_map:
         struct = structs_map[struct_name]
 
-        if "doc" in struct.keys():
-            code += indent_str + "/// " + struct["doc"] + "\r\n"
+        if "doc" in struct:
+            code += indent_str + "/// " + struct["doc"] + newline
         else:
-            code += indent_str + "/// `" + struct_name + "` struct\r\n"
-
-        class_is_callback_typedef = "callback_typedef" in struct.keys() and (len(struct["callback_typedef"].keys()) > 0)
-        class_can_be_copied = "derive" in struct.keys() and "Copy" in struct["derive"]
-        class_can_be_serde_serialized = "derive" in struct.keys() and "Serialize" in struct["derive"]
-        class_can_be_serde_deserialized = "derive" in struct.keys() and "Deserialize" in struct["derive"]
-        class_implements_default = "derive" in struct.keys() and "Default" in struct["derive"]
-        class_implements_eq = "derive" in struct.keys() and "Eq" in struct["derive"]
-        class_implements_ord = "derive" in struct.keys() and "Ord" in struct["derive"]
-        class_implements_hash = "derive" in struct.keys() and "Hash" in struct["derive"]
-        class_has_custom_destructor = "custom_destructor" in struct.keys() and struct["custom_destructor"]
-        class_can_be_cloned = True
-        if "clone" in struct.keys():
-            class_can_be_cloned = struct["clone"]
-
-        is_boxed_object = "is_boxed_object" in struct.keys() and struct["is_boxed_object"]
-        treat_external_as_ptr = "external" in struct.keys() and is_boxed_object
+            code += indent_str + "/// `" + struct_name + "` struct" + newline
+
+        struct_derive = set(struct.get("derive", ()))
+        class_is_callback_typedef = len(struct.get("callback_typedef", {})) > 0
+        class_can_be_copied = "Copy" in struct_derive
+        class_can_be_serde_serialized = "Serialize" in struct_derive
+        class_can_be_serde_deserialized = "Deserialize" in struct_derive
+        class_implements_default = "Default" in struct_derive
+        class_implements_eq = "Eq" in struct_derive
+        class_implements_ord = "Ord" in struct_derive
+        class_implements_hash = "Hash" in struct_derive
+        class_has_custom_destructor = struct.get("custom_destructor", False)
+        class_can_be_cloned = struct.get("clone", True)
+        treat_external_as_ptr = "external" in struct and struct.get("is_boxed_object", False)
 
 
         opt_derive_default = ""
         if class_implements_default:
-            opt_derive_default = indent_str + "#[derive(Default)]\r\n"
+            opt_derive_default = indent_str + "#[derive(Default)]" + newline
 
         opt_derive_serde_extra_options = ""
         if class_can_be_serde_serialized or class_can_be_serde_deserialized:
-            if "serde" in struct.keys():
-                opt_derive_serde_extra_options = indent_str + "#[cfg_attr(feature = \"serde-support\", serde(" + struct["serde"] + "))]\r\n"
+            if "serde" in struct:
+                opt_derive_serde_extra_options = indent_str + "#[cfg_attr(feature = \"serde-support\", serde(" + struct["serde"] + "))]" + newline
 
         opt_derive_serde = ""
         if class_can_be_serde_serialized and class_can_be_serde_deserialized:
-            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Serialize, Deserialize))]\r\n"
+            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Serialize, Deserialize))]" + newline
         elif class_can_be_serde_serialized:
-            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Serialize))]\r\n"
+            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Serialize))]" + newline
         elif class_can_be_serde_deserialized:
-            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Deserialize))]\r\n"
+            opt_derive_serde = indent_str + "#[cfg_attr(feature = \"serde-support\", derive(Deserialize))]" + newline
 
         if no_derive:
             opt_derive_serde = ""
@@ -946,16 +1063,16 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
 
         if class_is_callback_typedef:
             fn_ptr = generate_rust_callback_fn_type(api_data, struct["callback_typedef"])
-            code += indent_str + "pub type " + struct_name + " = " + fn_ptr + ";\r\n\r\n"
-        elif "struct" in struct.keys():
+            code += indent_str + "pub type " + struct_name + " = " + fn_ptr + ";" + newline + newline
+        elif "struct" in struct:
             struct = struct["struct"]
 
             # for LayoutCallback and RefAny, etc. the #[derive(Debug)] has to be implemented manually
 
-            opt_derive_debug = indent_str + "#[derive(Debug)]\r\n"
-            opt_derive_clone = indent_str + "#[derive(Clone)]\r\n"
-            opt_derive_copy = indent_str + "#[derive(Copy)]\r\n"
-            opt_derive_other = indent_str + "#[derive(PartialEq, PartialOrd)]\r\n"
+            opt_derive_debug = indent_str + "#[derive(Debug)]" + newline
+            opt_derive_clone = indent_str + "#[derive(Clone)]" + newline
+            opt_derive_copy = indent_str + "#[derive(Copy)]" + newline
+            opt_derive_other = indent_str + "#[derive(PartialEq, PartialOrd)]" + newline
             opt_derive_eq = ""
             opt_derive_ord = ""
             opt_derive_hash = ""
@@ -983,28 +1100,25 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
 
             if len(opt_derive_other) > 0:
                 if class_implements_eq:
-                    opt_derive_eq = indent_str + "#[derive(Eq)]\r\n"
+                    opt_derive_eq = indent_str + "#[derive(Eq)]" + newline
                 if class_implements_ord:
-                    opt_derive_ord = indent_str + "#[derive(Ord)]\r\n"
+                    opt_derive_ord = indent_str + "#[derive(Ord)]" + newline
                 if class_implements_hash:
-                    opt_derive_hash = indent_str + "#[derive(Hash)]\r\n"
+                    opt_derive_hash = indent_str + "#[derive(Hash)]" + newline
 
             for field in struct:
-                if "type" in list(field.values())[0]:
-                    analyzed_arg_type = analyze_type(list(field.values())[0]["type"])
+                field_type = next(iter(field.values()))
+                if "type" in field_type:
+                    analyzed_arg_type = analyze_type(field_type["type"])
                     if not(is_primitive_arg(analyzed_arg_type[1])):
-                        field_type_class_path = search_for_class_by_class_name(api_data, analyzed_arg_type[1])
-                        if field_type_class_path is None:
-                            print("no field_type_class_path found for " + str(analyzed_arg_type))
-                        found_c = get_class(api_data, field_type_class_path[0], field_type_class_path[1])
-                        found_c_is_callback_typedef = "callback_typedef" in found_c.keys() and found_c["callback_typedef"]
-                        if found_c_is_callback_typedef:
+                        found_c = quick_get_class(api_data, analyzed_arg_type[1])
+                        if found_c.get("callback_typedef"):
                             opt_derive_debug = ""
                             opt_derive_other = ""
 
-            repr = "#[repr(C)]\r\n"
-            if "repr" in structs_map[struct_name].keys():
-                repr = "#[repr(" + structs_map[struct_name]["repr"] + ")]\r\n"
+            repr = "#[repr(C)]" + newline
+            if "repr" in structs_map[struct_name]:
+                repr = "#[repr(" + structs_map[struct_name]["repr"] + ")]" + newline
 
             code += indent_str + repr
             code += opt_derive_debug + opt_derive_clone
@@ -1014,18 +1128,17 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
             code += opt_derive_default
             code += opt_derive_serde
             code += opt_derive_serde_extra_options
-            code += indent_str + "pub struct " + struct_name + " {\r\n"
+            code += indent_str + "pub struct " + struct_name + " {" + newline
 
             for field in struct:
                 if type(field) is str:
                     print("Struct " + struct_name + " should have a dictionary as fields")
-                field_name = list(field.keys())[0]
-                field_type = list(field.values())[0]
+                (field_name, field_type), = field.items()
                 if "type" in field_type:
                     field_type = field_type["type"]
                     field_extra_derive = ""
-                    if "derive" in field[field_name].keys():
-                        field_extra_derive = field[field_name]["derive"] + "\r\n"
+                    if "derive" in field[field_name]:
+                        field_extra_derive = field[field_name]["derive"] + newline
                     code += field_extra_derive
                     analyzed_arg_type = analyze_type(field_type)
                     if is_primitive_arg(analyzed_arg_type[1]):
@@ -1033,7 +1146,7 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
                             code += indent_str + "    " + "pub(crate) "
                         else:
                             code += indent_str + "    " + "pub "
-                        code += field_name + ": " + field_type + ",\r\n"
+                        code += field_name + ": " + field_type + "," + newline
                     else:
                         field_type_class_path = search_for_class_by_class_name(api_data, analyzed_arg_type[1])
                         if field_type_class_path is None:
@@ -1046,32 +1159,31 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
                             code += indent_str + "    " + "pub "
                         field_postfix = wrapper_postfix
                         prevent_wrapper_recursion = len(wrapper_postfix) != 0 and struct_name.endswith(wrapper_postfix)
-                        found_c_is_enum = "enum_fields" in found_c.keys()
+                        found_c_is_enum = "enum_fields" in found_c
                         if (not(found_c_is_enum) or prevent_wrapper_recursion):
                             field_postfix = ""
-                        code += field_name + ": " + analyzed_arg_type[0] + prefix + field_type_class_path[1] + field_postfix + analyzed_arg_type[2] + ",\r\n"
+                        code += field_name + ": " + analyzed_arg_type[0] + prefix + field_type_class_path[1] + field_postfix + analyzed_arg_type[2] + "," + newline
                 else:
                     print("struct " + struct_name + " does not have a type on field " + field_name)
                     raise Exception("error")
-            code += indent_str + "}\r\n\r\n"
-        elif "enum" in struct.keys():
+            code += indent_str + "}" + newline + newline
+        elif "enum" in struct:
             enum = struct["enum"]
-            repr = "#[repr(C)]\r\n"
+            repr = "#[repr(C)]" + newline
 
             for variant in enum:
-                variant_name = list(variant.keys())[0]
-                variant = list(variant.values())[0]
-                if "type" in variant.keys():
-                    repr = "#[repr(C, u8)]\r\n"
+                (variant_name, variant), = variant.items()
+                if "type" in variant:
+                    repr = "#[repr(C, u8)]" + newline
 
-            if "repr" in structs_map[struct_name].keys():
-                repr = "#[repr(" + structs_map[struct_name]["repr"] + ")]\r\n"
+            if "repr" in structs_map[struct_name]:
+                repr = "#[repr(" + structs_map[struct_name]["repr"] + ")]" + newline
 
             # don't derive(Debug) for enums with function pointers in their variants
-            opt_derive_debug = indent_str + "#[derive(Debug)]\r\n"
-            opt_derive_clone = indent_str + "#[derive(Clone)]\r\n"
-            opt_derive_copy = indent_str + "#[derive(Copy)]\r\n"
-            opt_derive_other = indent_str + "#[derive(PartialEq, PartialOrd)]\r\n"
+            opt_derive_debug = indent_str + "#[derive(Debug)]" + newline
+            opt_derive_clone = indent_str + "#[derive(Clone)]" + newline
+            opt_derive_copy = indent_str + "#[derive(Copy)]" + newline
+            opt_derive_other = indent_str + "#[derive(PartialEq, PartialOrd)]" + newline
             opt_derive_eq = ""
             opt_derive_ord = ""
             opt_derive_hash = ""
@@ -1096,24 +1208,20 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
 
             if len(opt_derive_other) > 0:
                 if class_implements_eq:
-                    opt_derive_eq = indent_str + "#[derive(Eq)]\r\n"
+                    opt_derive_eq = indent_str + "#[derive(Eq)]" + newline
                 if class_implements_ord:
-                    opt_derive_ord = indent_str + "#[derive(Ord)]\r\n"
+                    opt_derive_ord = indent_str + "#[derive(Ord)]" + newline
                 if class_implements_hash:
-                    opt_derive_hash = indent_str + "#[derive(Hash)]\r\n"
+                    opt_derive_hash = indent_str + "#[derive(Hash)]" + newline
 
             for variant in enum:
-                variant = list(variant.values())[0]
-                if "type" in variant.keys():
+                variant = next(iter(variant.values()))
+                if "type" in variant:
                     variant_type = variant["type"]
                     analyzed_arg_type = analyze_type(variant_type)
                     if not(is_primitive_arg(analyzed_arg_type[1])):
-                        field_type_class_path = search_for_class_by_class_name(api_data, analyzed_arg_type[1])
-                        if field_type_class_path is None:
-                            print("no field_type_class_path found for " + str(analyzed_arg_type))
-                        found_c = get_class(api_data, field_type_class_path[0], field_type_class_path[1])
-                        found_c_is_callback_typedef = "callback_typedef" in found_c.keys() and found_c["callback_typedef"]
-                        if found_c_is_callback_typedef:
+                        found_c = quick_get_class(api_data, analyzed_arg_type[1])
+                        if found_c.get("callback_typedef"):
                             opt_derive_debug = ""
                             opt_derive_other = ""
 
@@ -1125,33 +1233,32 @@ def generate_structs(api_data, structs_map, autoderive, indent = 4, private_poin
             code += opt_derive_default
             code += opt_derive_serde
             code += opt_derive_serde_extra_options
-            code += indent_str + "pub enum " + struct_name + " {\r\n"
+            code += indent_str + "pub enum " + struct_name + " {" + newline
 
             for variant in enum:
-                variant_name = list(variant.keys())[0]
-                variant = list(variant.values())[0]
-                if "type" in variant.keys():
+                (variant_name, variant), = variant.items()
+                if "type" in variant:
                     variant_type = variant["type"]
                     if is_primitive_arg(variant_type):
-                        code += indent_str + "    " + variant_name + "(" + variant_type + "),\r\n"
+                        code += indent_str + "    " + variant_name + "(" + variant_type + ")," + newline
                     else:
                         analyzed_arg_type = analyze_type(variant_type)
                         if is_primitive_arg(analyzed_arg_type[1]):
                             # array of [f32;x]
-                            code += indent_str + "    "  + variant_name + "(" + analyzed_arg_type[0] + analyzed_arg_type[1] + analyzed_arg_type[2] + "),\r\n"
+                            code += indent_str + "    "  + variant_name + "(" + analyzed_arg_type[0] + analyzed_arg_type[1] + analyzed_arg_type[2] + ")," + newline
                         else:
                             field_type_class_path = search_for_class_by_class_name(api_data, analyzed_arg_type[1])
                             if field_type_class_path is None:
                                 print("variant_type not found: " + variant_type + " in " + struct_name)
                             found_c = get_class(api_data, field_type_class_path[0], field_type_class_path[1])
-                            found_c_is_enum = "enum" in found_c.keys()
+                            found_c_is_enum = "enum" in found_c
                             variant_postfix = wrapper_postfix
                             if not(found_c_is_enum):
                                 variant_postfix = ""
-                            code += indent_str + "    "  + variant_name + "(" + analyzed_arg_type[0] + prefix + field_type_class_path[1] + variant_postfix + analyzed_arg_type[2] + "),\r\n"
+                            code += indent_str + "    "  + variant_name + "(" + analyzed_arg_type[0] + prefix + field_type_class_path[1] + variant_postfix + analyzed_arg_type[2] + ")," + newline
                 else:
-                    code += indent_str + "    "  + variant_name + ",\r\n"
-            code += indent_str + "}\r\n\r\n"
+                    code += indent_str + "    "  + variant_name + "," + newline
+            code += indent_str + "}" + newline + newline
 
     return code
 
@@ -1172,7 +1279,7 @@ def generate_rust_dll_bindings(api_data, structs_map, functions_map):
     code += "    #[cfg_attr(not(target_os = \"windows\"), link(name=\"azul\"))] // https://github.com/rust-lang/cargo/issues/9082\r\n"
     code += "    extern \"C\" {\r\n"
 
-    for fn_name in functions_map.keys():
+    for fn_name in functions_map:
         fn_type = functions_map[fn_name]
         fn_args = fn_type[0]
         fn_return = fn_type[1]
@@ -1201,46 +1308,84 @@ def generate_rust_dll_bindings(api_data, structs_map, functions_map):
 
     return code
 
-# Generates the azul-dll/python.rs file (pyo3 bindings)
-def generate_python_api(api_data, structs_map, functions_map):
-
-    version = list(api_data.keys())[-1]
-
-    pyo3_code = ""
-    pyo3_code += "#![allow(non_snake_case)]\r\n"
-    pyo3_code += "\r\n"
-    pyo3_code += read_file(root_folder + "/api/_patches/azul-dll/header.rs")
-    pyo3_code += "\r\n"
-    pyo3_code += "use core::mem;\r\n"
-    pyo3_code += "use pyo3::prelude::*;\r\n"
-    pyo3_code += "use pyo3::PyObjectProtocol;\r\n"
-    pyo3_code += "use pyo3::types::*;\r\n"
-    pyo3_code += "use pyo3::exceptions::PyException;\r\n"
-
-    # This should be done properly, but right now it works
-
-    pyo3_code += "type GLuint = u32; type AzGLuint = GLuint;\r\n"
-    pyo3_code += "type GLint = i32; type AzGLint = GLint;\r\n"
-    pyo3_code += "type GLint64 = i64; type AzGLint64 = GLint64;\r\n"
-    pyo3_code += "type GLuint64 = u64; type AzGLuint64 = GLuint64;\r\n"
-    pyo3_code += "type GLenum = u32; type AzGLenum = GLenum;\r\n"
-    pyo3_code += "type GLintptr = isize; type AzGLintptr = GLintptr;\r\n"
-    pyo3_code += "type GLboolean = u8; type AzGLboolean = GLboolean;\r\n"
-    pyo3_code += "type GLsizeiptr = isize; type AzGLsizeiptr = GLsizeiptr;\r\n"
-    pyo3_code += "type GLvoid = c_void; type AzGLvoid = GLvoid;\r\n"
-    pyo3_code += "type GLbitfield = u32; type AzGLbitfield = GLbitfield;\r\n"
-    pyo3_code += "type GLsizei = i32; type AzGLsizei = GLsizei;\r\n"
-    pyo3_code += "type GLclampf = f32; type AzGLclampf = GLclampf;\r\n"
-    pyo3_code += "type GLfloat = f32; type AzGLfloat = GLfloat;\r\n"
-    pyo3_code += "type AzF32 = f32;\r\n"
-    pyo3_code += "type AzU16 = u16;\r\n"
-    pyo3_code += "type AzU32 = u32;\r\n"
-    pyo3_code += "type AzScanCode = u32;\r\n"
-
-    pyo3_code += "\r\n"
-    pyo3_code += "\r\n"
-    pyo3_code += read_file(root_folder + "/api/_patches/python/api.rs")
-    pyo3_code += "\r\n"
+# Templates for the fixed per-class blocks of the pyo3 bindings,
+# substituted once per class instead of being built line-by-line
+#
+# NOTE: $self_ref is "self" for structs and "&self.inner" for enum wrappers,
+# the closing brace of the impl block is not part of the template
+py_object_protocol_template = Template(
+    "\n"
+    "#[pyproto]\n"
+    "impl PyObjectProtocol for $class_ptr_name {\n"
+    "    fn __str__(&self) -> Result<String, PyErr> { \n"
+    "        let m: &$external = unsafe { mem::transmute($self_ref) }; Ok(format!(\"{:#?}\", m))\n"
+    "    }\n"
+    "    fn __repr__(&self) -> Result<String, PyErr> { \n"
+    "        let m: &$external = unsafe { mem::transmute($self_ref) }; Ok(format!(\"{:#?}\", m))\n"
+    "    }\n"
+)
+
+py_richcmp_template = Template(
+    "    fn __richcmp__(&self, other: $class_ptr_name, op: pyo3::class::basic::CompareOp) -> PyResult<bool> {\n"
+    "        use pyo3::class::basic::CompareOp::*;\n"
+    "        let (a, b) = (self.clone().inner as usize, other.clone().inner as usize);\n"
+    "        Ok(match op { Lt => a < b, Le => a <= b, Eq => a == b, Ne => a != b, Gt => a > b, Ge => a >= b })\n"
+    "    }\n"
+)
+
+py_err_from_template = Template(
+    "\n"
+    "impl core::convert::From<$err> for PyErr {\n"
+    "    fn from(err: $err) -> PyErr {\n"
+    "        let r: $external = unsafe { mem::transmute(err) };\n"
+    "        PyException::new_err(format!(\"{}\", r))\n"
+    "    }\n"
+    "}\n"
+)
+
+# GL / primitive type aliases, the same for every api.json version
+# This should be done properly, but right now it works
+py_type_aliases = (
+    "type GLuint = u32; type AzGLuint = GLuint;\n"
+    "type GLint = i32; type AzGLint = GLint;\n"
+    "type GLint64 = i64; type AzGLint64 = GLint64;\n"
+    "type GLuint64 = u64; type AzGLuint64 = GLuint64;\n"
+    "type GLenum = u32; type AzGLenum = GLenum;\n"
+    "type GLintptr = isize; type AzGLintptr = GLintptr;\n"
+    "type GLboolean = u8; type AzGLboolean = GLboolean;\n"
+    "type GLsizeiptr = isize; type AzGLsizeiptr = GLsizeiptr;\n"
+    "type GLvoid = c_void; type AzGLvoid = GLvoid;\n"
+    "type GLbitfield = u32; type AzGLbitfield = GLbitfield;\n"
+    "type GLsizei = i32; type AzGLsizei = GLsizei;\n"
+    "type GLclampf = f32; type AzGLclampf = GLclampf;\n"
+    "type GLfloat = f32; type AzGLfloat = GLfloat;\n"
+    "type AzF32 = f32;\n"
+    "type AzU16 = u16;\n"
+    "type AzU32 = u32;\n"
+    "type AzScanCode = u32;\n"
+)
+
+# Generates the azul-dll/python.rs file (pyo3 bindings), writing it to "out"
+def generate_python_api(out, api_data, structs_map, functions_map):
+
+    version = get_latest_version(api_data)
+
+    out.write("#![allow(non_snake_case)]\n")
+    out.write("\n")
+    out.write(read_file(root_folder + "/api/_patches/azul-dll/header.rs"))
+    out.write("\n")
+    out.write("use core::mem;\n")
+    out.write("use pyo3::prelude::*;\n")
+    out.write("use pyo3::PyObjectProtocol;\n")
+    out.write("use pyo3::types::*;\n")
+    out.write("use pyo3::exceptions::PyException;\n")
+
+    out.write(py_type_aliases)
+
+    out.write("\n")
+    out.write("\n")
+    out.write(read_file(root_folder + "/api/_patches/python/api.rs"))
+    out.write("\n")
 
     # Functions that have to be implemented manually
     manual_implementations = [
@@ -1425,26 +1570,27 @@ def generate_python_api(api_data, structs_map, functions_map):
         "TesselatedSvgNodeVecRef": ("Vec<AzTesselatedSvgNode>", "pylist_tesselated_svg_node"),
     }
 
+    class_kind = get_class_kinds(api_data[version])
+
     new_struct_map = dict(structs_map)
     raw_pointer_structs = {}
 
     # pyo3 does not know how to translate enums
     # so we just create a "EnumWrapper" struct that
     # contains the internal type in rust-representation
-    for struct_name in list(structs_map.keys()):
-        struct = structs_map[struct_name]
-        if "struct" in struct.keys():
+    for (struct_name, struct) in structs_map.items():
+        if "struct" in struct:
             new_struct_map[struct_name]["extra_derive"] = "#[pyclass(name = \"" + struct_name[len(prefix):] + "\")]"
             field_index = 0
             for field in struct["struct"]:
-                field_name = list(field.keys())[0]
-                field_type = list(field.values())[0]["type"]
+                (field_name, field_type), = field.items()
+                field_type = field_type["type"]
                 if len(analyze_type(field_type)[0]) > 0:
                     raw_pointer_structs[struct_name] = {}
                 elif (not(field_name == "cb")):
                     new_struct_map[struct_name]["struct"][field_index][field_name]["extra_derive"] = "    #[pyo3(get, set)]"
                 field_index = field_index + 1
-        elif "enum" in struct.keys():
+        elif "enum" in struct:
             new_struct_map[struct_name + "EnumWrapper"] = {}
             new_struct_map[struct_name + "EnumWrapper"]["struct"] = []
             new_struct_map[struct_name + "EnumWrapper"]["struct"].append({})
@@ -1455,449 +1601,431 @@ def generate_python_api(api_data, structs_map, functions_map):
             new_struct_map[struct_name + "EnumWrapper"]["extra_derive"] = "#[pyclass(name = \"" + struct_name[len(prefix):] + "\")]"
 
             for variant in struct["enum"]:
-                variant_name = list(field.keys())[0]
-                variant = list(variant.values())[0]
-                if "type" in variant.keys():
+                (variant_name, variant), = variant.items()
+                if "type" in variant:
                     variant_type = variant["type"]
                     if len(analyze_type(variant_type)[0]) > 0:
                         raw_pointer_structs[struct_name] = {}
-        elif "callback_typedef" in struct.keys():
+        elif "callback_typedef" in struct:
             pass
 
-    pyo3_code += generate_structs(
+    out.write(generate_structs(
         api_data[version],
         dict(new_struct_map),
         functions_map,
         indent=0,
         private_pointers=False,
         no_derive=True,
-        wrapper_postfix="EnumWrapper"
-    )
-
-    pyo3_code += "\r\n"
-    pyo3_code += "// Necessary because the Python interpreter may send structs across different threads"
-    pyo3_code += "\r\n"
-    for raw_pointer_struct in raw_pointer_structs.keys():
-        pyo3_code += "unsafe impl Send for " + raw_pointer_struct + " { }\r\n"
-
-    pyo3_code += "\r\n"
-
-    pyo3_code += "\r\n"
-    pyo3_code += "// Python objects must implement Clone at minimum"
-    pyo3_code += "\r\n"
-    for struct_name in list(structs_map.keys()):
-        struct = structs_map[struct_name]
+        wrapper_postfix="EnumWrapper",
+        newline="\n"
+    ))
+
+    out.write("\n")
+    out.write("// Necessary because the Python interpreter may send structs across different threads")
+    out.write("\n")
+    for raw_pointer_struct in raw_pointer_structs:
+        out.write("unsafe impl Send for " + raw_pointer_struct + " { }\n")
+
+    out.write("\n")
+
+    out.write("\n")
+    out.write("// Python objects must implement Clone at minimum")
+    out.write("\n")
+    for (struct_name, struct) in structs_map.items():
         clone_class = True
-        if "clone" in struct.keys():
+        if "clone" in struct:
             clone_class = struct["clone"]
         if not(clone_class):
             continue
 
-        if "struct" in struct.keys():
-            pyo3_code += "impl Clone for " + struct_name + " { fn clone(&self) -> Self { let r: &" + struct["external"]+ " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(r.clone()) } } }\r\n"
-        elif "enum" in struct.keys():
-            pyo3_code += "impl Clone for " + struct_name + "EnumWrapper { fn clone(&self) -> Self { let r: &" + struct["external"]+ " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(r.clone()) } } }\r\n"
-
-    pyo3_code += "\r\n"
-    pyo3_code += "// Implement Drop for all objects with drop constructors"
-    pyo3_code += "\r\n"
-    for struct_name in list(structs_map.keys()):
-        struct = structs_map[struct_name]
-        class_has_custom_destructor = "custom_destructor" in struct.keys() and struct["custom_destructor"]
-        is_boxed_object = "is_boxed_object" in struct.keys() and struct["is_boxed_object"]
+        if "struct" in struct:
+            out.write("impl Clone for " + struct_name + " { fn clone(&self) -> Self { let r: &" + struct["external"]+ " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(r.clone()) } } }\n")
+        elif "enum" in struct:
+            out.write("impl Clone for " + struct_name + "EnumWrapper { fn clone(&self) -> Self { let r: &" + struct["external"]+ " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(r.clone()) } } }\n")
+
+    out.write("\n")
+    out.write("// Implement Drop for all objects with drop constructors")
+    out.write("\n")
+    for (struct_name, struct) in structs_map.items():
+        class_has_custom_destructor = "custom_destructor" in struct and struct["custom_destructor"]
+        is_boxed_object = "is_boxed_object" in struct and struct["is_boxed_object"]
         should_impl_drop = class_has_custom_destructor or is_boxed_object
 
         if should_impl_drop:
-            if "struct" in struct.keys():
-                pyo3_code += "impl Drop for " + struct_name + " { fn drop(&mut self) { crate::" + struct_name + "_delete(unsafe { mem::transmute(self) }); } }\r\n"
-            elif "enum" in struct.keys():
-                pyo3_code += "impl Drop for " + struct_name + "EnumWrapper { fn drop(&mut self) { crate::" + struct_name + "_delete(unsafe { mem::transmute(self) }); } }\r\n"
+            if "struct" in struct:
+                out.write("impl Drop for " + struct_name + " { fn drop(&mut self) { crate::" + struct_name + "_delete(unsafe { mem::transmute(self) }); } }\n")
+            elif "enum" in struct:
+                out.write("impl Drop for " + struct_name + "EnumWrapper { fn drop(&mut self) { crate::" + struct_name + "_delete(unsafe { mem::transmute(self) }); } }\n")
 
-    pyo3_code += "\r\n"
+    out.write("\n")
 
     # List of types that are returned as errors, have to implement py03::Error
-    errlist = []
+    # (insertion-ordered set: every error type is only listed once)
+    errlist = OrderedDict()
+
+    # Returns the (name, function) pairs of a constructors / functions dict
+    # that have to be generated, skips the manually implemented functions and
+    # checks once that no argument is a pointer or a RefAny
+    def get_py_emittable_fns(module_name, class_name, fns, fn_kind):
+        emittable = []
+        for (fn_name, fn) in fns.items():
+            if (module_name, class_name, fn_name) in manual_implementations:
+                continue
+            if not("fn_args" in fn):
+                print("wrong format: " + fn_kind + class_name + "::" + fn_name)
+            for f in fn["fn_args"]:
+                arg_type = f[next(iter(f))]
+                if arg_type == "RefAny" or len(analyze_type(arg_type)[0]) != 0:
+                    # no function can take pointers in the Python API
+                    raise Exception("function " + class_name + " " + fn_name + " cannot take RefAny as argument in Python API")
+            emittable.append((fn_name, fn))
+        return emittable
+
+    # Generates the #[pymethods] and #[pyproto] impl blocks for a struct
+    def generate_py_struct_impl(module_name, class_name, struct, constants):
+        code = ""
+        class_ptr_name = prefix + class_name
+        has_constructors = "constructors" in struct
+        has_functions = "functions" in struct
+
+        code += "\n"
+        code += "#[pymethods]\n"
+        code += "impl " + class_ptr_name + " {\n" + constants
+        external = struct["external"]
+
+        if has_constructors:
+            for (constructor_name, constructor) in get_py_emittable_fns(module_name, class_name, struct["constructors"], "constructor "):
+                fn_args = constructor["fn_args"]
+                py_args = format_py_args(python_replacements, fn_args, class_kind, constructor=True)
+                return_type = None
+                return_type_match = ""
+                returns_option = None
+                returns_error = None
+                if "returns" in constructor:
+                    return_type_match = constructor["returns"]["type"]
+                    r = format_py_return(python_replacements, constructor["returns"], api_data[version], class_kind, errlist, constructor=True)
+                    return_type = r[0]
+                    returns_option = r[1]
+                    returns_error = r[2]
+                return_type_str = class_ptr_name
+                if not(return_type is None):
+                    return_type_str = return_type
+                if (constructor_name == "new" and not("returns" in constructor)):
+                    code += "    #[new]\n"
+                else:
+                    code += "    #[staticmethod]\n"
+                code += "    fn " + constructor_name + "(" + py_args + ") -> " + return_type_str + " {\n"
+                code += "        " + format_py_body(python_replacements, module_name, class_name, constructor_name, fn_args, api_data[version], return_type_match, returns_option, returns_error, constructor=True) + "\n"
+                code += "    }\n"
+
+        # Generate constructors
+        if (not("constructors" in struct) or len(struct["constructors"]) == 0) and not(class_name in not_default_constructable):
+            code += generate_py_default_constructor(class_name, struct, external, class_kind)
+
+        if has_functions:
+            for (function_name, function) in get_py_emittable_fns(module_name, class_name, struct["functions"], ""):
+                fn_args = function["fn_args"]
+                self_arg = "&self" # TODO
+                self_needs_clone = False
+                if fn_args[0]["self"] == "refmut":
+                    self_arg = "&mut self"
+                elif fn_args[0]["self"] == "value":
+                    self_arg = "self" # TODO: possible?
+
+                return_type = None # TODO
+                return_type_match = ""
+                returns_option = None
+                returns_error = None
+                if "returns" in function:
+                    return_type_match = function["returns"]["type"]
+                    r = format_py_return(python_replacements, function["returns"], api_data[version], class_kind, errlist, constructor=False)
+                    return_type = r[0]
+                    returns_option = r[1]
+                    returns_error = r[2]
+                return_type_str = "()"
+                if not(return_type is None):
+                    return_type_str = return_type
+                code += "    fn " + function_name + "(" + self_arg + format_py_args(python_replacements, fn_args, class_kind, constructor=False) + ") -> " + return_type_str + " {\n"
+                code += "        " + format_py_body(python_replacements, module_name, class_name, function_name, fn_args, api_data[version], return_type_match, returns_option, returns_error, constructor=False) + "\n"
+                code += "    }\n"
+
+
+        if tuple((module_name, class_name)) in inject_impls:
+            code += inject_impls[tuple((module_name, class_name))]
+        code += "}\n"
+
+        code += py_object_protocol_template.substitute(class_ptr_name=class_ptr_name, external=external, self_ref="self")
+        code += "}\n"
+
+        return code
+
+    # Generates the #[pymethods] and #[pyproto] impl blocks for the "EnumWrapper" of an enum
+    def generate_py_enum_impl(module_name, class_name, struct, constants):
+        code = ""
+        class_ptr_name = prefix + class_name
+        enum_wrapper_name = class_ptr_name + "EnumWrapper"
+        code += "\n"
+        code += "#[pymethods]\n"
+        code += "impl " + enum_wrapper_name + " {\n" + constants
+
+        enum_is_union = False
+        ctor_fragments = []
+        match_fragments = []
+
+        # generate a Enum::Blah(...) constructor function and the
+        # "match" arm for each variant in a single pass over the variants
+        for enum_name in struct["enum_fields"]:
+            (variant_name, variant), = enum_name.items()
+            enum_arg_type = ""
+            needs_transmute = False
+            emit_constructor = True
+            opt_variant_type_match = ""
+            opt_variant_value = "()"
+            if "type" in variant:
+                enum_is_union = True
+                opt_variant_type_match = "(v)"
+                (variant_ptr, variant_type, _) = analyze_type(variant["type"])
+
+                # classify the base type of the variant once, both the
+                # constructor and the "match" arm are generated from it
+                if is_primitive_arg(variant_type):
+                    variant_kind = "primitive"
+                else:
+                    variant_kind = class_kind[variant_type]
+
+                if len(variant_ptr) > 0:
+                    emit_constructor = False # no constructor can take pointers, references or arrays in the Python API
+                elif variant_kind == "primitive":
+                    enum_arg_type = "v: " + variant_type
+                elif variant_kind == "enum":
+                    enum_arg_type = "v: " + prefix + variant_type + "EnumWrapper"
+                    needs_transmute = True
+                elif variant_kind == "struct":
+                    enum_arg_type = "v: " + prefix + variant_type
+                else:
+                    emit_constructor = False # cannot construct callbacks as function arguments
+
+                if (variant["type"] == "*const c_void") or (variant["type"] == "*mut c_void"):
+                    opt_variant_value = "()"
+                elif variant_kind == "primitive":
+                    opt_variant_value = "v"
+                elif variant_kind == "enum":
+                    opt_variant_value = "{ let m: &" + prefix + variant_type + "EnumWrapper = unsafe { mem::transmute(v) }; m.clone() }"
+                elif variant_kind == "callback":
+                    opt_variant_value = "()" # can't destructure function pointer
+                elif variant["type"] == "[PixelValue;2]":
+                    opt_variant_value = "v.to_vec()"
+                else:
+                    opt_variant_value = "v.clone()"
+
+            if emit_constructor:
+                ctor = ""
+                if not(len(enum_arg_type) == 0):
+                    ctor += "    #[staticmethod]\n    fn " + variant_name + "(" + enum_arg_type + ") -> "
+                else:
+                    ctor += "    #[classattr]\n    fn " + variant_name + "(" + enum_arg_type + ") -> "
+                ctor += enum_wrapper_name + " { "
+                ctor += enum_wrapper_name + " { inner: " + class_ptr_name + "::" + variant_name
+                if not(len(enum_arg_type) == 0):
+                    if needs_transmute:
+                        ctor += "(unsafe { mem::transmute(v) })"
+                    else:
+                        ctor += "(v)"
+                ctor += " } }\n"
+                ctor_fragments.append(ctor)
+
+            match_fragments.append("            " + class_ptr_name + "::" + variant_name + opt_variant_type_match + " => Ok(vec![\"" + variant_name + "\".into_py(py), " + opt_variant_value + ".into_py(py)]),\n")
+
+        code += "".join(ctor_fragments)
+
+        if tuple((module_name, class_name)) in inject_impls:
+            code += inject_impls[tuple((module_name, class_name))]
+
+        # Generate a "match" function that returns the enum tag as a string + the object as a tuple
+        if enum_is_union:
+            code += "\n"
+            code += "    fn r#match(&self) -> PyResult<Vec<PyObject>> {\n"
+            code += "        use crate::python::" + class_ptr_name + ";\n"
+            code += "        use pyo3::conversion::IntoPy;\n"
+            code += "        let gil = Python::acquire_gil();\n"
+            code += "        let py = gil.python();\n"
+            code += "        match &self.inner {\n"
+            code += "".join(match_fragments)
+            code += "        }\n"
+            code += "    }\n"
+
+        code += "}\n"
+
+        external = struct["external"]
+        code += py_object_protocol_template.substitute(class_ptr_name=enum_wrapper_name, external=external, self_ref="&self.inner")
+
+        # simple C-like enum: implement comparison operators
+        if not(enum_is_union):
+            code += py_richcmp_template.substitute(class_ptr_name=enum_wrapper_name)
+
+        code += "}\n"
+
+        return code
+
+    # callbacks and typedefs are not exposed as Python classes
+    def generate_py_no_impl(module_name, class_name, struct, constants):
+        return ""
+
+    generate_py_class_impl = {
+        "struct": generate_py_struct_impl,
+        "enum": generate_py_enum_impl,
+        "callback": generate_py_no_impl,
+        "typedef": generate_py_no_impl,
+    }
 
-    for module_name in api_data[version].keys():
+    # m.add_class::<...>() lines for the #[pymodule], collected in the same pass
+    registrations = []
+
+    for module_name in api_data[version]:
         module = api_data[version][module_name]
-        for class_name in module["classes"].keys():
+        for class_name in module["classes"]:
             struct = module["classes"][class_name]
+            struct_kind = class_kind[class_name]
+            has_constants = "constants" in struct
 
             constants = ""
-            if "constants" in struct.keys():
+            if has_constants:
                 for constant in struct["constants"]:
-                    constant_name = list(constant.keys())[0]
+                    constant_name = next(iter(constant))
                     constant_type = constant[constant_name]["type"]
                     constant_value = constant[constant_name]["value"]
-                    constants += "    #[classattr]\r\n    const " + constant_name + ": " + constant_type + " = " + constant_value + ";\r\n"
-                constants += "\r\n"
-
-            if "struct_fields" in struct.keys():
-
-                pyo3_code += "\r\n"
-                pyo3_code += "#[pymethods]\r\n"
-                pyo3_code += "impl " + prefix + class_name + " {\r\n" + constants
-                external = struct["external"]
-
-                if "constructors" in struct.keys():
-                    for constructor_name in struct["constructors"]:
-                        if (module_name, class_name, constructor_name) in manual_implementations:
-                            continue
-                        constructor = struct["constructors"][constructor_name]
-                        if not("fn_args" in constructor.keys()):
-                            print("wrong format: constructor " + class_name + "::" + constructor_name)
-                        fn_args = constructor["fn_args"]
-                        break_outer_flag = False
-                        for f in fn_args:
-                            arg_name = list(f.keys())[0]
-                            arg_type = f[arg_name]
-                            analyzed = analyze_type(arg_type)
-                            if len(analyzed[0]) != 0 or arg_type == "RefAny":
-                                break_outer_flag = True
-                                raise Exception("function " + class_name + " " + constructor_name + " cannot take RefAny as argument in Python API")
-                                continue # no constructor can take pointers in the Python API
-                        if break_outer_flag:
-                            continue # break outer loop
-                        py_args = format_py_args(python_replacements, fn_args, api_data[version], constructor=True)
-                        return_type = None
-                        return_type_match = ""
-                        returns_option = None
-                        returns_error = None
-                        if "returns" in constructor.keys():
-                            return_type_match = constructor["returns"]["type"]
-                            r = format_py_return(python_replacements, constructor["returns"], api_data[version], errlist, constructor=True)
-                            return_type = r[0]
-                            returns_option = r[1]
-                            returns_error = r[2]
-                        return_type_str = prefix + class_name
-                        if not(return_type is None):
-                            return_type_str = return_type
-                        if (constructor_name == "new" and not("returns" in constructor.keys())):
-                            pyo3_code += "    #[new]\r\n"
-                        else:
-                            pyo3_code += "    #[staticmethod]\r\n"
-                        pyo3_code += "    fn " + constructor_name + "(" + py_args + ") -> " + return_type_str + " {\r\n"
-                        pyo3_code += "        " + format_py_body(python_replacements, module_name, class_name, constructor_name, fn_args, api_data[version], return_type_match, returns_option, returns_error, constructor=True) + "\r\n"
-                        pyo3_code += "    }\r\n"
-
-                # Generate constructors
-                class_is_vec = class_name.endswith("Vec")
-                while True:
-                    if (not("constructors") in struct.keys() or len(struct["constructors"]) == 0) and not(class_name in not_default_constructable.keys()):
-                        py_new_constructor = ""
-                        py_func_args = ""
-
-                        # do not generate a __new__() constructor for struct
-                        # that have only "ptr + len" fields
-                        # this is a special rule for AzTessellatedSvgNodeVecRef
-                        maybe_is_ref_struct = len(struct["struct_fields"]) == 2
-                        is_ref_struct = False
-
-                        for field in struct["struct_fields"]:
-                            field_name = list(field.keys())[0]
-                            if field_name == "ptr":
-                                if maybe_is_ref_struct:
-                                    is_ref_struct = True
-                                break # don't generate code
-                            field_type = field[field_name]["type"]
-                            analyzed_type = analyze_type(field_type)
-                            if len(analyzed_type[0]) != 0:
-                                break # don't generate code for structs with raw pointers
-                            if is_primitive_arg(analyzed_type[1]):
-                                py_func_args += field_name + ": " + field_type + ", "
-                                py_new_constructor += "            " + field_name + ",\r\n"
-                            else:
-                                f_class = quick_get_class(api_data[version], analyzed_type[1])
-                                if "enum_fields" in f_class.keys():
-                                    py_func_args += field_name + ": " + prefix + field_type + "EnumWrapper, "
-                                    py_new_constructor += "            " + field_name + ",\r\n"
-                                elif "struct_fields" in f_class.keys():
-                                    py_func_args += field_name + ": " + prefix + field_type + ", "
-                                    py_new_constructor += "            " + field_name + ",\r\n"
-                                else:
-                                    break
-
-                        if is_ref_struct: # only necessary for AzTessellatedSvgNodeVecRef
-                            break
-
-                        if not(len(py_func_args) == 0):
-                            py_func_args = py_func_args[:-2] # strip final ", "
-
-                        if class_is_vec:
-                            vec_type = class_name[:-3]
-                            vec_ty_excluded = ["ScanCode", "U16", "U32", "I32", "F32", "GLuint", "GLint"]
-                            if not(vec_type in vec_ty_excluded):
-                                vec_class = quick_get_class(api_data[version], vec_type)
-                                if "enum_fields" in vec_class.keys():
-                                    vec_type = vec_type + "EnumWrapper"
-                            pyo3_code += "    /// Creates a new `" + vec_type + "Vec` from a Python array\r\n"
-                            pyo3_code += "    #[new]\r\n"
-                            pyo3_code += "    fn __new__(input: Vec<" + prefix + vec_type + ">) -> Self {\r\n"
-                            pyo3_code += "        let m: " + external + " = " + external + "::from_vec(unsafe { mem::transmute(input) }); unsafe { mem::transmute(m) }\r\n"
-
-                            pyo3_code += "    }\r\n"
-                            pyo3_code += "    \r\n"
-                            pyo3_code += "    /// Returns the " + vec_type + " as a Python array\r\n"
-                            pyo3_code += "    fn array(&self) -> Vec<" + prefix + vec_type + "> {\r\n"
-                            pyo3_code += "        let m: &" + external + " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(m.clone().into_library_owned_vec()) }\r\n"
-                            pyo3_code += "    }\r\n"
-                        else:
-                            pyo3_code += "    #[new]\r\n"
-                            pyo3_code += "    fn __new__(" + py_func_args + ") -> Self {\r\n"
-                            pyo3_code += "        Self {\r\n"
-                            pyo3_code += py_new_constructor
-                            pyo3_code += "        }\r\n"
-                            pyo3_code += "    }\r\n"
-                        pyo3_code += "\r\n"
-
-                    break
-
-                if "functions" in struct.keys():
-                    for function_name in struct["functions"]:
-                        function = struct["functions"][function_name]
-                        if (module_name, class_name, function_name) in manual_implementations:
-                            continue
-                        if not("fn_args" in function.keys()):
-                            print("wrong format: " + class_name + "::" + function_name)
-                        fn_args = function["fn_args"]
-                        break_outer_flag = False
-                        for f in fn_args:
-                            arg_name = list(f.keys())[0]
-                            arg_type = f[arg_name]
-                            analyzed = analyze_type(arg_type)
-                            if len(analyzed[0]) != 0 or arg_type == "RefAny":
-                                raise Exception("function " + class_name + " " + function_name + " cannot take RefAny as argument in Python API")
-                                break_outer_flag = True
-                                continue # no constructor can take pointers in the Python API
-                        if break_outer_flag:
-                            continue # break outer loop
-                        self_arg = "&self" # TODO
-                        self_needs_clone = False
-                        if fn_args[0]["self"] == "refmut":
-                            self_arg = "&mut self"
-                        elif fn_args[0]["self"] == "value":
-                            self_arg = "self" # TODO: possible?
-
-                        return_type = None # TODO
-                        return_type_match = ""
-                        returns_option = None
-                        returns_error = None
-                        if "returns" in function.keys():
-                            return_type_match = function["returns"]["type"]
-                            r = format_py_return(python_replacements, function["returns"], api_data[version], errlist, constructor=False)
-                            return_type = r[0]
-                            returns_option = r[1]
-                            returns_error = r[2]
-                        return_type_str = "()"
-                        if not(return_type is None):
-                            return_type_str = return_type
-                        pyo3_code += "    fn " + function_name + "(" + self_arg + format_py_args(python_replacements, fn_args, api_data[version], constructor=False) + ") -> " + return_type_str + " {\r\n"
-                        pyo3_code += "        " + format_py_body(python_replacements, module_name, class_name, function_name, fn_args, api_data[version], return_type_match, returns_option, returns_error, constructor=False) + "\r\n"
-                        pyo3_code += "    }\r\n"
-
-
-                if tuple((module_name, class_name)) in inject_impls:
-                    pyo3_code += inject_impls[tuple((module_name, class_name))]
-                pyo3_code += "}\r\n"
-
-                pyo3_code += "\r\n"
-                pyo3_code += "#[pyproto]\r\n"
-                pyo3_code += "impl PyObjectProtocol for " + prefix + class_name + " {\r\n"
-                pyo3_code += "    fn __str__(&self) -> Result<String, PyErr> { \r\n"
-                pyo3_code += "        let m: &" + external + " = unsafe { mem::transmute(self) }; Ok(format!(\"{:#?}\", m))\r\n"
-                pyo3_code += "    }\r\n"
-                pyo3_code += "    fn __repr__(&self) -> Result<String, PyErr> { \r\n"
-                pyo3_code += "        let m: &" + external + " = unsafe { mem::transmute(self) }; Ok(format!(\"{:#?}\", m))\r\n"
-                pyo3_code += "    }\r\n"
-                pyo3_code += "}\r\n"
-
-            elif "enum_fields" in struct.keys():
-                pyo3_code += "\r\n"
-                pyo3_code += "#[pymethods]\r\n"
-                pyo3_code += "impl " + prefix + class_name + "EnumWrapper {\r\n" + constants
-
-                enum_is_union = False
-
-                # generate a Enum::Blah(...) constructor function
-                for enum_name in struct["enum_fields"]:
-                    enum_arg_type = ""
-                    enum_type = ""
-                    needs_transmute = False
-                    variant_name = list(enum_name.keys())[0]
-                    variant = enum_name[variant_name]
-                    if "type" in variant.keys():
-                        enum_is_union = True
-                        analyzed_type = analyze_type(variant["type"])
-                        if (len(analyzed_type[0]) > 0):
-                            continue
-                        enum_arg_type = "v: " + analyzed_type[1]
-                        if not(is_primitive_arg(analyzed_type[1])):
-                            e_class = quick_get_class(api_data[version], analyzed_type[1])
-                            if "enum_fields" in e_class.keys():
-                                enum_arg_type = "v: " + prefix + analyzed_type[1] + "EnumWrapper"
-                                needs_transmute = True
-                            elif "struct_fields" in e_class.keys():
-                                enum_arg_type = "v: " + prefix + analyzed_type[1]
-                            else:
-                                continue # cannot construct callbacks as function arguments
-                        else:
-                             enum_arg_type = "v: " + analyzed_type[1]
-                        enum_type = enum_arg_type
-                    if not(len(enum_type) == 0):
-                        pyo3_code += "    #[staticmethod]\r\n    fn " + variant_name + "(" + enum_arg_type + ") -> "
-                    else:
-                        pyo3_code += "    #[classattr]\r\n    fn " + variant_name + "(" + enum_arg_type + ") -> "
-                    pyo3_code += prefix + class_name + "EnumWrapper { "
-                    pyo3_code += prefix + class_name + "EnumWrapper { inner: " + prefix + class_name + "::" + variant_name
-                    if not(len(enum_type) == 0):
-                        if needs_transmute:
-                            pyo3_code += "(unsafe { mem::transmute(v) })"
-                        else:
-                            pyo3_code += "(v)"
-                    pyo3_code += " } }\r\n"
-
-                if tuple((module_name, class_name)) in inject_impls:
-                    pyo3_code += inject_impls[tuple((module_name, class_name))]
-
-                # Generate a "match" function that returns the enum tag as a string + the object as a tuple
-                if enum_is_union:
-                    pyo3_code += "\r\n"
-                    pyo3_code += "    fn r#match(&self) -> PyResult<Vec<PyObject>> {\r\n"
-                    pyo3_code += "        use crate::python::" + prefix + class_name + ";\r\n"
-                    pyo3_code += "        use pyo3::conversion::IntoPy;\r\n"
-                    pyo3_code += "        let gil = Python::acquire_gil();\r\n"
-                    pyo3_code += "        let py = gil.python();\r\n"
-                    pyo3_code += "        match &self.inner {\r\n"
-                    for enum_name in struct["enum_fields"]:
-                        variant_name = list(enum_name.keys())[0]
-                        variant = enum_name[variant_name]
-                        opt_variant_type_match = ""
-                        if "type" in variant.keys():
-                            opt_variant_type_match = "(v)"
-                        opt_variant_value = "()"
-                        if "type" in variant.keys():
-                            if (variant["type"] == "*const c_void") or (variant["type"] == "*mut c_void"):
-                                opt_variant_value = "()"
-                            else:
-                                analyzed_type = analyze_type(variant["type"])
-                                if not(is_primitive_arg(analyzed_type[1])):
-                                    e_class = quick_get_class(api_data[version], analyzed_type[1])
-                                    if "enum_fields" in e_class.keys():
-                                        opt_variant_value = "{ let m: &" + prefix + analyzed_type[1] + "EnumWrapper = unsafe { mem::transmute(v) }; m.clone() }"
-                                    elif class_is_typedef(e_class):
-                                        opt_variant_value = "()" # can't destructure function pointer
-                                    elif variant["type"] == "[PixelValue;2]":
-                                        opt_variant_value = "v.to_vec()"
-                                    else:
-                                        opt_variant_value = "v.clone()"
-                                else:
-                                        opt_variant_value = "v"
-
-                        pyo3_code += "            " + prefix + class_name + "::" + variant_name + opt_variant_type_match + " => Ok(vec![\"" + variant_name + "\".into_py(py), " + opt_variant_value + ".into_py(py)]),\r\n"
-                    pyo3_code += "        }\r\n"
-                    pyo3_code += "    }\r\n"
-
-                pyo3_code += "}\r\n"
-
-                external = struct["external"]
-                pyo3_code += "\r\n"
-                pyo3_code += "#[pyproto]\r\n"
-                pyo3_code += "impl PyObjectProtocol for " + prefix + class_name + "EnumWrapper {\r\n"
-                pyo3_code += "    fn __str__(&self) -> Result<String, PyErr> { \r\n"
-                pyo3_code += "        let m: &" + external + " = unsafe { mem::transmute(&self.inner) }; Ok(format!(\"{:#?}\", m))\r\n"
-                pyo3_code += "    }\r\n"
-                pyo3_code += "    fn __repr__(&self) -> Result<String, PyErr> { \r\n"
-                pyo3_code += "        let m: &" + external + " = unsafe { mem::transmute(&self.inner) }; Ok(format!(\"{:#?}\", m))\r\n"
-                pyo3_code += "    }\r\n"
-
-                # simple C-like enum: implement comparison operators
-                if not(enum_is_union):
-                    pyo3_code += "    fn __richcmp__(&self, other: " + prefix + class_name + "EnumWrapper, op: pyo3::class::basic::CompareOp) -> PyResult<bool> {\r\n"
-                    pyo3_code += "        match op {\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Lt => { Ok((self.clone().inner as usize) <  (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Le => { Ok((self.clone().inner as usize) <= (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Eq => { Ok((self.clone().inner as usize) == (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Ne => { Ok((self.clone().inner as usize) != (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Gt => { Ok((self.clone().inner as usize) >  (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "            pyo3::class::basic::CompareOp::Ge => { Ok((self.clone().inner as usize) >= (other.clone().inner as usize)) }\r\n"
-                    pyo3_code += "        }\r\n"
-                    pyo3_code += "    }\r\n"
-
-                pyo3_code += "}\r\n"
-
-    errlist_dict = {}
-    for err in errlist:
-        errlist_dict[err] = {}
+                    constants += "    #[classattr]\n    const " + constant_name + ": " + constant_type + " = " + constant_value + ";\n"
+                constants += "\n"
 
-    pyo3_code += "\r\n"
-    for err in errlist_dict.keys():
+            out.write(generate_py_class_impl[struct_kind](module_name, class_name, struct, constants))
+
+            if struct_kind == "struct":
+                registrations.append("    m.add_class::<" + prefix + class_name + ">()?;\n")
+            elif struct_kind == "enum":
+                registrations.append("    m.add_class::<" + prefix + class_name + "EnumWrapper>()?;\n")
+
+        registrations.append("\n")
+
+    out.write("\n")
+    for err in errlist:
         external = structs_map[err]["external"]
-        pyo3_code += "\r\n"
-        pyo3_code += "impl core::convert::From<" + err + "> for PyErr {\r\n"
-        pyo3_code += "    fn from(err: " + err + ") -> PyErr {\r\n"
-        pyo3_code += "        let r: " + external + " = unsafe { mem::transmute(err) };\r\n"
-        pyo3_code += "        PyException::new_err(format!(\"{}\", r))\r\n"
-        pyo3_code += "    }\r\n"
-        pyo3_code += "}\r\n"
-
-    pyo3_code += "\r\n"
-    pyo3_code += "#[pymodule]\r\n"
-    pyo3_code += "fn azul(py: Python, m: &PyModule) -> PyResult<()> {\r\n"
-    pyo3_code += "\r\n"
-    pyo3_code += "    #[cfg(all(feature = \"use_pyo3_logger\", not(feature = \"use_fern_logger\")))] {\r\n"
+        out.write(py_err_from_template.substitute(err=err, external=external))
+
+    out.write("\n")
+    out.write("#[pymodule]\n")
+    out.write("fn azul(py: Python, m: &PyModule) -> PyResult<()> {\n")
+    out.write("\n")
+    out.write("    #[cfg(all(feature = \"use_pyo3_logger\", not(feature = \"use_fern_logger\")))] {\n")
 
     # Since we can't get access to the AppConfig
     # here, use environment variables for configuration
 
-    pyo3_code += "        let mut filter = log::LevelFilter ::Warn;\r\n"
-    pyo3_code += "\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_ERROR\").is_ok() { filter = log::LevelFilter ::Error; }\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_WARN\").is_ok() { filter = log::LevelFilter ::Warn; }\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_INFO\").is_ok() { filter = log::LevelFilter ::Info; }\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_DEBUG\").is_ok() { filter = log::LevelFilter ::Debug; }\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_TRACE\").is_ok() { filter = log::LevelFilter ::Trace; }\r\n"
-    pyo3_code += "        if std::env::var(\"AZUL_PY_LOGLEVEL_OFF\").is_ok() { filter = log::LevelFilter ::Off; }\r\n"
-    pyo3_code += "\r\n"
-
-    # pyo3_code += "        match pyo3_log::Logger::new(py.clone(), pyo3_log::Caching::LoggersAndLevels) {\r\n"
-    # pyo3_code += "            Ok(o) => {\r\n"
-    # pyo3_code += "                match o.filter(filter).install() {\r\n"
-    # pyo3_code += "                    Ok(_) => { }, \r\n"
-    # pyo3_code += "                    Err(e) => { println!(\"Could not initialize Python logger, (continuing execution): {}\", e); }, \r\n"
-    # pyo3_code += "                }\r\n"
-    # pyo3_code += "            },\r\n"
-    # pyo3_code += "            Err(e) => { println!(\"Could not create Python logger (continuing execution)\"); },\r\n"
-    # pyo3_code += "        }\r\n"
-
-    # pyo3_code += "        pyo3_log::init();\r\n"
-    pyo3_code += "    }\r\n"
-    pyo3_code += "\r\n"
-
-    for module_name in api_data[version].keys():
-        module = api_data[version][module_name]
-        for class_name in module["classes"].keys():
-            struct = module["classes"][class_name]
-            if "struct_fields" in struct.keys():
-                pyo3_code += "    m.add_class::<" + prefix + class_name + ">()?;\r\n"
-            elif "enum_fields" in struct.keys():
-                pyo3_code += "    m.add_class::<" + prefix + class_name + "EnumWrapper>()?;\r\n"
-                pass
-            elif "callback_typedef" in struct.keys():
-                pass
-        pyo3_code += "\r\n"
-    pyo3_code += "    Ok(())\r\n"
-    pyo3_code += "}\r\n"
-    pyo3_code += "\r\n"
-    return pyo3_code
+    out.write("        let mut filter = log::LevelFilter ::Warn;\n")
+    out.write("\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_ERROR\").is_ok() { filter = log::LevelFilter ::Error; }\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_WARN\").is_ok() { filter = log::LevelFilter ::Warn; }\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_INFO\").is_ok() { filter = log::LevelFilter ::Info; }\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_DEBUG\").is_ok() { filter = log::LevelFilter ::Debug; }\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_TRACE\").is_ok() { filter = log::LevelFilter ::Trace; }\n")
+    out.write("        if std::env::var(\"AZUL_PY_LOGLEVEL_OFF\").is_ok() { filter = log::LevelFilter ::Off; }\n")
+    out.write("\n")
+
+    # out.write("        match pyo3_log::Logger::new(py.clone(), pyo3_log::Caching::LoggersAndLevels) {\n")
+    # out.write("            Ok(o) => {\n")
+    # out.write("                match o.filter(filter).install() {\n")
+    # out.write("                    Ok(_) => { }, \n")
+    # out.write("                    Err(e) => { println!(\"Could not initialize Python logger, (continuing execution): {}\", e); }, \n")
+    # out.write("                }\n")
+    # out.write("            },\n")
+    # out.write("            Err(e) => { println!(\"Could not create Python logger (continuing execution)\"); },\n")
+    # out.write("        }\n")
+
+    # out.write("        pyo3_log::init();\n")
+    out.write("    }\n")
+    out.write("\n")
+
+    out.writelines(registrations)
+    out.write("    Ok(())\n")
+    out.write("}\n")
+    out.write("\n")
+
+# Generates the default __new__() constructor for a Python struct without constructors,
+# returns an empty string if no constructor can be generated for the struct
+def generate_py_default_constructor(class_name, struct, external, class_kind):
+    code = ""
+    class_is_vec = class_name.endswith("Vec")
+    py_new_constructor = ""
+    py_func_args = []
+
+    # do not generate a __new__() constructor for struct
+    # that have only "ptr + len" fields
+    # this is a special rule for AzTessellatedSvgNodeVecRef
+    maybe_is_ref_struct = len(struct["struct_fields"]) == 2
+    is_ref_struct = False
+
+    for field in struct["struct_fields"]:
+        field_name = next(iter(field))
+        if field_name == "ptr":
+            if maybe_is_ref_struct:
+                is_ref_struct = True
+            break # don't generate code
+        field_type = field[field_name]["type"]
+        analyzed_type = analyze_type(field_type)
+        if len(analyzed_type[0]) != 0:
+            break # don't generate code for structs with raw pointers
+        if is_primitive_arg(analyzed_type[1]):
+            py_func_args.append(field_name + ": " + field_type)
+            py_new_constructor += "            " + field_name + ",\n"
+        else:
+            f_class_kind = class_kind[analyzed_type[1]]
+            if f_class_kind == "enum":
+                py_func_args.append(field_name + ": " + prefix + field_type + "EnumWrapper")
+                py_new_constructor += "            " + field_name + ",\n"
+            elif f_class_kind == "struct":
+                py_func_args.append(field_name + ": " + prefix + field_type)
+                py_new_constructor += "            " + field_name + ",\n"
+            else:
+                break
+
+    if is_ref_struct: # only necessary for AzTessellatedSvgNodeVecRef
+        return ""
+
+    if class_is_vec:
+        vec_type = class_name[:-3]
+        vec_ty_excluded = ["ScanCode", "U16", "U32", "I32", "F32", "GLuint", "GLint"]
+        if not(vec_type in vec_ty_excluded):
+            if class_kind[vec_type] == "enum":
+                vec_type = vec_type + "EnumWrapper"
+        code += "    /// Creates a new `" + vec_type + "Vec` from a Python array\n"
+        code += "    #[new]\n"
+        code += "    fn __new__(input: Vec<" + prefix + vec_type + ">) -> Self {\n"
+        code += "        let m: " + external + " = " + external + "::from_vec(unsafe { mem::transmute(input) }); unsafe { mem::transmute(m) }\n"
+
+        code += "    }\n"
+        code += "    \n"
+        code += "    /// Returns the " + vec_type + " as a Python array\n"
+        code += "    fn array(&self) -> Vec<" + prefix + vec_type + "> {\n"
+        code += "        let m: &" + external + " = unsafe { mem::transmute(self) }; unsafe { mem::transmute(m.clone().into_library_owned_vec()) }\n"
+        code += "    }\n"
+    else:
+        code += "    #[new]\n"
+        code += "    fn __new__(" + ", ".join(py_func_args) + ") -> Self {\n"
+        code += "        Self {\n"
+        code += py_new_constructor
+        code += "        }\n"
+        code += "    }\n"
+    code += "\n"
+
+    return code
 
 # Formats the input function arguments for the python DLL
-def format_py_args(python_replacements, fn_args, api_data, constructor=False):
+def format_py_args(python_replacements, fn_args, class_kind, constructor=False):
 
-    fn_args_string = ""
+    fn_args_list = []
 
     # if the argument is a AzString, use a String instead
     for f in fn_args:
-        f_name = list(f.keys())[0]
+        f_name = next(iter(f))
         if f_name == "self":
             continue
         f_type = f[f_name]
@@ -1915,13 +2043,14 @@ def format_py_args(python_replacements, fn_args, api_data, constructor=False):
         if is_primitive_arg(f_type):
             f_real_type = ref + f_type
         else:
-            f_class = quick_get_class(api_data, analyzed_fn_type[1])
-            if "enum_fields" in f_class.keys():
+            f_class_kind = class_kind[analyzed_fn_type[1]]
+            if f_class_kind == "enum":
                 f_real_type = ref + prefix + f_type + "EnumWrapper"
-            elif "struct_fields" in f_class.keys():
+            elif f_class_kind == "struct":
                 f_real_type = ref + prefix + f_type
-                if f_type in python_replacements.keys():
-                    py_replace = python_replacements[f_type][0]
+                pr = python_replacements.get(f_type)
+                if not(pr is None):
+                    py_replace = pr[0]
                     if py_replace.startswith("mut "):
                         f_real_mut = "mut "
                         f_real_type = ref + py_replace[4:]
@@ -1930,48 +2059,42 @@ def format_py_args(python_replacements, fn_args, api_data, constructor=False):
             else:
                 raise Exception("cannot use type " + f_name + ": " + f_type + " as a Python function argument")
 
-        fn_args_string += f_real_mut + f_name + ": " + f_real_type + ", "
+        fn_args_list.append(f_real_mut + f_name + ": " + f_real_type)
 
-    if not(len(fn_args_string) == 0):
-        fn_args_string = fn_args_string[:-2]
+    fn_args_string = ", ".join(fn_args_list)
 
-    if (not(constructor) and not(len(fn_args_string) == 0)):
+    if (not(constructor) and not(len(fn_args_list) == 0)):
         fn_args_string = ", " + fn_args_string
 
     return fn_args_string
 
 # Formats the return type for the python DLL
 # returns the (return type, class_is_option, class_throws)
-def format_py_return(python_replacements, return_type, api_data, errlist, constructor=False):
+def format_py_return(python_replacements, return_type, api_data, class_kind, errlist, constructor=False):
     if return_type["type"].startswith("Result"):
         found_c = quick_get_class(api_data, return_type["type"])
         ret_type_ok = found_c["enum_fields"][0]["Ok"]["type"]
-        return_type_ok = ret_type_ok
-        if not(ret_type_ok in python_replacements.keys()):
+        pr = python_replacements.get(ret_type_ok)
+        if pr is None:
             return_type_ok = prefix + ret_type_ok
         else:
-            return_type_ok = python_replacements[ret_type_ok][0]
+            return_type_ok = pr[0]
         ret_type_err = found_c["enum_fields"][1]["Err"]["type"]
-        return_type_err = ret_type_err
-        if not(ret_type_err in python_replacements.keys()):
-            return_type_err = prefix + ret_type_err
-            errlist.append(return_type_err)
-        else:
-            return_type_err = python_replacements[ret_type_err][0]
+        if not(ret_type_err in python_replacements):
+            errlist[prefix + ret_type_err] = None
         return ("Result<" + return_type_ok + ", PyErr>", None, return_type["type"])
     elif return_type["type"].startswith("Option"):
         found_c = quick_get_class(api_data, return_type["type"])
         ret_type = found_c["enum_fields"][1]["Some"]["type"]
-        return_type_opt = ret_type
-        if not(ret_type in python_replacements.keys()):
+        pr = python_replacements.get(ret_type)
+        if pr is None:
             return_type_opt = prefix + ret_type
-            ret_type_c = quick_get_class(api_data, ret_type)
-            if "enum_fields" in ret_type_c.keys():
+            if class_kind[ret_type] == "enum":
                 return_type_opt = return_type_opt + "EnumWrapper"
         else:
-            return_type_opt = python_replacements[ret_type][0]
+            return_type_opt = pr[0]
         return ("Option<" + return_type_opt + ">", return_type["type"], None)
-    elif return_type["type"] in python_replacements.keys():
+    elif return_type["type"] in python_replacements:
         return (python_replacements[return_type["type"]][0], None, None)
     else:
         # TODO: PyBuffer / Vec conversion
@@ -1979,47 +2102,46 @@ def format_py_return(python_replacements, return_type, api_data, errlist, constr
             return (return_type["type"], None, None)
         else:
             return_type_str = prefix + return_type["type"]
-            ret_type_c = quick_get_class(api_data, return_type["type"])
-            if "enum_fields" in ret_type_c.keys():
+            if class_kind[return_type["type"]] == "enum":
                 return_type_str = return_type_str + "EnumWrapper"
             return (return_type_str, None, None)
 
 def format_py_body(python_replacements, module_name, class_name, function_name, fn_args, api_data, return_type_str, returns_option=None, returns_error=None, constructor=False):
 
     # convert input "String" into azul-internal AzStrings
-    string_conversions = ""
+    string_conversions = []
     for f in fn_args:
-        f_name = list(f.keys())[0]
+        f_name = next(iter(f))
         f_type = f[f_name]
-        if f_type in python_replacements.keys():
-            python_replace = python_replacements[f_type][1]
-            if len(python_replacements[f_type]) == 4:
-                string_conversions += "let " + f_name + " = " + python_replacements[f_type][3] + "(&" + f_name + ");\r\n        "
-            if python_replacements[f_type][0].startswith("mut "):
-                string_conversions += "let " + f_name + " = " + python_replace + "(&mut " + f_name + ");\r\n        "
+        pr = python_replacements.get(f_type)
+        if not(pr is None):
+            python_replace = pr[1]
+            if len(pr) == 4:
+                string_conversions.append("let " + f_name + " = " + pr[3] + "(&" + f_name + ");\n        ")
+            if pr[0].startswith("mut "):
+                string_conversions.append("let " + f_name + " = " + python_replace + "(&mut " + f_name + ");\n        ")
             else:
-                string_conversions += "let " + f_name + " = " + python_replace + "(&" + f_name + ");\r\n        "
+                string_conversions.append("let " + f_name + " = " + python_replace + "(&" + f_name + ");\n        ")
 
-    fn_args_invoke = ""
-    for f in fn_args:
-        fn_args_invoke += "            mem::transmute(" + list(f.keys())[0] + "),\r\n"
+    fn_args_invoke = "".join("            mem::transmute(" + next(iter(f)) + "),\n" for f in fn_args)
     if not(len(fn_args_invoke) == 0):
-        fn_args_invoke = "\r\n" + fn_args_invoke
-        fn_args_invoke += "        "
-    fn_body = ""
-    fn_body += string_conversions
+        fn_args_invoke = "\n" + fn_args_invoke + "        "
+    fn_body = "".join(string_conversions)
+
+    c_fn_call = "crate::" + prefix + class_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args_invoke + ")"
 
     if (not(returns_option is None)):
+        returns_option_name = prefix + returns_option
         # function returns option: cannot transmute, use match None { ... }
         # function throws an error: cannot transmute, use match Err { ... }
-        fn_body += "let m: " + prefix + returns_option + " = unsafe { mem::transmute(crate::" + prefix + class_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args_invoke + ")) };\r\n"
-        fn_body += "        match m {\r\n"
-        fn_body += "            " + prefix + returns_option + "::Some(s) => Some("
+        fn_body += "let m: " + returns_option_name + " = unsafe { mem::transmute(" + c_fn_call + ") };\n"
+        fn_body += "        match m {\n"
+        fn_body += "            " + returns_option_name + "::Some(s) => Some("
 
         replace_option = ""
 
         # if function returns OptionString, OptionVecRefMut, ...
-        for entry in python_replacements.keys():
+        for entry in python_replacements:
             if returns_option == "Option" + entry:
                 replace_option = entry
 
@@ -2028,205 +2150,188 @@ def format_py_body(python_replacements, module_name, class_name, function_name,
         else:
             fn_body += "unsafe { mem::transmute(s) }"
 
-        fn_body += "),\r\n"
-        fn_body += "            " + prefix + returns_option + "::None => None,\r\n"
-        fn_body += "        }\r\n"
+        fn_body += "),\n"
+        fn_body += "            " + returns_option_name + "::None => None,\n"
+        fn_body += "        }\n"
     elif not(returns_error is None):
         # function throws an error: cannot transmute, use match Err { ... }
-        fn_body += "let m: " + prefix + returns_error + " = unsafe { mem::transmute(crate::" + prefix + class_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args_invoke + ")) };\r\n"
-        fn_body += "        match m {\r\n"
-        fn_body += "            " + prefix + returns_error + "::Ok(o) => Ok(o.into()),\r\n"
-        fn_body += "            " + prefix + returns_error + "::Err(e) => Err(e.into()),\r\n"
-        fn_body += "        }\r\n"
+        returns_error_name = prefix + returns_error
+        fn_body += "let m: " + returns_error_name + " = unsafe { mem::transmute(" + c_fn_call + ") };\n"
+        fn_body += "        match m {\n"
+        fn_body += "            " + returns_error_name + "::Ok(o) => Ok(o.into()),\n"
+        fn_body += "            " + returns_error_name + "::Err(e) => Err(e.into()),\n"
+        fn_body += "        }\n"
     else:
-        if return_type_str in python_replacements.keys():
-            fn_body += python_replacements[return_type_str][2] + "(unsafe { mem::transmute(crate::" + prefix + class_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args_invoke + ")) })"
+        pr = python_replacements.get(return_type_str)
+        if not(pr is None):
+            fn_body += pr[2] + "(unsafe { mem::transmute(" + c_fn_call + ") })"
         else:
-            fn_body += "unsafe { mem::transmute(crate::" + prefix + class_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args_invoke + ")) }"
+            fn_body += "unsafe { mem::transmute(" + c_fn_call + ") }"
     return fn_body
 
 
-# Generates the azul/rust/azul.rs file
-def generate_rust_api(api_data, structs_map, functions_map):
-
-    module_file_map = {}
-    version = list(api_data.keys())[-1]
-    module_file_map['dll'] = generate_rust_dll_bindings(api_data[version], structs_map, functions_map)
-    myapi_data = api_data[version]
-
-    for module_name in myapi_data.keys():
-        code = ""
-        module_doc = None
-        if "doc" in myapi_data[module_name]:
-            module_doc = myapi_data[module_name]["doc"]
-
-        module = myapi_data[module_name]["classes"]
-
-        code += "    #![allow(dead_code, unused_imports)]\r\n"
-        if module_doc != None:
-            code += "    //! " + module_doc + "\r\n"
-        code += "    use crate::dll::*;\r\n"
-        code += "    use core::ffi::c_void;\r\n"
-
-        if tuple([module_name]) in rust_api_patches:
-            code += rust_api_patches[tuple([module_name])]
-
-        code += get_all_imports(myapi_data, module, module_name)
-
-        for class_name in module.keys():
-            c = module[class_name]
-
-            class_can_derive_debug = "derive" in c.keys() and "Debug" in c["derive"]
-            class_can_be_copied = "derive" in c.keys() and "Copy" in c["derive"]
-            class_has_partialeq = "derive" in c.keys() and "PartialEq" in c["derive"]
-            class_has_eq = "derive" in c.keys() and "Eq" in c["derive"]
-            class_has_partialord = "derive" in c.keys() and "PartialOrd" in c["derive"]
-            class_has_ord = "derive" in c.keys() and "Ord" in c["derive"]
-            class_can_be_hashed = "derive" in c.keys() and "Hash" in c["derive"]
-
-            class_is_boxed_object = not(class_is_stack_allocated(c))
-            class_is_const = "const" in c.keys()
-            class_is_callback_typedef = "callback_typedef" in c.keys() and (len(c["callback_typedef"]) > 0)
-            class_has_custom_destructor = "custom_destructor" in c.keys() and c["custom_destructor"]
-            treat_external_as_ptr = "external" in c.keys() and "is_boxed_object" in c.keys() and c["is_boxed_object"]
-
-            class_can_be_cloned = True
-            if "clone" in c.keys():
-                class_can_be_cloned = c["clone"]
+# Generates the code of one "pub mod" of the azul/rust/azul.rs file,
+# modules do not depend on each other, only on the api data
+def generate_rust_api_module(myapi_data, module_name):
+    code = []
+    module_doc = myapi_data[module_name].get("doc")
+    module = myapi_data[module_name]["classes"]
 
-            c_is_stack_allocated = not(class_is_boxed_object)
-            class_ptr_name = prefix + class_name
-
-            if "doc" in c.keys():
-                code += "    /// " + c["doc"] + "\r\n    "
-            else:
-                code += "    /// `" + class_name + "` struct\r\n    "
+    code.append("    #![allow(dead_code, unused_imports)]\r\n")
+    if module_doc != None:
+        code.append("    //! " + module_doc + "\r\n")
+    code.append("    use crate::dll::*;\r\n")
+    code.append("    use core::ffi::c_void;\r\n")
 
-            code += "\r\n#[doc(inline)] pub use crate::dll::" + class_ptr_name + " as " + class_name + ";\r\n"
+    module_patch = rust_api_patches.get((module_name,))
+    if not(module_patch is None):
+        code.append(module_patch)
 
-            has_constructors = ("constructors" in c.keys() and len(c["constructors"]) > 0)
-            has_functions = ("functions" in c.keys() and len(c["functions"]) > 0)
-            has_constants = ("constants" in c.keys() and len(c["constants"]) > 0)
+    code.append(get_all_imports(myapi_data, module, module_name))
 
-            should_emit_impl = has_constructors or has_functions or has_constants and not(class_is_const or class_is_callback_typedef)
+    class_metas = get_class_metas(myapi_data)
 
-            if should_emit_impl:
-                code += "    impl " + class_name + " {\r\n"
+    for class_name in module:
+        meta = class_metas[class_name]
+        class_is_boxed_object = meta["is_boxed_object"]
+        class_ptr_name = meta["ptr_name"]
+        constructors = meta["constructors"]
+        functions = meta["functions"]
+        constants = meta["constants"]
 
-                if "constants" in c.keys():
-                    for constant in c["constants"]:
-                        constant_name = list(constant.keys())[0]
-                        constant_type = constant[constant_name]["type"]
-                        constant_value = constant[constant_name]["value"]
-                        code += "        pub const " + constant_name + ": " + constant_type + " = " + constant_value + ";\r\n"
-                    code += "\r\n"
+        # "unsafe { crate::dll::AzClass_" prefix shared by all function bodies of the class
+        dll_fn_prefix = "unsafe { crate::dll::" + class_ptr_name + "_"
 
-                if "constructors" in c.keys():
-                    for fn_name in c["constructors"]:
-                        const = c["constructors"][fn_name]
+        class_doc = meta["doc"]
+        if not(class_doc is None):
+            code.append("    /// " + class_doc + "\r\n    ")
+        else:
+            code.append("    /// `" + class_name + "` struct\r\n    ")
 
-                        c_fn_name = class_ptr_name + "_" + snake_case_to_lower_camel(fn_name)
-                        fn_args = rust_bindings_fn_args(const, class_name, class_ptr_name, False, myapi_data)
-                        fn_args_call = rust_bindings_call_fn_args(const, class_name, class_ptr_name, False, myapi_data, class_is_boxed_object)
+        code.append("\r\n#[doc(inline)] pub use crate::dll::" + class_ptr_name + " as " + class_name + ";\r\n")
 
-                        fn_body = ""
+        if meta["should_emit_impl"]:
+            code.append("    impl " + class_name + " {\r\n")
 
-                        if tuple([module_name, class_name, fn_name]) in rust_api_patches.keys() \
-                        and "use_patches" in const.keys() \
-                        and "rust" in const["use_patches"]:
-                            fn_body = rust_api_patches[tuple([module_name, class_name, fn_name])]
-                        else:
-                            fn_body = "unsafe { crate::dll::" + c_fn_name + "(" + fn_args_call + ") }"
+            if len(constants) > 0:
+                for constant in constants:
+                    constant_name = next(iter(constant))
+                    constant_type = constant[constant_name]["type"]
+                    constant_value = constant[constant_name]["value"]
+                    code.append("        pub const " + constant_name + ": " + constant_type + " = " + constant_value + ";\r\n")
+                code.append("\r\n")
 
-                        if "doc" in const.keys():
-                            code += "        /// " + const["doc"] + "\r\n"
-                        else:
-                            code += "        /// Creates a new `" + class_name + "` instance.\r\n"
+            for (fn_name, const) in constructors.items():
+                fn_args = rust_bindings_fn_args(const, class_name, class_ptr_name, False, myapi_data)
+                fn_args_call = rust_bindings_call_fn_args(const, class_name, class_ptr_name, False, myapi_data, class_is_boxed_object)
 
-                        returns = "Self"
-                        if "returns" in const.keys():
-                            return_type = const["returns"]["type"]
-                            returns = return_type
-                            analyzed_return_type = analyze_type(return_type)
-                            if is_primitive_arg(analyzed_return_type[1]):
-                                fn_body = fn_body
-                            else:
-                                return_type_class = search_for_class_by_class_name(myapi_data, analyzed_return_type[1])
-                                if return_type_class is None:
-                                    print("no return type found for return type: " + return_type)
-                                returns = analyzed_return_type[0] + " crate::" + return_type_class[0] + "::" + return_type_class[1] + analyzed_return_type[2]
-                                fn_body = fn_body
+                fn_body = ""
+                fn_patch = rust_api_patches.get((module_name, class_name, fn_name))
 
-                        code += "        pub fn " + fn_name + "(" + fn_args + ") -> " + returns + " { " + fn_body + " }\r\n"
+                if not(fn_patch is None) and "use_patches" in const and "rust" in const["use_patches"]:
+                    fn_body = fn_patch
+                else:
+                    fn_body = dll_fn_prefix + snake_case_to_lower_camel(fn_name) + "(" + fn_args_call + ") }"
 
-                if "functions" in c.keys():
-                    for fn_name in c["functions"]:
-                        f = c["functions"][fn_name]
+                fn_doc = const.get("doc")
+                if not(fn_doc is None):
+                    code.append("        /// " + fn_doc + "\r\n")
+                else:
+                    code.append("        /// Creates a new `" + class_name + "` instance.\r\n")
+
+                returns = "Self"
+                fn_returns = const.get("returns")
+                if not(fn_returns is None):
+                    return_type = fn_returns["type"]
+                    returns = return_type
+                    analyzed_return_type = analyze_type(return_type)
+                    if not(is_primitive_arg(analyzed_return_type[1])):
+                        return_type_class = search_for_class_by_class_name(myapi_data, analyzed_return_type[1])
+                        if return_type_class is None:
+                            print("no return type found for return type: " + return_type)
+                        returns = analyzed_return_type[0] + " crate::" + return_type_class[0] + "::" + return_type_class[1] + analyzed_return_type[2]
+
+                code.append("        pub fn " + fn_name + "(" + fn_args + ") -> " + returns + " { " + fn_body + " }\r\n")
+
+            for (fn_name, f) in functions.items():
+                fn_args = rust_bindings_fn_args(f, class_name, class_ptr_name, True, myapi_data)
+                fn_args_call = rust_bindings_call_fn_args(f, class_name, class_ptr_name, True, myapi_data, class_is_boxed_object)
+
+                fn_body = ""
+                fn_patch = rust_api_patches.get((module_name, class_name, fn_name))
+
+                if not(fn_patch is None) and "use_patches" in f and "rust" in f["use_patches"]:
+                    fn_body = fn_patch
+                else:
+                    fn_body = dll_fn_prefix + snake_case_to_lower_camel(fn_name) + "(" + fn_args_call + ") }"
 
-                        fn_args = rust_bindings_fn_args(f, class_name, class_ptr_name, True, myapi_data)
-                        fn_args_call = rust_bindings_call_fn_args(f, class_name, class_ptr_name, True, myapi_data, class_is_boxed_object)
-                        c_fn_name = class_ptr_name + "_" + snake_case_to_lower_camel(fn_name)
+                if not(fn_patch is None):
+                    code.append(fn_patch)
+                    if f.get("use_patches"):
+                        continue
 
-                        fn_body = ""
+                fn_doc = f.get("doc")
+                if not(fn_doc is None):
+                    code.append("        /// " + fn_doc + "\r\n")
+                else:
+                    code.append("        /// Calls the `" + class_name + "::" + fn_name + "` function.\r\n")
 
-                        if tuple([module_name, class_name, fn_name]) in rust_api_patches.keys() \
-                        and "use_patches" in const.keys() \
-                        and "rust" in const["use_patches"]:
-                            fn_body = rust_api_patches[tuple([module_name, class_name, fn_name])]
-                        else:
-                            fn_body = "unsafe { crate::dll::" + c_fn_name + "(" + fn_args_call + ") }"
+                returns = ""
+                fn_returns = f.get("returns")
+                if not(fn_returns is None):
+                    return_type = fn_returns["type"]
+                    returns = " -> " + return_type
+                    analyzed_return_type = analyze_type(return_type)
+                    if not(is_primitive_arg(analyzed_return_type[1])):
+                        return_type_class = search_for_class_by_class_name(myapi_data, analyzed_return_type[1])
+                        if return_type_class is None:
+                            print("no return type found for return type: " + return_type)
+                        returns = " ->" + analyzed_return_type[0] + " crate::" + return_type_class[0] + "::" + return_type_class[1] + analyzed_return_type[2]
 
-                        if tuple([module_name, class_name, fn_name]) in rust_api_patches:
-                            code += rust_api_patches[tuple([module_name, class_name, fn_name])]
-                            if "use_patches" in f.keys() and f["use_patches"]:
-                                continue
+                code.append("        pub fn " + fn_name + "(" + fn_args + ") " +  returns + " { " + fn_body + " }\r\n")
 
-                        if "doc" in f.keys():
-                            code += "        /// " + f["doc"] + "\r\n"
-                        else:
-                            code += "        /// Calls the `" + class_name + "::" + fn_name + "` function.\r\n"
-
-                        returns = ""
-                        if "returns" in f.keys():
-                            return_type = f["returns"]["type"]
-                            returns = " -> " + return_type
-                            analyzed_return_type = analyze_type(return_type)
-                            if is_primitive_arg(analyzed_return_type[1]):
-                                fn_body = fn_body
-                            else:
-                                return_type_class = search_for_class_by_class_name(myapi_data, analyzed_return_type[1])
-                                if return_type_class is None:
-                                    print("no return type found for return type: " + return_type)
-                                returns = " ->" + analyzed_return_type[0] + " crate::" + return_type_class[0] + "::" + return_type_class[1] + analyzed_return_type[2]
-                                fn_body = fn_body
+            code.append("    }\r\n\r\n") # end of class
 
-                        code += "        pub fn " + fn_name + "(" + fn_args + ") " +  returns + " { " + fn_body + " }\r\n"
+        if meta["treat_external_as_ptr"] and meta["can_be_cloned"]:
+            code.append("    impl Clone for " + class_name + " { fn clone(&self) -> Self { unsafe { crate::dll::" + class_ptr_name + "_deepCopy(self) } } }\r\n")
+        if meta["treat_external_as_ptr"]:
+            code.append("    impl Drop for " + class_name + " { fn drop(&mut self) { if self.run_destructor { unsafe { crate::dll::" + class_ptr_name + "_delete(self) } } } }\r\n")
 
-                code += "    }\r\n\r\n" # end of class
+    return "".join(code)
 
-            if treat_external_as_ptr and class_can_be_cloned:
-                code += "    impl Clone for " + class_name + " { fn clone(&self) -> Self { unsafe { crate::dll::" + class_ptr_name + "_deepCopy(self) } } }\r\n"
-            if treat_external_as_ptr:
-                code += "    impl Drop for " + class_name + " { fn drop(&mut self) { if self.run_destructor { unsafe { crate::dll::" + class_ptr_name + "_delete(self) } } } }\r\n"
+# Generates the azul/rust/azul.rs file, writing it to "out"
+def generate_rust_api(out, api_data, structs_map, functions_map):
 
+    version = get_latest_version(api_data)
+    myapi_data = api_data[version]
 
-        module_file_map[module_name] = code
+    for line in license.splitlines():
+        out.write("// " + line + "\r\n")
 
-    final_code = ""
+    out.write(read_file(root_folder + "/api/_patches/azul.rs/header.rs"))
 
-    for line in license.splitlines():
-        final_code += "// " + line + "\r\n"
+    out.write("mod dll {\r\n")
+    out.write(generate_rust_dll_bindings(myapi_data, structs_map, functions_map))
+    out.write("}\r\n\r\n")
 
-    final_code += read_file(root_folder + "/api/_patches/azul.rs/header.rs")
+    for module_name in myapi_data:
+        out.write("pub mod " + module_name + " {\r\n")
+        out.write(generate_rust_api_module(myapi_data, module_name))
+        out.write("}\r\n\r\n")
 
-    for module_name in module_file_map.keys():
-        if module_name != "dll":
-            final_code += "pub "
-        final_code += "mod " + module_name + " {\r\n"
-        final_code += module_file_map[module_name]
-        final_code += "}\r\n\r\n"
+# Resolves the type of a callback fn arg or return value, returns
+# (True, "u32") for primitive types and (False, "AzBlah") for API classes
+def resolve_callback_type(api_data, fn_arg_type, pfx):
+    if is_primitive_arg(fn_arg_type):
+        return (True, fn_arg_type)
+    search_result = search_for_class_by_class_name(api_data, fn_arg_type)
+    if search_result is None:
+        print("fn_arg_type " + fn_arg_type + " not found!")
+        raise Exception("fn_arg_type " + fn_arg_type + " not found!")
+    return (False, pfx + search_result[1])
 
-    return final_code
+# Rust reference for the "ref" of a callback fn arg
+rust_callback_arg_ref = {"ref": "&", "refmut": "&mut ", "value": ""}
 
 # Generate the RUST function callback type:
 #
@@ -2236,68 +2341,33 @@ def generate_rust_callback_fn_type(api_data, callback_typedef):
 
     fn_string = "extern \"C\" fn("
 
-    if "fn_args" in callback_typedef.keys():
-        fn_args = callback_typedef["fn_args"]
+    fn_args_list = []
+    fn_args = callback_typedef.get("fn_args")
+    if not(fn_args is None):
         for fn_arg in fn_args:
             fn_arg_type = fn_arg["type"]
-            if not "ref" in fn_arg.keys():
+            if not "ref" in fn_arg:
                 print("callback type " + str(callback_typedef) + " does not have a ref attribute for fn_arg " + str(fn_arg))
-            fn_arg_ref = fn_arg["ref"]
-            search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-            fn_arg_class = fn_arg_type
-            if not(is_primitive_arg(fn_arg_type)):
-                if search_result is None:
-                    print("fn_arg_type " + fn_arg_type + " not found!")
-                fn_arg_class = search_result[1]
-
-            if not(is_primitive_arg(fn_arg_type)):
-                if fn_arg_ref == "ref":
-                    fn_string += "&" + prefix + fn_arg_class
-                elif fn_arg_ref == "refmut":
-                    fn_string += "&mut " + prefix + fn_arg_class
-                elif fn_arg_ref == "value":
-                    fn_string += prefix + fn_arg_class
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
-            else:
-                if fn_arg_ref == "ref":
-                    fn_string += "&"  + fn_arg_class
-                elif fn_arg_ref == "refmut":
-                    fn_string += "&mut " + fn_arg_class
-                elif fn_arg_ref == "value":
-                    fn_string += fn_arg_class
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
-
-            fn_string += ", "
+            arg_ref = rust_callback_arg_ref.get(fn_arg["ref"])
+            if arg_ref is None:
+                raise Exception("wrong fn_arg_ref on " + fn_arg_type)
+            fn_args_list.append(arg_ref + resolve_callback_type(api_data, fn_arg_type, prefix)[1])
 
-        if len(fn_args) > 0:
-            fn_string = fn_string[:-2] # trim last comma
+    fn_string += ", ".join(fn_args_list) + ")"
 
-    fn_string += ")"
-
-    if "returns" in callback_typedef.keys():
-        fn_string += " -> "
-        fn_arg_type = callback_typedef["returns"]["type"]
-        search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-        fn_arg_class = fn_arg_type
-
-        if not(is_primitive_arg(fn_arg_type)):
-            if search_result is None:
-                print("fn_arg_type " + fn_arg_type + " not found!")
-                raise Exception("fn_arg_type " + fn_arg_type + " not found!")
-            fn_arg_class = search_result[1]
-
-        if not(is_primitive_arg(fn_arg_type)):
-            fn_string += prefix + fn_arg_class
-        else:
-            fn_string += fn_arg_class
+    callback_returns = callback_typedef.get("returns")
+    if not(callback_returns is None):
+        fn_string += " -> " + resolve_callback_type(api_data, callback_returns["type"], prefix)[1]
 
     return fn_string
 
+# struct for one variant of a C tagged union, with or without the C typedef
+c_union_variant_template = Template("\r\nstruct $variant { $tag tag;$c_type };")
+c_union_variant_typedef_template = Template("\r\nstruct $variant { $tag tag;$c_type };\r\ntypedef struct $variant $variant;")
+
 # Generate the C coded for the struct layout of the final API
 def generate_c_structs(api_data, structs_map, forward_declarations, extra_forward_delcarations, use_prefix=True, typedef_style="c"):
-    code = ""
+    code = []
 
     pfx = prefix
     if not(use_prefix):
@@ -2307,264 +2377,266 @@ def generate_c_structs(api_data, structs_map, forward_declarations, extra_forwar
     # C does not allow (?) to forward declare function pointers
     function_pointers = []
 
-    for struct_name in structs_map.keys():
-        struct = structs_map[struct_name]
-        class_is_callback_typedef = "callback_typedef" in struct.keys() and (len(struct["callback_typedef"].keys()) > 0)
+    for (struct_name, struct) in structs_map.items():
+        class_is_callback_typedef = len(struct.get("callback_typedef", {})) > 0
         if class_is_callback_typedef:
             if typedef_style == "c":
                 function_pointers.append(tuple((struct["callback_typedef"], generate_c_callback_fn_type(api_data, struct["callback_typedef"], struct_name, use_prefix))))
             elif typedef_style == "cpp":
                 function_pointers.append(tuple((struct["callback_typedef"], generate_cpp_callback_fn_type(api_data, struct["callback_typedef"], struct_name, use_prefix))))
 
-    function_pointer_string = ""
-    already_forward_declared = []
+    function_pointer_string = []
+    already_forward_declared = set()
 
     for fnptr in function_pointers:
-        if "fn_args" in fnptr[0].keys():
-            for arg in fnptr[0]["fn_args"]:
+        fn_ptr_args = fnptr[0].get("fn_args")
+        if not(fn_ptr_args is None):
+            for arg in fn_ptr_args:
                 arg_type = analyze_type(arg["type"])[1]
                 if is_primitive_arg(analyze_type(arg_type)[1]):
                     continue
                 if not(arg_type in already_forward_declared):
                     # forward declare the correct type (struct, enum, union)
                     arg_type_type = "struct"
-                    found_c = search_for_class_by_class_name(api_data, arg_type)
-                    c = get_class(api_data, found_c[0], found_c[1])
-                    if "enum_fields" in c.keys():
+                    c = quick_get_class(api_data, arg_type)
+                    if "enum_fields" in c:
                         arg_type_type = "enum"
                         if enum_is_union(c["enum_fields"]):
                             arg_type_type = "union"
-                    function_pointer_string += "\r\n" + arg_type_type + " " + pfx + arg_type + ";"
+                    function_pointer_string.append("\r\n" + arg_type_type + " " + pfx + arg_type + ";")
                     if typedef_style == "c":
-                        function_pointer_string += "\r\ntypedef " + arg_type_type + " " + pfx + arg_type + " " + pfx + arg_type + ";"
+                        function_pointer_string.append("\r\ntypedef " + arg_type_type + " " + pfx + arg_type + " " + pfx + arg_type + ";")
 
-                    already_forward_declared.append(arg_type)
+                    already_forward_declared.add(arg_type)
 
-        if "returns" in fnptr[0].keys():
-            return_type = fnptr[0]["returns"]["type"]
-            return_type = analyze_type(return_type)[1]
+        fn_ptr_returns = fnptr[0].get("returns")
+        if not(fn_ptr_returns is None):
+            return_type = analyze_type(fn_ptr_returns["type"])[1]
             if not(is_primitive_arg(return_type)):
                 if not(return_type in already_forward_declared):
                     # forward declare the correct type (struct, enum, union)
                     arg_type_type = "struct"
-                    found_c = search_for_class_by_class_name(api_data, return_type)
-                    c = get_class(api_data, found_c[0], found_c[1])
-                    if "enum_fields" in c.keys():
+                    c = quick_get_class(api_data, return_type)
+                    if "enum_fields" in c:
                         arg_type_type = "enum"
                         if enum_is_union(c["enum_fields"]):
                             arg_type_type = "union"
-                    function_pointer_string += "\r\n" + arg_type_type + " " + pfx + return_type + ";"
+                    function_pointer_string.append("\r\n" + arg_type_type + " " + pfx + return_type + ";")
                     if typedef_style == "c":
-                        function_pointer_string += "\r\ntypedef " + arg_type_type + " " + pfx + return_type + " " + pfx + return_type + ";"
-                    already_forward_declared.append(return_type)
+                        function_pointer_string.append("\r\ntypedef " + arg_type_type + " " + pfx + return_type + " " + pfx + return_type + ";")
+                    already_forward_declared.add(return_type)
 
-        function_pointer_string += "\r\n"
-        function_pointer_string += fnptr[1]
-        function_pointer_string += "\r\n"
+        function_pointer_string.append("\r\n")
+        function_pointer_string.append(fnptr[1])
+        function_pointer_string.append("\r\n")
 
-    code += function_pointer_string
-    code += "\r\n"
+    code.extend(function_pointer_string)
+    code.append("\r\n")
 
-    for struct_name in structs_map.keys():
-        struct = structs_map[struct_name]
-        class_is_callback_typedef = "callback_typedef" in struct.keys() and (len(struct["callback_typedef"].keys()) > 0)
-        class_can_be_copied = "derive" in struct.keys() and "Copy" in struct["derive"]
-        class_has_custom_destructor = "custom_destructor" in struct.keys() and struct["custom_destructor"]
-        class_can_be_cloned = True
-        if "clone" in struct.keys():
-            class_can_be_cloned = struct["clone"]
-
-        is_boxed_object = "is_boxed_object" in struct.keys() and struct["is_boxed_object"]
-        treat_external_as_ptr = "external" in struct.keys() and is_boxed_object
-
-        if struct_name in extra_forward_delcarations.keys():
-            struct_forward_decl = extra_forward_delcarations[struct_name]
-            code += "\r\n" + struct_forward_decl["type"] + " " + struct_forward_decl["name"] + ";"
+    for (struct_name, struct) in structs_map.items():
+        class_is_callback_typedef = len(struct.get("callback_typedef", {})) > 0
+        class_can_be_copied = "Copy" in struct.get("derive", ())
+
+        struct_forward_decl = extra_forward_delcarations.get(struct_name)
+        if not(struct_forward_decl is None):
+            code.append("\r\n" + struct_forward_decl["type"] + " " + struct_forward_decl["name"] + ";")
             if typedef_style == "c":
-                code += "\r\ntypedef " + struct_forward_decl["type"] + " " + struct_forward_decl["name"] + " " + struct_forward_decl["name"] + ";"
+                code.append("\r\ntypedef " + struct_forward_decl["type"] + " " + struct_forward_decl["name"] + " " + struct_forward_decl["name"] + ";")
 
         if class_is_callback_typedef:
             # function_pointers += generate_c_callback_fn_type(api_data, struct["callback_typedef"], struct_name)
             # function_pointers += "\r\n"
             pass
-        elif "struct" in struct.keys():
+        elif "struct" in struct:
             struct = struct["struct"]
             # https://stackoverflow.com/questions/65043140/how-to-forward-declare-structs-in-c
-            code += "\r\nstruct " + struct_name + " {\r\n"
+            code.append("\r\nstruct " + struct_name + " {\r\n")
 
             for field in struct:
                 if type(field) is str:
                     print("Struct " + struct_name + " should have a dictionary as fields")
-                field_name = list(field.keys())[0]
-                field_type = list(field.values())[0]
+                (field_name, field_type), = field.items()
                 if "type" in field_type:
                     field_type = field_type["type"]
-                    analyzed_arg_type = analyze_type(field_type)
+                    (field_ptr, field_base_type, field_suffix) = analyze_type(field_type)
+                    field_ptr = replace_primitive_ctype(field_ptr).strip()
 
                     # arrays: convert blah: [BlahType;4] to BlahType blah[4]
                     is_array = False
-                    if (len(analyzed_arg_type[2]) == 3 and analyzed_arg_type[2].startswith(";")):
-                        analyzed_arg_type[2] = analyzed_arg_type[2][1:]
+                    if (len(field_suffix) == 3 and field_suffix.startswith(";")):
+                        field_suffix = field_suffix[1:]
                         is_array = True
 
-                    if is_primitive_arg(analyzed_arg_type[1]):
-                        if is_array:
-                            code += "    " + replace_primitive_ctype(analyzed_arg_type[1]) + " " + field_name + replace_primitive_ctype(analyzed_arg_type[0]).strip() + analyzed_arg_type[2] + ";\r\n"
-                        else:
-                            code += "    " + replace_primitive_ctype(analyzed_arg_type[1]) + replace_primitive_ctype(analyzed_arg_type[0]).strip() + analyzed_arg_type[2] + " " + field_name + ";\r\n"
+                    if is_primitive_arg(field_base_type):
+                        field_c_type = replace_primitive_ctype(field_base_type)
                     else:
-                        field_type_class_path = search_for_class_by_class_name(api_data, analyzed_arg_type[1])
+                        field_type_class_path = search_for_class_by_class_name(api_data, field_base_type)
                         if field_type_class_path is None:
-                            print("no field_type_class_path found for " + str(analyzed_arg_type))
+                            print("no field_type_class_path found for " + field_type)
+                        field_c_type = pfx + field_type_class_path[1]
 
-                        found_c = get_class(api_data, field_type_class_path[0], field_type_class_path[1])
-                        if is_array:
-                            code += "    " + pfx + field_type_class_path[1] + " " + field_name + replace_primitive_ctype(analyzed_arg_type[0]).strip() + analyzed_arg_type[2] + ";\r\n"
-                        else:
-                            code += "    " + pfx + field_type_class_path[1] + replace_primitive_ctype(analyzed_arg_type[0]).strip()  + analyzed_arg_type[2]+ " " + field_name + ";\r\n"
+                    if is_array:
+                        code.append("    " + field_c_type + " " + field_name + field_ptr + field_suffix + ";\r\n")
+                    else:
+                        code.append("    " + field_c_type + field_ptr + field_suffix + " " + field_name + ";\r\n")
                 else:
                     print("struct " + struct_name + " does not have a type on field " + field_name)
                     raise Exception("error")
 
             if typedef_style == "cpp":
-                code += "    " + struct_name + "& operator=(const " + struct_name + "&) = delete; /* disable assignment operator, use std::move (default) or .clone() */\r\n"
+                code.append("    " + struct_name + "& operator=(const " + struct_name + "&) = delete; /* disable assignment operator, use std::move (default) or .clone() */\r\n")
                 if not(class_can_be_copied):
-                    code += "    " + struct_name + "(const " + struct_name + "&) = delete; /* disable copy constructor, use explicit .clone() */\r\n"
-                code += "    " + struct_name + "() = delete; /* disable default constructor, use C++20 designated initializer instead */\r\n"
-            code += "};\r\n"
+                    code.append("    " + struct_name + "(const " + struct_name + "&) = delete; /* disable copy constructor, use explicit .clone() */\r\n")
+                code.append("    " + struct_name + "() = delete; /* disable default constructor, use C++20 designated initializer instead */\r\n")
+            code.append("};\r\n")
 
             if not(struct_name in already_forward_declared):
                 if typedef_style == "c":
-                    code += "typedef struct " + struct_name + " " + struct_name + ";\r\n"
+                    code.append("typedef struct " + struct_name + " " + struct_name + ";\r\n")
 
-        elif "enum" in struct.keys():
+        elif "enum" in struct:
             enum = struct["enum"]
             if not(enum_is_union(enum)):
                 if typedef_style == "cpp":
-                    code += "\r\nenum class " + struct_name + " {\r\n"
+                    code.append("\r\nenum class " + struct_name + " {\r\n")
                 else:
-                    code += "\r\nenum " + struct_name + " {\r\n"
-                for variant in enum:
-                    variant_name = list(variant.keys())[0]
-                    variant_real = list(variant.values())[0]
-                    if typedef_style == "cpp":
-                        code += "   " + variant_name + ",\r\n"
-                    else:
-                        code += "   " + struct_name + "_" + variant_name + ",\r\n"
-                code += "};\r\n"
+                    code.append("\r\nenum " + struct_name + " {\r\n")
+                row_prefix = "   " + struct_name + "_"
+                if typedef_style == "cpp":
+                    row_prefix = "   "
+                code.append("".join(row_prefix + next(iter(variant)) + ",\r\n" for variant in enum))
+                code.append("};\r\n")
                 if not(struct_name in already_forward_declared):
                     if typedef_style == "c":
-                        code += "typedef enum " + struct_name + " " + struct_name + ";\r\n"
+                        code.append("typedef enum " + struct_name + " " + struct_name + ";\r\n")
             else:
                 # generate union tag
                 if typedef_style == "cpp":
-                    code += "\r\nenum class " + struct_name + "Tag {\r\n"
+                    code.append("\r\nenum class " + struct_name + "Tag {\r\n")
                 else:
-                    code += "\r\nenum " + struct_name + "Tag {\r\n"
-                for variant in enum:
-                    variant_name = list(variant.keys())[0]
-                    if typedef_style == "cpp":
-                        code += "   " + variant_name + ",\r\n"
-                    else:
-                        code += "   " + struct_name + "Tag_" + variant_name + ",\r\n"
-                code += "};\r\n"
+                    code.append("\r\nenum " + struct_name + "Tag {\r\n")
+                tag_prefix = "   " + struct_name + "Tag_"
+                if typedef_style == "cpp":
+                    tag_prefix = "   "
+                code.append("".join(tag_prefix + next(iter(variant)) + ",\r\n" for variant in enum))
+                code.append("};\r\n")
                 if typedef_style == "c":
-                    code += "typedef enum " + struct_name + "Tag " + struct_name + "Tag;\r\n"
+                    code.append("typedef enum " + struct_name + "Tag " + struct_name + "Tag;\r\n")
 
                 # generate union variants
+                union_variant_template = c_union_variant_template
+                if typedef_style == "c":
+                    union_variant_template = c_union_variant_typedef_template
                 for variant in enum:
-                    variant_name = list(variant.keys())[0]
-                    variant_real = list(variant.values())[0]
+                    (variant_name, variant_real), = variant.items()
                     c_type = ""
-                    if "type" in variant_real.keys():
+                    if "type" in variant_real:
                         variant_type = variant_real["type"]
-                        analyzed_variant_type = analyze_type(variant_type)
+                        (variant_ptr, variant_base_type, variant_suffix) = analyze_type(variant_type)
+                        variant_ptr = replace_primitive_ctype(variant_ptr).strip()
                         variant_prefix = pfx
-                        if is_primitive_arg(analyzed_variant_type[1]):
+                        if is_primitive_arg(variant_base_type):
                             variant_prefix = ""
+                        variant_c_type = variant_prefix + replace_primitive_ctype(variant_base_type).strip()
 
                         # arrays: convert blah: [BlahType;4] to BlahType blah[4]
-                        is_array = False
-                        if (len(analyzed_variant_type[2]) == 3 and analyzed_variant_type[2].startswith(";")):
-                            analyzed_variant_type[2] = analyzed_variant_type[2][1:]
-                            is_array = True
-
-                        if is_array:
-                            c_type = " " + variant_prefix + replace_primitive_ctype(analyzed_variant_type[1]).strip()  + " payload" + replace_primitive_ctype(analyzed_variant_type[0]).strip() + analyzed_variant_type[2] + ";"
+                        if (len(variant_suffix) == 3 and variant_suffix.startswith(";")):
+                            c_type = " " + variant_c_type + " payload" + variant_ptr + variant_suffix[1:] + ";"
                         else:
-                            c_type = " " + variant_prefix + replace_primitive_ctype(analyzed_variant_type[1]).strip() + replace_primitive_ctype(analyzed_variant_type[0]).strip() + analyzed_variant_type[2] + " payload;"
+                            c_type = " " + variant_c_type + variant_ptr + variant_suffix + " payload;"
 
-                    code += "\r\nstruct " + struct_name + "Variant_" + variant_name + " { " + struct_name + "Tag tag;" + c_type + " };"
-                    if typedef_style == "c":
-                        code += "\r\ntypedef struct " + struct_name + "Variant_" + variant_name + " " + struct_name + "Variant_" + variant_name + ";"
+                    code.append(union_variant_template.substitute(variant=struct_name + "Variant_" + variant_name, tag=struct_name + "Tag", c_type=c_type))
 
                 # generate union
-                code += "\r\nunion " + struct_name + " {\r\n"
+                code.append("\r\nunion " + struct_name + " {\r\n")
                 for variant in enum:
-                    variant_name = list(variant.keys())[0]
-                    code += "    " + struct_name + "Variant_" + variant_name + " " + variant_name + ";\r\n"
-                code += "};\r\n"
+                    variant_name = next(iter(variant))
+                    code.append("    " + struct_name + "Variant_" + variant_name + " " + variant_name + ";\r\n")
+                code.append("};\r\n")
                 if not(struct_name in already_forward_declared):
                     if typedef_style == "c":
-                        code += "typedef union " + struct_name + " " + struct_name + ";"
+                        code.append("typedef union " + struct_name + " " + struct_name + ";")
 
-                code += "\r\n"
+                code.append("\r\n")
 
-    return code
+    return "".join(code)
+
+# static empty array, BlahVec_fromConstArray() macro and BlahVec_empty macro for one vec type
+c_vec_constructors_template = Template(
+    "\r\n$array_type ${vec}Array[] = {};"
+    "\r\n#define ${vec}_fromConstArray(v) { .ptr = &v, .len = sizeof(v) / sizeof($elem_type), .cap = sizeof(v) / sizeof($elem_type), .destructor = { .NoDestructor = { .tag = ${vec}DestructorTag_NoDestructor, }, }, }"
+    "\r\n#define ${vec}_empty { .ptr = &${vec}Array, .len = 0, .cap = 0, .destructor = { .NoDestructor = { .tag = ${vec}DestructorTag_NoDestructor, }, }, }"
+    "\r\n"
+)
 
 # Generate BlahVec_fromConstArray() macros and BlahVec_empty() macros
 # NOTE: This is only in the C API, the C++ API uses consteval
 def generate_c_union_macros_and_vec_constructors(api_data, structs_map):
-    code = ""
+    code = []
 
-    version = list(api_data.keys())[-1]
+    version = get_latest_version(api_data)
     myapi_data = api_data[version]
 
-    for struct_name in structs_map.keys():
-        struct = structs_map[struct_name]
+    for (struct_name, struct) in structs_map.items():
 
-        if not("enum" in struct.keys()):
+        enum = struct.get("enum")
+        if enum is None:
             continue
 
-        enum = struct["enum"]
         if not(enum_is_union(enum)):
             continue
 
         # generate macros for creating variants
         for variant in enum:
-            variant_name = list(variant.keys())[0]
+            variant_name = next(iter(variant))
             if "type" in variant[variant_name]:
-                code += "\r\n#define " + struct_name + "_" + variant_name + "(v) { ." + variant_name + " = { .tag = " + struct_name + "Tag_" + variant_name + ", .payload = v } }"
+                code.append("\r\n#define " + struct_name + "_" + variant_name + "(v) { ." + variant_name + " = { .tag = " + struct_name + "Tag_" + variant_name + ", .payload = v } }")
             else:
-                code += "\r\n#define " + struct_name + "_" + variant_name + " { ." + variant_name + " = { .tag = " + struct_name + "Tag_" + variant_name + " } }"
+                code.append("\r\n#define " + struct_name + "_" + variant_name + " { ." + variant_name + " = { .tag = " + struct_name + "Tag_" + variant_name + " } }")
 
 
     # generate automatic "empty" constructor macros for all types in the "vec" module
     # for struct in api_data["0.1.0"]["classes"]["vec"]
-    if "vec" in myapi_data.keys():
-        for vec_name in myapi_data["vec"]["classes"].keys():
+    if "vec" in myapi_data:
+        for (vec_name, vec_class) in myapi_data["vec"]["classes"].items():
             if vec_name.endswith("Vec"):
-                vec_type = analyze_type(myapi_data["vec"]["classes"][vec_name]["struct_fields"][0]["ptr"]["type"])[1]
+                vec_type = analyze_type(vec_class["struct_fields"][0]["ptr"]["type"])[1]
                 if is_primitive_arg(vec_type):
-                    code += "\r\n" + replace_primitive_ctype(vec_type).strip() + " " +  prefix + vec_name + "Array[] = {};"
-                    code += "\r\n#define " + prefix + vec_name + "_fromConstArray(v) { .ptr = &v, .len = sizeof(v) / sizeof(" + replace_primitive_ctype(vec_type).strip() + "), .cap = sizeof(v) / sizeof(" + replace_primitive_ctype(vec_type).strip() + "), .destructor = { .NoDestructor = { .tag = " + prefix + vec_name + "DestructorTag_NoDestructor, }, }, }"
+                    array_type = replace_primitive_ctype(vec_type).strip()
+                    elem_type = array_type
                 else:
-                    code += "\r\n" + prefix + vec_type + " " +  prefix + vec_name + "Array[] = {};"
-                    code += "\r\n#define " + prefix + vec_name + "_fromConstArray(v) { .ptr = &v, .len = sizeof(v) / sizeof(" + prefix + vec_name[:-3] + "), .cap = sizeof(v) / sizeof(" + prefix + vec_name[:-3] + "), .destructor = { .NoDestructor = { .tag = " + prefix + vec_name + "DestructorTag_NoDestructor, }, }, }"
-                code += "\r\n#define " + prefix + vec_name + "_empty { .ptr = &" + prefix + vec_name + "Array, .len = 0, .cap = 0, .destructor = { .NoDestructor = { .tag = " + prefix + vec_name + "DestructorTag_NoDestructor, }, }, }"
-                code += "\r\n"
+                    array_type = prefix + vec_type
+                    elem_type = prefix + vec_name[:-3]
+                code.append(c_vec_constructors_template.substitute(vec=prefix + vec_name, array_type=array_type, elem_type=elem_type))
 
-    return code
+    return "".join(code)
 
 # returns whether an enum is a union
 def enum_is_union(enum):
-    enum_is_c_enum = True
     for variant in enum:
-        variant_name = list(variant.keys())[0]
-        variant_real = list(variant.values())[0]
-        if "type" in variant_real.keys():
-            enum_is_c_enum = False # enum is tagged union
-    return not(enum_is_c_enum)
+        (variant_name, variant_real), = variant.items()
+        if "type" in variant_real:
+            return True # enum is tagged union
+    return False
+
+# (prefix, suffix) around the C type for the "ref" of a callback fn arg,
+# for struct types and for primitive types
+c_callback_arg_ref = {"ref": ("", "* const"), "refmut": ("", "* restrict"), "value": ("", "")}
+c_primitive_callback_arg_ref = {"ref": ("const ", "*"), "refmut": ("", "* restrict"), "value": ("", "")}
+
+# Returns the C type of a callback fn arg, i.e. "AzBlah* const" for a {"type": "Blah", "ref": "ref"}
+def c_callback_arg_type(fn_arg_is_primitive, fn_arg_class, fn_arg_ref):
+    if fn_arg_is_primitive:
+        arg_ref = c_primitive_callback_arg_ref.get(fn_arg_ref)
+        c_type = replace_primitive_ctype(fn_arg_class)
+    else:
+        arg_ref = c_callback_arg_ref.get(fn_arg_ref)
+        c_type = fn_arg_class
+
+    if arg_ref is None:
+        raise Exception("wrong fn_arg_ref on " + fn_arg_class)
+
+    return arg_ref[0] + c_type + arg_ref[1]
 
 # takes the api data and a function callback and returns
 # the C function pointer typedef, i.e.:
@@ -2579,65 +2651,21 @@ def generate_c_callback_fn_type(api_data, callback_typedef, callback_name,use_pr
     if not(use_prefix):
         pfx = ""
 
-    if "returns" in callback_typedef.keys():
-        fn_arg_type = callback_typedef["returns"]["type"]
-        search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-        fn_arg_class = fn_arg_type
-
-        if not(is_primitive_arg(fn_arg_type)):
-            if search_result is None:
-                print("fn_arg_type " + fn_arg_type + " not found!")
-                raise Exception("fn_arg_type " + fn_arg_type + " not found!")
-            fn_arg_class = search_result[1]
-
-        if not(is_primitive_arg(fn_arg_type)):
-            return_val = pfx + fn_arg_class
-        else:
-            return_val = fn_arg_class
+    callback_returns = callback_typedef.get("returns")
+    if not(callback_returns is None):
+        return_val = resolve_callback_type(api_data, callback_returns["type"], pfx)[1]
 
     fn_string = "typedef " + return_val + " (*" + callback_name + ")("
 
-    if "fn_args" in callback_typedef.keys():
-        fn_args = callback_typedef["fn_args"]
-        fn_arg_idx = 0
-        for fn_arg in fn_args:
-            fn_arg_type = fn_arg["type"]
-            fn_arg_ref = fn_arg["ref"]
-            search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-            fn_arg_class = fn_arg_type
-            if not(is_primitive_arg(fn_arg_type)):
-                if search_result is None:
-                    print("fn_arg_type " + fn_arg_type + " not found!")
-                fn_arg_class = search_result[1]
-
-            if not(is_primitive_arg(fn_arg_type)):
-                if fn_arg_ref == "ref":
-                    fn_string += pfx + fn_arg_class + "* const"
-                elif fn_arg_ref == "refmut":
-                    fn_string += pfx + fn_arg_class + "* restrict"
-                elif fn_arg_ref == "value":
-                    fn_string += pfx + fn_arg_class
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
-            else:
-                if fn_arg_ref == "ref":
-                    fn_string += "const " + replace_primitive_ctype(fn_arg_class) + "*"
-                elif fn_arg_ref == "refmut":
-                    fn_string += replace_primitive_ctype(fn_arg_class) + "* restrict"
-                elif fn_arg_ref == "value":
-                    fn_string += replace_primitive_ctype(fn_arg_class)
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
-
-            fn_string += " "
-            fn_string += chr(fn_arg_idx + 65)
-            fn_string += ", "
-            fn_arg_idx += 1
-
-        if len(fn_args) > 0:
-            fn_string = fn_string[:-2] # trim last comma
+    fn_args_list = []
+    fn_args = callback_typedef.get("fn_args")
+    if not(fn_args is None):
+        for (fn_arg_idx, fn_arg) in enumerate(fn_args):
+            (fn_arg_is_primitive, fn_arg_class) = resolve_callback_type(api_data, fn_arg["type"], pfx)
+            fn_arg_c_type = c_callback_arg_type(fn_arg_is_primitive, fn_arg_class, fn_arg["ref"])
+            fn_args_list.append(fn_arg_c_type + " " + chr(65 + fn_arg_idx))
 
-    fn_string += ");"
+    fn_string += ", ".join(fn_args_list) + ");"
 
     return fn_string
 
@@ -2654,98 +2682,104 @@ def generate_cpp_callback_fn_type(api_data, callback_typedef, callback_name,use_
     if not(use_prefix):
         pfx = ""
 
-    if "returns" in callback_typedef.keys():
-        fn_arg_type = callback_typedef["returns"]["type"]
-        search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-        fn_arg_class = fn_arg_type
-
-        if not(is_primitive_arg(fn_arg_type)):
-            if search_result is None:
-                print("fn_arg_type " + fn_arg_type + " not found!")
-                raise Exception("fn_arg_type " + fn_arg_type + " not found!")
-            fn_arg_class = search_result[1]
-
-        if not(is_primitive_arg(fn_arg_type)):
-            return_val = pfx + fn_arg_class
-        else:
-            return_val = fn_arg_class
-
-    fn_string = "using " + callback_name + " = " + return_val + "(*)("
+    callback_returns = callback_typedef.get("returns")
+    if not(callback_returns is None):
+        return_val = resolve_callback_type(api_data, callback_returns["type"], pfx)[1]
 
-    if "fn_args" in callback_typedef.keys():
-        fn_args = callback_typedef["fn_args"]
-        fn_arg_idx = 0
+    fn_args_list = []
+    fn_args = callback_typedef.get("fn_args")
+    if not(fn_args is None):
         for fn_arg in fn_args:
-            fn_arg_type = fn_arg["type"]
-            fn_arg_ref = fn_arg["ref"]
-            search_result = search_for_class_by_class_name(api_data, fn_arg_type)
-            fn_arg_class = fn_arg_type
-            if not(is_primitive_arg(fn_arg_type)):
-                if search_result is None:
-                    print("fn_arg_type " + fn_arg_type + " not found!")
-                fn_arg_class = search_result[1]
-
-            if not(is_primitive_arg(fn_arg_type)):
-                if fn_arg_ref == "ref":
-                    fn_string += pfx + fn_arg_class + "* const"
-                elif fn_arg_ref == "refmut":
-                    fn_string += pfx + fn_arg_class + "* restrict"
-                elif fn_arg_ref == "value":
-                    fn_string += pfx + fn_arg_class
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
-            else:
-                if fn_arg_ref == "ref":
-                    fn_string += "const " + replace_primitive_ctype(fn_arg_class) + "*"
-                elif fn_arg_ref == "refmut":
-                    fn_string += replace_primitive_ctype(fn_arg_class) + "* restrict"
-                elif fn_arg_ref == "value":
-                    fn_string += replace_primitive_ctype(fn_arg_class)
-                else:
-                    raise Exception("wrong fn_arg_ref on " + fn_arg_type)
+            (fn_arg_is_primitive, fn_arg_class) = resolve_callback_type(api_data, fn_arg["type"], pfx)
+            fn_args_list.append(c_callback_arg_type(fn_arg_is_primitive, fn_arg_class, fn_arg["ref"]))
 
-            # fn_string += " "
-            # fn_string += chr(fn_arg_idx + 65)
-            fn_string += ", "
-            fn_arg_idx += 1
-
-        if len(fn_args) > 0:
-            fn_string = fn_string[:-2] # trim last comma
-
-    fn_string += ");"
+    fn_string = "using " + callback_name + " = " + return_val + "(*)(" + ", ".join(fn_args_list) + ");"
 
     return fn_string
 
+# C types for the primitive rust types
+# https://locka99.gitbooks.io/a-guide-to-porting-c-to-rust/content/features_of_rust/types.html
+# C: #include <stdint.h>
+# C++: #include <cstdlib>
+primitive_ctypes = {
+    "*const": "* ", # TODO: figure out proper c semantics - the VALUE is const, not the POINTER!
+    "*mut": "* restrict ",
+    "i8": "int8_t",
+    "u8": "uint8_t",
+    "i16": "int16_t",
+    "u16": "uint16_t",
+    "i32": "int32_t",
+    "i64": "int64_t",
+    "isize": "ssize_t",
+    "u32": "uint32_t",
+    "u64": "uint64_t",
+    "f32": "float",
+    "f64": "double",
+    "usize": "size_t",
+    "c_void": "void",
+}
+
 # returns the C type for the primitive rust type
+@lru_cache(maxsize=None)
 def replace_primitive_ctype(input):
-    # https://locka99.gitbooks.io/a-guide-to-porting-c-to-rust/content/features_of_rust/types.html
     input = input.strip()
-    # C: #include <stdint.h>
-    # C++: #include <cstdlib>
-    switcher = {
-        "*const": "* ", # TODO: figure out proper c semantics - the VALUE is const, not the POINTER!
-        "*mut": "* restrict ",
-        "i8": "int8_t",
-        "u8": "uint8_t",
-        "i16": "int16_t",
-        "u16": "uint16_t",
-        "i32": "int32_t",
-        "i64": "int64_t",
-        "isize": "ssize_t",
-        "u32": "uint32_t",
-        "u64": "uint64_t",
-        "f32": "float",
-        "f64": "double",
-        "usize": "size_t",
-        "c_void": "void",
-    }
-    return switcher.get(input, input + " ")
+    return primitive_ctypes.get(input, input + " ")
+
+# Comments before the function declarations and the constants of the C header
+c_functions_header = "\r\n\r\n/* FUNCTIONS from azul.dll / libazul.so */"
+c_constants_header = "\r\n\r\n/* CONSTANTS */\r\n\r\n"
+
+# Appends the C declarations of the constructors, functions, destructor
+# and deepCopy function of one class to "code"
+def generate_c_class_functions(code, myapi_data, class_name, c, pfx, line_prefix):
+
+    c_is_stack_allocated = class_is_stack_allocated(c)
+    class_can_be_copied = "Copy" in c.get("derive", ())
+    class_has_recursive_destructor = has_recursive_destructor(myapi_data, c)
+    class_has_custom_destructor = c.get("custom_destructor", False)
+    treat_external_as_ptr = "external" in c and c.get("is_boxed_object", False)
+    class_can_be_cloned = c.get("clone", True)
+
+    class_ptr_name = pfx + class_name
+    class_fn_prefix = class_ptr_name + "_"
+
+    constructors = c.get("constructors")
+    if not(constructors is None):
+        for (constructor_name, const) in constructors.items():
+            fn_args = c_fn_args_c_api(const, class_name, class_ptr_name, False)
+            code.append(line_prefix + class_ptr_name + " " + class_fn_prefix + snake_case_to_lower_camel(constructor_name) + "(" + fn_args + ");")
+
+    functions = c.get("functions")
+    if not(functions is None):
+        for (function_name, function) in functions.items():
+            fn_args = c_fn_args_c_api(function, class_name, class_ptr_name, True)
+
+            return_val = "void"
+            fn_returns = function.get("returns")
+            if not(fn_returns is None):
+                analyzed_return_type = analyze_type(fn_returns["type"])
+                if is_primitive_arg(analyzed_return_type[1]):
+                    return_val = replace_primitive_ctype(analyzed_return_type[1])
+                else:
+                    return_val = pfx + analyzed_return_type[1]
+
+            code.append(line_prefix + return_val + " " + class_fn_prefix + snake_case_to_lower_camel(function_name) + "(" + fn_args + ");")
+
+    if c_is_stack_allocated:
+        if class_can_be_copied:
+            # intentionally empty, no destructor necessary
+            pass
+        elif class_has_custom_destructor or treat_external_as_ptr or class_has_recursive_destructor:
+            code.append(line_prefix + "void " + class_fn_prefix + "delete(" + class_ptr_name + "* restrict instance);")
+
+        if treat_external_as_ptr and class_can_be_cloned:
+            code.append(line_prefix + class_ptr_name + " " + class_fn_prefix + "deepCopy(" + class_ptr_name + "* const instance);")
 
 # Generates the functions to put in the C header file
 # assumes that all structs / data types have already been declared previously
 def generate_c_functions(api_data,use_prefix=True,typedef_style="c"):
 
-    code = ""
+    code = []
 
     pfx = prefix
     if not(use_prefix):
@@ -2755,304 +2789,256 @@ def generate_c_functions(api_data,use_prefix=True,typedef_style="c"):
     if typedef_style == "cpp":
         function_prefix = ""
 
-    version = list(api_data.keys())[-1]
-    myapi_data = api_data[version]
-
-    code += "\r\n"
-    code += "\r\n/* FUNCTIONS from azul.dll / libazul.so */"
-
-    for module_name in myapi_data.keys():
-        module = myapi_data[module_name]["classes"]
-        for class_name in module.keys():
-            c = module[class_name]
-
-            c_is_stack_allocated = class_is_stack_allocated(c)
-            class_can_be_copied = "derive" in c.keys() and "Copy" in c["derive"]
-            class_has_recursive_destructor = has_recursive_destructor(myapi_data, c)
-            class_has_custom_destructor = "custom_destructor" in c.keys() and c["custom_destructor"]
-            is_boxed_object = "is_boxed_object" in c.keys() and c["is_boxed_object"]
-            treat_external_as_ptr = "external" in c.keys() and is_boxed_object
-            class_can_be_cloned = True
-            if "clone" in c.keys():
-                class_can_be_cloned = c["clone"]
-
-            class_ptr_name = pfx + class_name
-            print_separator = False
-
-            if "constructors" in c.keys():
-                print_separator = True
-                for constructor_name in c["constructors"].keys():
-                    const = c["constructors"][constructor_name]
-                    fn_args = c_fn_args_c_api(const, class_name, class_ptr_name, False)
-                    code += "\r\n" + function_prefix + class_ptr_name + " " + class_ptr_name + "_" + snake_case_to_lower_camel(constructor_name) + "(" + fn_args + ");"
-
-            if "functions" in c.keys():
-                print_separator = True
-                for function_name in c["functions"].keys():
-                    function = c["functions"][function_name]
-                    fn_args = c_fn_args_c_api(function, class_name, class_ptr_name, True)
-
-                    return_val = "void"
-                    if "returns" in function.keys():
-                        analyzed_return_type = analyze_type(function["returns"]["type"])
-                        if is_primitive_arg(analyzed_return_type[1]):
-                            return_val = replace_primitive_ctype(analyzed_return_type[1])
-                        else:
-                            return_val = pfx + analyzed_return_type[1]
-
-                    code += "\r\n" + function_prefix + return_val + " "+ class_ptr_name + "_" + snake_case_to_lower_camel(function_name) + "(" + fn_args + ");"
-
-            if c_is_stack_allocated:
-                if class_can_be_copied:
-                    # intentionally empty, no destructor necessary
-                    pass
-                elif class_has_custom_destructor or treat_external_as_ptr or class_has_recursive_destructor:
-                    print_separator = True
-                    code += "\r\n" + function_prefix + "void " + class_ptr_name + "_delete(" + class_ptr_name + "* restrict instance);"
-
-                if treat_external_as_ptr and class_can_be_cloned:
-                    print_separator = True
-                    code += "\r\n" + function_prefix + class_ptr_name + " " + class_ptr_name + "_deepCopy(" + class_ptr_name + "* const instance);"
-
-            # if print_separator:
-            #   code += "\r\n"
-
-    return code
-
-# Generates all constants
-def generate_c_constants(api_data):
-
-    version = list(api_data.keys())[-1]
-    myapi_data = api_data[version]
-
-    code = ""
-    code += "\r\n"
-    code += "\r\n/* CONSTANTS */\r\n\r\n"
-
-    for module_name in myapi_data.keys():
-        module = myapi_data[module_name]["classes"]
-        for class_name in module.keys():
-            c = module[class_name]
-
-            if "constants" in c.keys():
-                for constant in c["constants"]:
-                    constant_name = list(constant.keys())[0]
-                    constant_type = constant[constant_name]["type"]
-                    constant_value = constant[constant_name]["value"]
-                    code += "#define " + prefix + class_name + "_" + constant_name + " " + constant_value + "\r\n"
-                code += "\r\n"
-
-    return code
-
-# Generates extra functions for C to destructure tagged union enums
-def generate_c_extra_functions(api_data):
-
-    version = list(api_data.keys())[-1]
+    version = get_latest_version(api_data)
     myapi_data = api_data[version]
 
-    code = ""
-
-    for module_name in myapi_data.keys():
-        module = myapi_data[module_name]["classes"]
-        for class_name in module.keys():
-            c = module[class_name]
-            e = False
-
-            if "enum_fields" in c.keys():
-                if enum_is_union(c["enum_fields"]):
-                    e = True
-
-            if not(e):
-                continue
-
-            # generate _matchRef and _matchMut functions for each variant in the enum
-            for variant in c["enum_fields"]:
-                variant_name = list(variant.keys())[0]
-                if "type" in variant[variant_name]:
-                    type_name = variant[variant_name]["type"]
-
-                    code += "bool " + prefix + class_name + "_matchRef" + variant_name + "(const " + prefix + class_name + "* value, const " + prefix + type_name + "** restrict out) {\r\n"
-                    code += "    const " + prefix + class_name + "Variant_" + variant_name + "* casted = (const " + prefix + class_name +"Variant_" + variant_name + "*)value;\r\n"
-                    code += "    bool valid = casted->tag == " + prefix + class_name + "Tag_" + variant_name + ";\r\n"
-                    code += "    if (valid) { *out = &casted->payload; } else { *out = 0; }\r\n"
-                    code += "    return valid;\r\n"
-                    code += "}\r\n\r\n"
-
-                    code += "bool " + prefix + class_name + "_matchMut" + variant_name + "(" + prefix + class_name + "* restrict value, " + prefix + type_name + "* restrict * restrict out) {\r\n"
-                    code += "    " + prefix + class_name + "Variant_" + variant_name + "* restrict casted = (" + prefix + class_name +"Variant_" + variant_name + "* restrict)value;\r\n"
-                    code += "    bool valid = casted->tag == " + prefix + class_name + "Tag_" + variant_name + ";\r\n"
-                    code += "    if (valid) { *out = &casted->payload; } else { *out = 0; }\r\n"
-                    code += "    return valid;\r\n"
-                    code += "}\r\n\r\n"
-
-    return code
-
-def generate_c_api(api_data, structs_map):
-    code = ""
+    # "\r\nextern DLLIMPORT " before each declaration
+    line_prefix = "\r\n" + function_prefix
+
+    code.append(c_functions_header)
+
+    for module in myapi_data.values():
+        for (class_name, c) in module["classes"].items():
+            generate_c_class_functions(code, myapi_data, class_name, c, pfx, line_prefix)
+
+    return "".join(code)
+
+# Appends the #defines for the constants of one class to "code"
+def generate_c_class_constants(code, class_name, c):
+    constants = c.get("constants")
+    if constants is None:
+        return
+
+    for constant in constants:
+        constant_name = next(iter(constant))
+        constant_value = constant[constant_name]["value"]
+        code.append("#define " + prefix + class_name + "_" + constant_name + " " + constant_value + "\r\n")
+    code.append("\r\n")
+
+# Appends the extra functions for C to destructure a tagged union enum to "code",
+# (_matchRef and _matchMut for each variant), does nothing for other classes
+def generate_c_class_match_functions(code, class_name, c):
+    enum_fields = c.get("enum_fields")
+    if enum_fields is None or not(enum_is_union(enum_fields)):
+        return
+
+    class_ptr_name = prefix + class_name
+
+    for variant in enum_fields:
+        variant_name = next(iter(variant))
+        if "type" in variant[variant_name]:
+            type_ptr_name = prefix + variant[variant_name]["type"]
+            variant_ptr_name = class_ptr_name + "Variant_" + variant_name
+            # "bool valid = ..." and the rest of the function body, shared by _matchRef and _matchMut
+            match_fn_body = (
+                "    bool valid = casted->tag == " + class_ptr_name + "Tag_" + variant_name + ";\r\n"
+                "    if (valid) { *out = &casted->payload; } else { *out = 0; }\r\n"
+                "    return valid;\r\n"
+                "}\r\n\r\n"
+            )
+
+            code.append("bool " + class_ptr_name + "_matchRef" + variant_name + "(const " + class_ptr_name + "* value, const " + type_ptr_name + "** restrict out) {\r\n")
+            code.append("    const " + variant_ptr_name + "* casted = (const " + variant_ptr_name + "*)value;\r\n")
+            code.append(match_fn_body)
+
+            code.append("bool " + class_ptr_name + "_matchMut" + variant_name + "(" + class_ptr_name + "* restrict value, " + type_ptr_name + "* restrict * restrict out) {\r\n")
+            code.append("    " + variant_ptr_name + "* restrict casted = (" + variant_ptr_name + "* restrict)value;\r\n")
+            code.append(match_fn_body)
+
+# Start of the C header: include guard, includes and portability defines
+c_header_preamble = (
+    "#ifndef AZUL_H\r\n"
+    "#define AZUL_H\r\n"
+    "\r\n"
+    "#include <stdbool.h>\r\n" # bool
+    "#include <stdint.h>\r\n" # uint8_t, ...
+    "#include <stddef.h>\r\n" # size_t
+    "\r\n"
+    "/* C89 port for \"restrict\" keyword from C99 */\r\n"
+    "#if __STDC__ != 1\r\n"
+    "#    define restrict __restrict\r\n"
+    "#else\r\n"
+    "#    ifndef __STDC_VERSION__\r\n"
+    "#        define restrict __restrict\r\n"
+    "#    else\r\n"
+    "#        if __STDC_VERSION__ < 199901L\r\n"
+    "#            define restrict __restrict\r\n"
+    "#        endif\r\n"
+    "#    endif\r\n"
+    "#endif\r\n"
+    "\r\n"
+    "/* cross-platform define for ssize_t (signed size_t) */\r\n"
+    "#ifdef _WIN32\r\n"
+    "    #include <windows.h>\r\n"
+    "    #ifdef _MSC_VER\r\n"
+    "        typedef SSIZE_T ssize_t;\r\n"
+    "    #endif\r\n"
+    "#else\r\n"
+    "    #include <sys/types.h>\r\n"
+    "#endif\r\n"
+    "\r\n"
+    "/* cross-platform define for __declspec(dllimport) */\r\n"
+    "#ifdef _WIN32\r\n"
+    "    #define DLLIMPORT __declspec(dllimport)\r\n"
+    "#else\r\n"
+    "    #define DLLIMPORT\r\n"
+    "#endif\r\n"
+    "\r\n"
+)
+
+# Start of the C++ header
+cpp_header_preamble = (
+    "#ifndef AZUL_H\r\n"
+    "#define AZUL_H\r\n"
+    "\r\n"
+    "namespace dll {\r\n"
+    "\r\n"
+    "    #include <cstdint>\r\n" # uint8_t, ...
+    "    #include <cstddef>\r\n" # size_t
+)
+
+# Generates the api/c/azul.h header, writing it to "out"
+#
+# "sorted_structs" is the result of sort_structs_map(), shared with generate_cpp_api
+def generate_c_api(out, api_data, sorted_structs):
 
-    version = list(api_data.keys())[-1]
+    version = get_latest_version(api_data)
     myapi_data = api_data[version]
 
-    structs_map = sort_structs_map(myapi_data, structs_map)
-    extra_forward_delcarations = structs_map[2]
-    forward_delcarations = structs_map[1]
-    structs_map = structs_map[0]
-
-    code += "#ifndef AZUL_H\r\n"
-    code += "#define AZUL_H\r\n"
-    code += "\r\n"
-    code += "#include <stdbool.h>\r\n" # bool
-    code += "#include <stdint.h>\r\n" # uint8_t, ...
-    code += "#include <stddef.h>\r\n" # size_t
-    code += "\r\n"
-    code += "/* C89 port for \"restrict\" keyword from C99 */\r\n"
-    code += "#if __STDC__ != 1\r\n"
-    code += "#    define restrict __restrict\r\n"
-    code += "#else\r\n"
-    code += "#    ifndef __STDC_VERSION__\r\n"
-    code += "#        define restrict __restrict\r\n"
-    code += "#    else\r\n"
-    code += "#        if __STDC_VERSION__ < 199901L\r\n"
-    code += "#            define restrict __restrict\r\n"
-    code += "#        endif\r\n"
-    code += "#    endif\r\n"
-    code += "#endif\r\n"
-    code += "\r\n"
-    code += "/* cross-platform define for ssize_t (signed size_t) */\r\n"
-    code += "#ifdef _WIN32\r\n"
-    code += "    #include <windows.h>\r\n"
-    code += "    #ifdef _MSC_VER\r\n"
-    code += "        typedef SSIZE_T ssize_t;\r\n"
-    code += "    #endif\r\n"
-    code += "#else\r\n"
-    code += "    #include <sys/types.h>\r\n"
-    code += "#endif\r\n"
-    code += "\r\n"
-    code += "/* cross-platform define for __declspec(dllimport) */\r\n"
-    code += "#ifdef _WIN32\r\n"
-    code += "    #define DLLIMPORT __declspec(dllimport)\r\n"
-    code += "#else\r\n"
-    code += "    #define DLLIMPORT\r\n"
-    code += "#endif\r\n"
-    code += "\r\n"
-
-    code += generate_c_structs(myapi_data, structs_map, forward_delcarations, extra_forward_delcarations)
-    code += generate_c_union_macros_and_vec_constructors(api_data, structs_map)
-    code += generate_c_functions(api_data)
-    code += generate_c_constants(api_data)
-    code += generate_c_extra_functions(api_data)
-
-    code += "\r\n"
-    code += read_file(root_folder + "/api/_patches/c/patch.h")
-    code += "\r\n"
-    code += "\r\n#endif /* AZUL_H */\r\n"
+    structs_map = sorted_structs[0]
+    forward_delcarations = sorted_structs[1]
+    extra_forward_delcarations = sorted_structs[2]
+
+    out.write(c_header_preamble)
+
+    out.write(generate_c_structs(myapi_data, structs_map, forward_delcarations, extra_forward_delcarations))
+    out.write(generate_c_union_macros_and_vec_constructors(api_data, structs_map))
+
+    # functions, constants and the _match functions of the tagged unions, in one pass over the classes
+    functions_code = [c_functions_header]
+    constants_code = [c_constants_header]
+    match_functions_code = []
+    for module in myapi_data.values():
+        for (class_name, c) in module["classes"].items():
+            generate_c_class_functions(functions_code, myapi_data, class_name, c, prefix, "\r\nextern DLLIMPORT ")
+            generate_c_class_constants(constants_code, class_name, c)
+            generate_c_class_match_functions(match_functions_code, class_name, c)
+
+    out.writelines(functions_code)
+    out.writelines(constants_code)
+    out.writelines(match_functions_code)
+
+    out.write("\r\n")
+    out.write(read_file(root_folder + "/api/_patches/c/patch.h"))
+    out.write("\r\n")
+    out.write("\r\n#endif /* AZUL_H */\r\n")
+
+# start of every non-empty line, used to indent the generated C code inside the C++ namespace
+line_start_regex = re.compile(r"^(?!\Z)", re.MULTILINE)
+
+# Indents every line of the (\r\n-terminated) code by "indent", ending it with a newline
+def indent_code(code, indent):
+    code = line_start_regex.sub(indent, code)
+    if code and not(code.endswith("\n")):
+        code += "\r\n"
     return code
 
-def generate_cpp_api(api_data, structs_map):
-    code = ""
+# Generates the api/cpp/azul.hpp header, writing it to "out"
+#
+# "stripped_structs" is the sorted struct map with the prefix stripped from
+# the struct entries (not necessary for the C++ API, only for function names),
+# see strip_all_prefixes()
+def generate_cpp_api(out, api_data, stripped_structs):
 
-    version = list(api_data.keys())[-1]
+    version = get_latest_version(api_data)
     myapi_data = api_data[version]
 
-    structs_map = sort_structs_map(myapi_data, structs_map)
-    extra_forward_delcarations = structs_map[2]
-    forward_delcarations = structs_map[1]
-    structs_map = structs_map[0]
-
-    code += "#ifndef AZUL_H\r\n"
-    code += "#define AZUL_H\r\n"
-    code += "\r\n"
-    code += "namespace dll {\r\n"
-    code += "\r\n"
-    code += "    #include <cstdint>\r\n" # uint8_t, ...
-    code += "    #include <cstddef>\r\n" # size_t
+    structs_map = stripped_structs[0]
+    forward_delcarations = stripped_structs[1]
+    extra_forward_delcarations = stripped_structs[2]
 
-    # strip the prefix from the struct entries
-    # (not necessary for the C++ API, only for function names)
-    # this could've been done cleaner
-    stripped = strip_all_prefixes(structs_map, forward_delcarations, extra_forward_delcarations)
-    structs_map = stripped[0]
-    forward_delcarations = stripped[1]
-    extra_forward_delcarations = stripped[2]
+    out.write(cpp_header_preamble)
 
     # add structs, no prefix, use C++ style function pointer typedefs
     c_struct_code = generate_c_structs(myapi_data, structs_map, forward_delcarations, extra_forward_delcarations, use_prefix=False,typedef_style="cpp")
-    for line in c_struct_code.splitlines():
-        code += "    " + line + "\r\n"
-    code += "\r\n"
+    out.write(indent_code(c_struct_code, "    "))
+    out.write("\r\n")
 
-    code += "    extern \"C\" {"
+    out.write("    extern \"C\" {")
     c_functions_code = generate_c_functions(api_data,use_prefix=False,typedef_style="cpp")
-    for line in c_functions_code.splitlines():
-        code += "        " + line + "\r\n"
-    code += "\r\n"
-    code += "    } /* extern \"C\" */\r\n"
-    code += "\r\n"
-
-    code += "} /* namespace */ \r\n"
+    out.write(indent_code(c_functions_code, "        "))
+    out.write("\r\n")
+    out.write("    } /* extern \"C\" */\r\n")
+    out.write("\r\n")
 
+    out.write("} /* namespace */ \r\n")
 
-    code += "\r\n"
-    code += "\r\n#endif /* AZUL_H */\r\n"
 
-    return code
+    out.write("\r\n")
+    out.write("\r\n#endif /* AZUL_H */\r\n")
 
 def strip_all_prefixes(structs_map, forward_delcarations, extra_forward_delcarations):
 
     # strip structs_map
     new_structs_map = OrderedDict({})
-    for key in structs_map.keys():
-        value = structs_map[key]
-        key = key[len(prefix):]
-        new_structs_map[key] = value
+    for (key, value) in structs_map.items():
+        new_structs_map[key[len(prefix):]] = value
 
     # strip forward_delcarations
     new_forward_delcarations = OrderedDict({})
-    for key in forward_delcarations.keys():
-        value = forward_delcarations[key]
-        key = key[len(prefix):]
-        new_forward_delcarations[key] = value
+    for (key, value) in forward_delcarations.items():
+        new_forward_delcarations[key[len(prefix):]] = value
 
     new_extra_forward_delcarations = OrderedDict({})
-    for key in extra_forward_delcarations.keys():
-        value = extra_forward_delcarations[key]
-        key = key[len(prefix):]
-        new_extra_forward_delcarations[key] = value
+    for (key, value) in extra_forward_delcarations.items():
+        new_extra_forward_delcarations[key[len(prefix):]] = value
 
     return [new_structs_map, new_forward_delcarations, new_extra_forward_delcarations]
 
 # generate a test function that asserts that the struct layout in the DLL
 # is the same as in the generated bindings
+# static parts of the layout test module, generated into the azul-dll/src/lib.rs
+size_test_header = (
+    "#[cfg(all(test, not(feature = \"rlib\")))]\r\n"
+    "#[allow(dead_code)]\r\n"
+    "mod test_sizes {\r\n"
+)
+size_test_fn_header = (
+    "    use core::ffi::c_void;\r\n"
+    "    use azul_impl::css::*;\r\n"
+    "\r\n"
+    "    #[test]\r\n"
+    "    fn test_size() {\r\n"
+    "         use core::alloc::Layout;\r\n"
+)
+size_test_footer = (
+    "    }\r\n"
+    "}\r\n"
+)
+
+# asserts that the generated struct has the same layout as the struct it wraps
+size_test_assert_template = Template(
+    "        assert_eq!((Layout::new::<$external>(), \"$struct_name\"), (Layout::new::<$struct_name>(), \"$struct_name\"));\r\n"
+)
+
 def generate_size_test(api_data, structs_map):
 
     generated_structs = generate_structs(api_data, structs_map, False)
 
-    test_str = ""
-
-    test_str += "#[cfg(all(test, not(feature = \"rlib\")))]\r\n"
-    test_str += "#[allow(dead_code)]\r\n"
-    test_str += "mod test_sizes {\r\n"
-
-    test_str += read_file(root_folder + "/api/_patches/azul-dll/test-sizes.rs")
-
-    test_str += generated_structs
-    test_str += "    use core::ffi::c_void;\r\n"
-    test_str += "    use azul_impl::css::*;\r\n"
-    test_str += "\r\n"
-
-    test_str += "    #[test]\r\n"
-    test_str += "    fn test_size() {\r\n"
-    test_str += "         use core::alloc::Layout;\r\n"
+    test_str = [
+        size_test_header,
+        read_file(root_folder + "/api/_patches/azul-dll/test-sizes.rs"),
+        generated_structs,
+        size_test_fn_header,
+    ]
 
-    for struct_name in structs_map.keys():
-        struct = structs_map[struct_name]
-        if "external" in struct.keys():
-            external_path = struct["external"]
-            test_str += "        assert_eq!((Layout::new::<" + external_path + ">(), \"" + struct_name +  "\"), (Layout::new::<" + struct_name + ">(), \"" + struct_name +  "\"));\r\n"
+    for (struct_name, struct) in structs_map.items():
+        external_path = struct.get("external")
+        if not(external_path is None):
+            test_str.append(size_test_assert_template.substitute(external=external_path, struct_name=struct_name))
 
-    test_str += "    }\r\n"
-    test_str += "}\r\n"
-    return test_str
+    test_str.append(size_test_footer)
+    return "".join(test_str)
 
 # ---------------------------
 
@@ -3062,38 +3048,102 @@ def verify_clang_is_installed():
 
 def cleanup_start():
     # TODO: remove entire /api folder and re-generate it?
-    files = ["azul.dll", "azul.sh", "azul.dylib"]
-
-    for f in files:
-        if os.path.exists(root_folder + "/target/debug/examples/" + f):
-            remove_path(root_folder + "/target/debug/examples/" + f)
-
-        if os.path.exists(root_folder + "/target/release/examples/" + f):
-            remove_path(root_folder + "/target/release/examples/" + f)
-
-        if os.path.exists(root_folder + "/target/debug/" + f):
-            remove_path(root_folder + "/target/debug/" + f)
+    files = set(["azul.dll", "azul.sh", "azul.dylib"])
 
-        if os.path.exists(root_folder + "/target/release/" + f):
-            remove_path(root_folder + "/target/release/" + f)
+    # one directory listing per target folder instead of a stat() per file
+    for folder in ["/target/debug/examples/", "/target/release/examples/", "/target/debug/", "/target/release/"]:
+        if not(os.path.isdir(root_folder + folder)):
+            continue
+        with os.scandir(root_folder + folder) as entries:
+            matches = [entry.path for entry in entries if entry.name in files]
+        for path in matches:
+            remove_path(path)
 
     # if (len(os.environ.get('AZUL_INSTALL_DIR', '')) > 0):
     #     if os.path.exists(os.environ['AZUL_INSTALL_DIR']):
     #         remove_path(os.environ['AZUL_INSTALL_DIR'])
 
+# Files written by generate_api(), relative to the root folder
+api_output_files = [
+    "/azul-dll/src/lib.rs",
+    "/api/rust/src/lib.rs",
+    "/api/c/azul.h",
+    "/azul-dll/src/python.rs",
+    "/api/cpp/azul.hpp",
+]
+
+# The generated files are cached in target/codegen-cache/<hash of the inputs>/
+codegen_cache_folder = root_folder + "/target/codegen-cache"
+
+# Hashes everything the generated API depends on: the api.json,
+# the LICENSE, the patch files and the generator itself (this file)
+def get_api_input_hash():
+    input_files = [root_folder + "/api.json", root_folder + "/LICENSE", os.path.abspath(__file__)]
+    for (dirpath, dirnames, filenames) in os.walk(root_folder + "/api/_patches"):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            input_files.append(os.path.join(dirpath, filename))
+
+    h = hashlib.blake2b()
+    for path in input_files:
+        h.update(os.path.relpath(path, root_folder).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# Removes all cache entries except the one for the current inputs
+def prune_codegen_cache(input_hash):
+    if not(os.path.exists(codegen_cache_folder)):
+        return
+    with os.scandir(codegen_cache_folder) as entries:
+        for entry in entries:
+            if entry.name != input_hash:
+                remove_path(entry.path)
+
 def generate_api():
+    input_hash = get_api_input_hash()
+    prune_codegen_cache(input_hash)
+    cache_folder = codegen_cache_folder + "/" + input_hash
+    if all(os.path.exists(cache_folder + path) for path in api_output_files):
+        print("API inputs unchanged, using cached files from " + cache_folder)
+        for path in api_output_files:
+            copy_file(cache_folder + path, root_folder + path)
+        return
+
+    generate_api_files()
+
+    # the entry is copied into a temporary folder and renamed into place, so that
+    # an interrupted copy can't leave truncated files that look like a cache hit
+    for path in api_output_files:
+        os.makedirs(os.path.dirname(cache_folder + ".tmp" + path), exist_ok=True)
+        copy_file(root_folder + path, cache_folder + ".tmp" + path)
+    if os.path.exists(cache_folder):
+        remove_path(cache_folder)
+    os.replace(cache_folder + ".tmp", cache_folder)
+
+def generate_api_files():
     apiData = read_api_file(root_folder + "/api.json")
     rust_dll_result = generate_rust_dll(apiData)
 
-    structs_map = rust_dll_result[1].copy()
+    structs_map = rust_dll_result[1]
     functions_map = rust_dll_result[2]
     forward_declarations = rust_dll_result[3]
 
+    # the generators don't add or remove entries, so they can all share the maps
+    # (the python generator only sets "extra_derive" on the classes):
+    # the C and C++ headers only need to be sorted (and stripped) once
+    sorted_structs = sort_structs_map(apiData[get_latest_version(apiData)], structs_map)
+    stripped_structs = strip_all_prefixes(*sorted_structs)
+
     write_file(rust_dll_result[0], root_folder + "/azul-dll/src/lib.rs")
-    write_file(generate_rust_api(apiData, structs_map, functions_map.copy()), root_folder + "/api/rust/src/lib.rs")
-    write_file(generate_c_api(apiData, structs_map), root_folder + "/api/c/azul.h")
-    write_file(generate_python_api(apiData, structs_map, functions_map.copy()), root_folder + "/azul-dll/src/python.rs")
-    write_file(generate_cpp_api(apiData, structs_map), root_folder + "/api/cpp/azul.hpp")
+    with open(root_folder + "/api/rust/src/lib.rs", "w+", newline='', buffering=1 << 20) as rust_file:
+        generate_rust_api(rust_file, apiData, structs_map, functions_map)
+    with open(root_folder + "/api/c/azul.h", "w+", newline='', buffering=1 << 20) as c_file:
+        generate_c_api(c_file, apiData, sorted_structs)
+    with open(root_folder + "/azul-dll/src/python.rs", "w+", newline='', buffering=1 << 20) as python_file:
+        generate_python_api(python_file, apiData, structs_map, functions_map)
+    with open(root_folder + "/api/cpp/azul.hpp", "w+", newline='', buffering=1 << 20) as cpp_file:
+        generate_cpp_api(cpp_file, apiData, stripped_structs)
 
 # Build the library with release settings
 def build_dll():
@@ -3163,19 +3213,42 @@ def build_examples():
         subprocess.Popen(['cargo', 'run', '--release', '--bin', e], cwd=cwd).wait()
     pass
 
+# Crates published on crates.io, in the order of their dependencies
+release_crates = [
+    "azul-css",
+    "azul-css-parser",
+    "azul-core",
+    "azul-text-layout",
+    "azulc",
+    "azul-layout",
+    "azul-desktop",
+    "azul-web",
+    "azul-dll",
+    "azul",
+    "azul-widgets",
+]
+
 def release_on_cargo():
-    # Publish packages in the correct order of dedpendencies
-    os.system("cd \"" + root_folder + "/azul-css\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-css-parser\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-core\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-text-layout\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azulc\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-layout\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-desktop\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-web\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-dll\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul\" && cargo check && cargo test && cargo publish")
-    os.system("cd \"" + root_folder + "/azul-widgets\" && cargo check && cargo test && cargo publish")
+    crates = [crate for crate in release_crates if os.path.exists(root_folder + "/" + crate)]
+
+    # The crates are members of the same cargo workspace and share its target directory
+    # (and its lock), so separate cargo processes per crate would only wait for each other:
+    # check and test all crates in one cargo invocation instead, which builds the shared
+    # dependencies once and compiles independent crates in parallel
+    #
+    # NOTE: the release is all-or-nothing: if the check or the tests of any crate
+    # fail, no crate is published (previously only the failing crate was skipped)
+    packages = " ".join(["-p " + crate for crate in crates])
+    if os.system("cd \"" + root_folder + "\" && cargo check " + packages + " && cargo test " + packages) != 0:
+        print("cargo check / cargo test failed, not publishing any crates")
+        return
+
+    # Publish packages in the correct order of dedpendencies,
+    # stop at the first failure so that no dependent crate is published without it
+    for crate in crates:
+        if os.system("cd \"" + root_folder + "/" + crate + "\" && cargo publish") != 0:
+            print("cargo publish failed for " + crate + ", not publishing the remaining crates")
+            return
 
 def make_debian_release_package():
     # copy the files such that file is Debian deploy-able
@@ -3185,54 +3258,406 @@ def make_release_zip_files():
     # Generate the [arch]-*x86_64, [arch]-*i686 etc. ZIP files
     pass
 
-def replace_split(d, search, tag):
-
-    newdoc = ""
-
-    split = d.split(search)
-
-    index = 0
-    while index < len(split):
-        if index % 2 == 0:
-            newdoc += split[index]
-        else:
-            newdoc += "<" + tag + ">" + split[index] + "</" + tag + ">"
-        index += 1
-
-    return newdoc
+# `code` and **strong** spans in the api.json docs, an unterminated span runs until the end of the doc
+doc_code_regex = re.compile(r"`([^`]*)`?")
+doc_strong_regex = re.compile(r"\*\*(.*?)(?:\*\*|\Z)", re.DOTALL)
 
+@lru_cache(maxsize=None)
 def format_doc(docstring):
     newdoc = docstring
     newdoc = newdoc.replace("<", "&lt;")
     newdoc = newdoc.replace(">", "&gt;")
     newdoc = newdoc.replace("```rust", "<code>")
     newdoc = newdoc.replace("```", "</code>")
-    newdoc = replace_split(newdoc, "`", "code")
-    newdoc = replace_split(newdoc, "**", "strong")
+    newdoc = doc_code_regex.sub(r"<code>\1</code>", newdoc)
+    newdoc = doc_strong_regex.sub(r"<strong>\1</strong>", newdoc)
     newdoc = newdoc.replace("\r\n", "<br/>")
     return newdoc
 
+# HTML escapes for the code / descriptions of the examples on the index page
+example_html_escapes = str.maketrans({"<": "&lt;", ">": "&gt;"})
+example_code_escapes = str.maketrans({"<": "&lt;", ">": "&gt;", "\"": "&quot;", "\n": "<br/>", " ": "&nbsp;"})
+example_description_escapes = str.maketrans({"\"": "&quot;", "\n": None, "#": "&pound;"})
+
 def render_example_description(descr, replace=True):
     descr = descr.strip()
     if replace:
-        descr = descr.replace("\"", "&quot;")
-        descr = descr.replace("\n", "")
-        descr = descr.replace("\r\n", "")
-        descr = descr.replace("#", "&pound;")
+        descr = descr.translate(example_description_escapes)
     return descr
 
 def render_example_code(jsex, replace=True):
-    jsex = jsex.replace(">", "&gt;")
-    jsex = jsex.replace("<", "&lt;")
     if replace:
-        # jsex = jsex.replace("#", "%23")
-        jsex = jsex.replace("\"", "&quot;")
-        jsex = jsex.replace("\n", "<br/>")
-        jsex = jsex.replace("\r\n", "<br/>")
-        jsex = jsex.replace(" ", "&nbsp;")
+        # note: "#" is not escaped to "%23"
+        jsex = jsex.translate(example_code_escapes)
+    else:
+        jsex = jsex.translate(example_html_escapes)
     jsex = jsex.strip()
     return jsex
 
+# (language, file extension) of the example code shown on the index page
+example_languages = [("c", "c"), ("cpp", "cpp"), ("rust", "rs"), ("python", "py")]
+
+# Renders the code of one example for each language in /examples,
+# returns {"code:c": ..., "code:cpp": ..., "code:rust": ..., "code:python": ...}
+#
+# NOTE: the result is cached, callers must copy it (i.e. **render_example_code_files(...))
+@lru_cache(maxsize=None)
+def render_example_code_files(example_name):
+    code = {}
+    for (language, extension) in example_languages:
+        code["code:" + language] = render_example_code(read_file(root_folder + "/examples/" + language + "/" + example_name + "." + extension))
+    return code
+
+# (source, destination in /target/html) of the static files of the website
+docs_static_files = [
+    ("/api/_patches/html/logo.svg", "/logo.svg"),
+    ("/api/_patches/html/fleur-de-lis.svg", "/images/fleur-de-lis.svg"),
+    ("/api/_patches/html/main.css", "/main.css"),
+    ("/examples/assets/fonts/Morris Jenson Initialen.ttf", "/fonts/Morris Jenson Initialen.ttf"),
+    ("/examples/assets/fonts/SourceSerifPro-Regular.ttf", "/fonts/SourceSerifPro-Regular.ttf"),
+]
+
+# $$PLACEHOLDER$$ in the html templates
+html_placeholder_regex = re.compile(r"\$\$([A-Z_]+)\$\$")
+
+# Splits the html template into [text, placeholder name, text, placeholder name, ..., text]
+# once, so that filling in a page only has to join the parts instead of searching the template
+@lru_cache(maxsize=None)
+def compile_html_template(html_template):
+    return tuple(html_placeholder_regex.split(html_template))
+
+# Replaces all $$PLACEHOLDER$$ in the html template,
+# placeholders that are not in "values" are kept as they are
+def fill_html_template(html_template, values):
+    parts = list(compile_html_template(html_template))
+    for i in range(1, len(parts), 2):
+        parts[i] = values.get(parts[i], "$$" + parts[i] + "$$")
+    return "".join(parts)
+
+# Writes the html template with the $$PLACEHOLDER$$ filled in to "path", a value can also
+# be a list of fragments, which are written one by one instead of joining the page first
+def write_html_page(path, html_template, values):
+    parts = compile_html_template(html_template)
+    with open(path, "w+", newline='', buffering=1 << 20) as out:
+        for i in range(len(parts)):
+            if i % 2 == 0:
+                out.write(parts[i])
+                continue
+            value = values.get(parts[i], "$$" + parts[i] + "$$")
+            if type(value) is list:
+                out.writelines(value)
+            else:
+                out.write(value)
+
+# Fills in the sidebars of the html_template - they are the same for every
+# page of a section, so only the title and the content are left to fill in per page
+def fill_html_sidebars(html_template, sidebar_guide, sidebar_releases, sidebar_api):
+    return fill_html_template(html_template, {
+        "SIDEBAR_GUIDE": sidebar_guide,
+        "SIDEBAR_RELEASES": sidebar_releases,
+        "SIDEBAR_API": sidebar_api,
+    })
+
+# extra CSS of the guide pages and of the api reference pages
+guide_extra_css = """
+        main > div { max-width: 80ch; }
+        main > div > p { margin-left: 10px; margin-top: 10px; }
+        main p, main a, main strong { font-family: "Source Serif Pro", serif; font-size: 16px; }
+        main > div > h3 { margin: 10px; }
+        main .warning h4 { margin-bottom: 10px; }
+        main .warning {
+            padding: 10px;
+            border-radius: 5px;
+            border: 1px dashed #facb26;
+            margin: 10px;
+            background: #fff8be;
+            color: #222;
+            box-shadow: 0px 0px 20px #facb2655;
+        }
+        main code.expand { display: block; margin-top: 20px; padding: 10px; border-radius: 5px; }
+        """
+api_extra_css = "\
+        body > .center > main > div > ul * { font-size: 12px; font-weight: normal; list-style-type: none; font-family: monospace; }\
+        body > .center > main > div > ul > li ul { margin-left: 20px; }\
+        body > .center > main > div > ul > li.m { margin-top: 40px; margin-bottom: 20px; }\
+        body > .center > main > div > ul > li.m > ul > li { margin-bottom: 15px; }\
+        body > .center > main > div > ul > li.m > ul > li.st.e { color: #2b6a2d; }\
+        body > .center > main > div > ul > li.m > ul > li.st.s { color: #905; }\
+        body > .center > main > div > ul > li.m > ul > li.fnty,\
+        body > .center > main > div > ul > li.m > ul > li .arg { color: #4c1c1a; }\
+        body > .center > main > div > ul > li.m > ul > li.st .f { margin-left: 20px; }\
+        body > .center > main > div > ul > li.m > ul > li.st .v.doc { margin-left: 20px; }\
+        body > .center > main > div > ul > li.m > ul > li.st .cn { margin-left: 20px; color: #07a; }\
+        body > .center > main > div > ul > li.m > ul > li.st .fn { margin-left: 20px; color: #004e92; }\
+        body > .center > main > div > ul > li.m > ul > li p.ret,\
+        body > .center > main > div > ul > li.m > ul > li p.fn.ret,\
+        body > .center > main > div > ul > li.m > ul > li p.ret.doc { margin-left: 0px; }\
+        body > .center > main > div p.doc { margin-top: 5px !important; color: black !important; max-width: 70ch !important; font-weight: bolder; }\
+        body > .center > main > div a { color: inherit !important; }\
+        "
+
+# HTML fragments of the api reference pages
+api_doc_type_link_template = Template("$starts<a href=\"#st.$name\">$name</a>$ends")
+api_doc_arg_template = Template("<li><p class=\"arg\">arg $arg_name: $arg_type</p></li>")
+api_doc_return_template = Template("<p class=\"$kind ret\">-&gt;&nbsp;$return_type</p>")
+# start of an enum / struct / fnptr entry, the entry is left open for the fields
+api_doc_class_template = Template(
+    "<li class=\"$li_class\" id=\"st.$class_name\">"
+    "$class_doc"
+    "<h4>$keyword <a href=\"#$anchor.$class_name\">$class_name</a>$destructor_warning</h4>"
+)
+# start of a constructor / function entry, the argument list is left open
+api_doc_function_template = Template(
+    "<li class=\"$kind\" id=\"$class_name.$function_name\">"
+    "<p>$keyword <a href=\"#$class_name.$function_name\">$function_name</a>:</p>"
+    "<ul>"
+)
+
+# Renders the (starts, type, ends) of analyze_type() with a link to the definition of the type
+def api_doc_type_link(analyzed_type):
+    return api_doc_type_link_template.substitute(starts=analyzed_type[0], name=analyzed_type[1], ends=analyzed_type[2])
+
+# Renders the return value of a constructor / function, including its doc comment
+def api_doc_returns(kind, returns):
+    returns_doc = ""
+    if "doc" in returns:
+        returns_doc = "<p class=\"ret doc\">" + format_doc(returns["doc"]) + "</p>"
+    analyzed_return_type = analyze_type(returns["type"])
+    if is_primitive_arg(analyzed_return_type[1]):
+        return_type = analyzed_return_type[1]
+    else:
+        return_type = api_doc_type_link(analyzed_return_type)
+    return "<li>" + returns_doc + api_doc_return_template.substitute(kind=kind, return_type=return_type) + "</li>"
+
+# The api data of a render_api_page worker process, set once by init_api_page_worker
+# so that the api.json is only sent to each worker once instead of once per version
+worker_api_data = None
+
+def init_api_page_worker(api_data):
+    global worker_api_data
+    worker_api_data = api_data
+
+def render_worker_api_page(version):
+    return render_api_page(worker_api_data, version)
+
+# Renders the content of the api reference page of one version of the api.json,
+# returns the list of HTML fragments (see write_html_page)
+def render_api_page(api_data, version):
+
+    version_data = api_data[version]
+
+    api_page_contents = [read_file(root_folder + "/api/_patches/html/api-header.html"), "<ul>"]
+
+    if "doc" in version_data:
+        api_page_contents.append("<p class=\"version doc\">" + format_doc(version_data["doc"]) + "</p>")
+
+    for (module_name, module) in version_data.items():
+
+        api_page_contents.append("<li class=\"m\" id=\"m." + module_name + "\">")
+
+        if "doc" in module:
+            api_page_contents.append("<p class=\"m doc\">" + format_doc(module["doc"]) + "</p>")
+
+        api_page_contents.append("<h3>mod <a href=\"#m." + module_name + "\">" + module_name + "</a>:</h3><ul>")
+
+        for (class_name, c) in module["classes"].items():
+            is_boxed_object = c.get("is_boxed_object", False)
+            treat_external_as_ptr = "external" in c and is_boxed_object
+            class_has_custom_destructor = c.get("custom_destructor", False)
+            class_has_recursive_destructor = has_recursive_destructor(version_data, c)
+
+            destructor_warning = ""
+            if class_has_custom_destructor or treat_external_as_ptr or class_has_recursive_destructor:
+                destructor_warning = "&nbsp;<span class=\"chd\">has destructor</span>"
+
+            class_doc = ""
+            if "doc" in c:
+                class_doc = "<p class=\"class doc\">" + format_doc(c["doc"]) + "</p>"
+
+            if "enum_fields" in c:
+                enum_fields = c["enum_fields"]
+                enum_type = "enum"
+                if enum_is_union(enum_fields):
+                    enum_type = "union enum"
+
+                api_page_contents.append(api_doc_class_template.substitute(li_class="st e pbi", class_doc=class_doc, keyword=enum_type, anchor="st", class_name=class_name, destructor_warning=destructor_warning))
+                for enum_variant in enum_fields:
+                    enum_variant_name = next(iter(enum_variant))
+                    enum_variant_data = enum_variant[enum_variant_name]
+                    if "doc" in enum_variant_data:
+                        api_page_contents.append("<p class=\"v doc\">" + format_doc(enum_variant_data["doc"]) + "</p>")
+
+                    if "type" in enum_variant_data:
+                        enum_variant_type = enum_variant_data["type"]
+                        analyzed_variant_type = analyze_type(enum_variant_type)
+
+                        if is_primitive_arg(analyzed_variant_type[1]):
+                            api_page_contents.append("<p class=\"f\">" + enum_variant_name + "(" + enum_variant_type + ")</p>")
+                        else:
+                            api_page_contents.append("<p class=\"f\">" + enum_variant_name + "(" + api_doc_type_link(analyzed_variant_type) + ")</p>")
+                    else:
+                        api_page_contents.append("<p class=\"f\">" + enum_variant_name + "</p>")
+
+            elif "struct_fields" in c:
+                api_page_contents.append(api_doc_class_template.substitute(li_class="st s pbi", class_doc=class_doc, keyword="struct", anchor="st", class_name=class_name, destructor_warning=destructor_warning))
+                for struct_field in c["struct_fields"]:
+                    struct_field_name = next(iter(struct_field))
+                    struct_field_data = struct_field[struct_field_name]
+                    struct_type = struct_field_data["type"]
+                    analyzed_struct_type = analyze_type(struct_type)
+
+                    if "doc" in struct_field_data:
+                        api_page_contents.append("<p class=\"f doc\">" + format_doc(struct_field_data["doc"]) + "</p>")
+
+                    if is_primitive_arg(analyzed_struct_type[1]):
+                        api_page_contents.append("<p class=\"f\">" + struct_field_name + ": " + struct_type + "</p>")
+                    else:
+                        api_page_contents.append("<p class=\"f\">" + struct_field_name + ": " + api_doc_type_link(analyzed_struct_type) + "</p>")
+
+            elif "callback_typedef" in c:
+                api_page_contents.append(api_doc_class_template.substitute(li_class="pbi fnty", class_doc=class_doc, keyword="fnptr", anchor="fnty", class_name=class_name, destructor_warning=""))
+                callback_typedef = c["callback_typedef"]
+
+                if "fn_args" in callback_typedef:
+                    api_page_contents.append("<ul>")
+                    for fn_arg in callback_typedef["fn_args"]:
+
+                        if "doc" in fn_arg:
+                            api_page_contents.append("<p class=\"arg doc\">" + format_doc(fn_arg["doc"]) + "</p>")
+
+                        fn_arg_type = fn_arg["type"]
+                        analyzed_fn_arg_type = analyze_type(fn_arg_type)
+                        fn_arg_ref = fn_arg["ref"]
+
+                        fn_arg_ref_html = ""
+                        if (fn_arg_ref == "value"):
+                            fn_arg_ref_html = ""
+                        elif (fn_arg_ref == "ref"):
+                            fn_arg_ref_html = "&"
+                        elif (fn_arg_ref == "refmut"):
+                            fn_arg_ref_html = "&mut "
+
+                        if is_primitive_arg(analyzed_fn_arg_type[1]):
+                            api_page_contents.append("<li><p class=\"f\">arg " + analyzed_fn_arg_type[1] + "</p></li>")
+                        else:
+                            api_page_contents.append("<li><p class=\"fnty arg\">arg " + fn_arg_ref_html + " <a href=\"#st." + analyzed_fn_arg_type[1] + "\">" + fn_arg_type + "</a></p></li>")
+                    api_page_contents.append("</ul>")
+
+                if "returns" in callback_typedef:
+                    returns = callback_typedef["returns"]
+                    if "doc" in returns:
+                        api_page_contents.append("<p class=\"ret doc\">" + format_doc(returns["doc"]) + "</p>")
+                    return_type = returns["type"]
+                    analyzed_return_type = analyze_type(return_type)
+                    if is_primitive_arg(analyzed_fn_arg_type[1]):
+                        api_page_contents.append(api_doc_return_template.substitute(kind="fnty", return_type=analyzed_return_type[1]))
+                    else:
+                        api_page_contents.append(api_doc_return_template.substitute(kind="fnty", return_type=api_doc_type_link(("", analyzed_return_type[1], ""))))
+
+            if "constructors" in c:
+                api_page_contents.append("<ul>")
+                for (function_name, f) in c["constructors"].items():
+                    if "doc" in f:
+                        api_page_contents.append("<p class=\"cn doc\">" + format_doc(f["doc"]) + "</p>")
+                    arg_string = []
+                    if "fn_args" in f:
+                        for arg in f["fn_args"]:
+                            arg_name = next(iter(arg))
+                            arg_val = arg[arg_name]
+                            if "doc" in arg:
+                                arg_string.append("<p class=\"arg doc\">" + arg["doc"] + "</p>")
+
+                            analyzed_arg_val = analyze_type(arg_val)
+                            if is_primitive_arg(analyzed_arg_val[1]):
+                                arg_string.append(api_doc_arg_template.substitute(arg_name=arg_name, arg_type=analyzed_arg_val[1]))
+                            else:
+                                arg_string.append(api_doc_arg_template.substitute(arg_name=arg_name, arg_type=api_doc_type_link(analyzed_arg_val)))
+
+                    api_page_contents.append(api_doc_function_template.substitute(kind="cn", keyword="constructor", class_name=class_name, function_name=function_name))
+                    api_page_contents.extend(arg_string)
+                    if "returns" in f:
+                        api_page_contents.append(api_doc_returns("cn", f["returns"]))
+
+                    api_page_contents.append("<li><p class=\"ret\">-&gt;&nbsp;<a href=\"#st." + class_name + "\">" + class_name + "</a></p></li></ul></li>")
+
+                api_page_contents.append("</ul>")
+
+            if "functions" in c:
+                api_page_contents.append("<ul>")
+                for (function_name, f) in c["functions"].items():
+                    if "doc" in f:
+                        api_page_contents.append("<p class=\"fn doc\">" + format_doc(f["doc"]) + "</p>")
+                    arg_string = []
+                    self_arg = ""
+                    if "fn_args" in f:
+                        for arg in f["fn_args"]:
+                            arg_name = next(iter(arg))
+                            arg_val = arg[arg_name]
+
+                            if arg_name == "self":
+                                if arg_val == "value":
+                                    self_arg = "self"
+                                elif arg_val == "ref":
+                                    self_arg = "&self"
+                                elif arg_val == "refmut":
+                                    self_arg = "&mut self"
+                            else:
+                                if "doc" in arg:
+                                    arg_string.append("<p class=\"arg doc\">" + arg["doc"] + "</p>")
+
+                                analyzed_arg_val = analyze_type(arg_val)
+                                if is_primitive_arg(analyzed_arg_val[1]):
+                                    arg_string.append(api_doc_arg_template.substitute(arg_name=arg_name, arg_type=analyzed_arg_val[1]))
+                                else:
+                                    arg_string.append(api_doc_arg_template.substitute(arg_name=arg_name, arg_type=api_doc_type_link(analyzed_arg_val)))
+
+                    api_page_contents.append(api_doc_function_template.substitute(kind="fn", keyword="fn", class_name=class_name, function_name=function_name) + "<li><p class=\"arg\">" + self_arg + "</p></li>")
+                    api_page_contents.extend(arg_string)
+                    if "returns" in f:
+                        api_page_contents.append(api_doc_returns("fn", f["returns"]))
+
+                    api_page_contents.append("</ul></li>")
+
+                api_page_contents.append("</ul>")
+
+            api_page_contents.append("</li>")
+
+        api_page_contents.append("</ul></li>")
+
+    api_page_contents.append("</ul>")
+    return api_page_contents
+
+# The rendered content of the api pages is cached in target/docs-cache/api/
+docs_cache_folder = root_folder + "/target/docs-cache"
+
+# Hashes everything the api page of one version depends on: the api.json
+# entry of the version, the api-header.html and the generator itself (this file)
+def get_api_page_hash(api_data, version):
+    h = hashlib.blake2b()
+    h.update(dump_json(api_data[version]).encode("utf-8"))
+    h.update(read_file(root_folder + "/api/_patches/html/api-header.html").encode("utf-8"))
+    with open(os.path.abspath(__file__), "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+# NOTE: newline='' so that the "\r\n" in the page survive the round trip,
+# the page is renamed into place so that an interrupted build can't leave a half-written page
+def write_api_page_cache(path, api_page_contents):
+    with open(path + ".tmp", "w+", newline='') as out:
+        out.writelines(api_page_contents)
+    os.replace(path + ".tmp", path)
+
+def read_api_page_cache(path):
+    with open(path, "r", newline='') as cached:
+        return cached.read()
+
+# Removes all cached api pages except the ones in "cache_files"
+def prune_api_page_cache(cache_files):
+    with os.scandir(docs_cache_folder + "/api") as entries:
+        for entry in entries:
+            if not(entry.path in cache_files):
+                remove_path(entry.path)
+
 def generate_docs():
     apiData = read_api_file(root_folder + "/api.json")
     html_template = read_file(root_folder + "/api/_patches/html/api.template.html")
@@ -3241,31 +3666,22 @@ def generate_docs():
     if os.path.exists(root_folder + "/target/html"):
         remove_path(root_folder + "/target/html")
 
-    if not(os.path.exists(root_folder + "/target")):
-        create_folder(root_folder + "/target")
+    all_versions = list(apiData)
+    current_version = get_latest_version(apiData)
 
-    all_versions = list(apiData.keys())
-    current_version = all_versions[-1]
+    # makedirs() also creates /target and /target/html
+    for folder in ["api", "release", "fonts", "images"] + ["guide/" + version for version in all_versions]:
+        os.makedirs(root_folder + "/target/html/" + folder, exist_ok=True)
 
-    create_folder(root_folder + "/target/html")
-    create_folder(root_folder + "/target/html/api")
-    create_folder(root_folder + "/target/html/guide")
-    for version in all_versions:
-        create_folder(root_folder + "/target/html/guide/" + version)
-    create_folder(root_folder + "/target/html/release")
-    create_folder(root_folder + "/target/html/fonts")
-    create_folder(root_folder + "/target/html/images")
+    # the pages and static files are written on a thread pool while the next page is rendered
+    io_pool = ThreadPoolExecutor(max_workers=8)
+    io_jobs = []
 
     # copy files
-    # copy_file(, )
-    copy_file(root_folder + "/api/_patches/html/logo.svg", root_folder + "/target/html/logo.svg")
-    copy_file(root_folder + "/api/_patches/html/fleur-de-lis.svg", root_folder + "/target/html/images/fleur-de-lis.svg")
-    copy_file(root_folder + "/api/_patches/html/main.css", root_folder + "/target/html/main.css")
-    copy_file(root_folder + "/examples/assets/fonts/Morris Jenson Initialen.ttf", root_folder + "/target/html/fonts/Morris Jenson Initialen.ttf")
-    copy_file(root_folder + "/examples/assets/fonts/SourceSerifPro-Regular.ttf", root_folder + "/target/html/fonts/SourceSerifPro-Regular.ttf")
+    for (src, dest) in docs_static_files:
+        io_jobs.append(io_pool.submit(copy_file, root_folder + src, root_folder + "/target/html" + dest))
 
     index_template = read_file(root_folder + "/api/_patches/html/index.template.html")
-    index_template = index_template.replace("$$ROOT_RELATIVE$$", html_root)
     index_examples = [
         {
             "id": "helloworld",
@@ -3279,10 +3695,7 @@ def generate_docs():
             "cpu": "CPU: 0%",
             "memory": "Memory: 23MB",
             "image_alt": "Rendering a simple UI using the Azul GUI toolkit",
-            "code:c": render_example_code(read_file(root_folder + "/examples/c/hello-world.c")),
-            "code:cpp": render_example_code(read_file(root_folder + "/examples/cpp/hello-world.cpp")),
-            "code:rust": render_example_code(read_file(root_folder + "/examples/rust/hello-world.rs")),
-            "code:python": render_example_code(read_file(root_folder + "/examples/python/hello-world.py")),
+            **render_example_code_files("hello-world"),
         },
         {
             "id": "table",
@@ -3297,10 +3710,7 @@ def generate_docs():
             "cpu": "CPU: 0%",
             "memory": "Memory: 23MB",
             "image_alt": "Rendering a table using the Azul GUI toolkit",
-            "code:c": render_example_code(read_file(root_folder + "/examples/c/table.c")),
-            "code:cpp": render_example_code(read_file(root_folder + "/examples/cpp/table.cpp")),
-            "code:rust": render_example_code(read_file(root_folder + "/examples/rust/table.rs")),
-            "code:python": render_example_code(read_file(root_folder + "/examples/python/table.py")),
+            **render_example_code_files("table"),
         },
         {
             "id": "svg",
@@ -3314,10 +3724,7 @@ def generate_docs():
             "cpu": "CPU: 0%",
             "memory": "Memory: 23MB",
             "image_alt": "Rendering a SVG file using the Azul GUI toolkit",
-            "code:c": render_example_code(read_file(root_folder + "/examples/c/svg.c")),
-            "code:cpp": render_example_code(read_file(root_folder + "/examples/cpp/svg.cpp")),
-            "code:rust": render_example_code(read_file(root_folder + "/examples/rust/svg.rs")),
-            "code:python": render_example_code(read_file(root_folder + "/examples/python/svg.py")),
+            **render_example_code_files("svg"),
         },
         {
             "id": "calculator",
@@ -3331,10 +3738,7 @@ def generate_docs():
             "cpu": "CPU: 0%",
             "memory": "Memory: 23MB",
             "image_alt": "Composing widgets via functions in the Azul GUI toolkit",
-            "code:c": render_example_code(read_file(root_folder + "/examples/c/calculator.c")),
-            "code:cpp": render_example_code(read_file(root_folder + "/examples/cpp/calculator.cpp")),
-            "code:rust": render_example_code(read_file(root_folder + "/examples/rust/calculator.rs")),
-            "code:python": render_example_code(read_file(root_folder + "/examples/python/calculator.py")),
+            **render_example_code_files("calculator"),
         },
         {
             "id": "xml",
@@ -3349,31 +3753,35 @@ def generate_docs():
             "cpu": "Memory: 0%",
             "memory": "Memory: 23MB",
             "image_alt": "XML UI hot-reloading for fast prototyping",
-            "code:c": render_example_code(read_file(root_folder + "/examples/c/xml.c")),
-            "code:cpp": render_example_code(read_file(root_folder + "/examples/cpp/xml.cpp")),
-            "code:rust": render_example_code(read_file(root_folder + "/examples/rust/xml.rs")),
-            "code:python": render_example_code(read_file(root_folder + "/examples/python/xml.py")),
+            **render_example_code_files("xml"),
         }
     ]
 
     for ex in index_examples:
-        copy_file(ex["screenshot_path"], root_folder + "/target/html/images/" + ex["id"] + ".png")
+        io_jobs.append(io_pool.submit(link_or_copy_file, ex["screenshot_path"], root_folder + "/target/html/images/" + ex["id"] + ".png"))
 
-    first_example = index_examples[0]
-    index_html = index_template.replace("$$EXAMPLE_CODE$$", first_example["code:python"])
-    index_html = index_html.replace("$$EXAMPLE_IMAGE_SOURCE$$", first_example["screenshot_url"])
-    index_html = index_html.replace("$$EXAMPLE_IMAGE_ALT$$", first_example["image_alt"])
-    index_html = index_html.replace("$$EXAMPLE_STATS_MEMORY$$", first_example["memory"])
-    index_html = index_html.replace("$$EXAMPLE_STATS_CPU$$", first_example["cpu"])
-    index_html = index_html.replace("$$EXAMPLE_DESCRIPTION$$", first_example["description"])
-    index_html = index_html.replace("$$JAVASCRIPT_EXAMPLES$$", json.dumps(index_examples))
+    index_examples_json = dump_json(index_examples)
 
-    write_file(index_html, root_folder + "/target/html/index.html")
+    first_example = index_examples[0]
+    index_html = fill_html_template(index_template, {
+        "ROOT_RELATIVE": html_root,
+        "EXAMPLE_CODE": first_example["code:python"],
+        "EXAMPLE_IMAGE_SOURCE": first_example["screenshot_url"],
+        "EXAMPLE_IMAGE_ALT": first_example["image_alt"],
+        "EXAMPLE_STATS_MEMORY": first_example["memory"],
+        "EXAMPLE_STATS_CPU": first_example["cpu"],
+        "EXAMPLE_DESCRIPTION": first_example["description"],
+        "JAVASCRIPT_EXAMPLES": index_examples_json,
+    })
+
+    io_jobs.append(io_pool.submit(write_file, index_html, root_folder + "/target/html/index.html"))
 
     guide_sidebar = "<ul>"
     guide_sidebar_nested = "<ul>"
     guides_rendered = []
-    for entry in sorted(os.scandir(root_folder + "/api/_patches/html/guide"),key=lambda x: x.name):
+    with os.scandir(root_folder + "/api/_patches/html/guide") as entries:
+        guide_entries = sorted(entries, key=attrgetter("name"))
+    for entry in guide_entries:
         if entry.path.endswith(".md") and entry.is_file():
             entry_name = entry.name[3:-3]
             html_path_name = entry_name.replace(" ", "")
@@ -3383,343 +3791,88 @@ def generate_docs():
     guide_sidebar += "</ul>"
     guide_sidebar_nested += "</ul>"
 
-    guide_combined_page = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-    guide_combined_page = guide_combined_page.replace("$$SIDEBAR_GUIDE$$", "")
-    guide_combined_page = guide_combined_page.replace("$$SIDEBAR_RELEASES$$", "")
-    guide_combined_page = guide_combined_page.replace("$$SIDEBAR_API$$", "")
-    guide_combined_page = guide_combined_page.replace("$$TITLE$$", "User guide")
-    guide_combined_page = guide_combined_page.replace("$$CONTENT$$", guide_sidebar)
-    write_file(guide_combined_page, root_folder + "/target/html/guide.html")
+    guide_combined_page = fill_html_template(html_template, {
+        "SIDEBAR_GUIDE": "",
+        "SIDEBAR_RELEASES": "",
+        "SIDEBAR_API": "",
+        "TITLE": "User guide",
+        "CONTENT": guide_sidebar,
+    })
+    io_jobs.append(io_pool.submit(write_file, guide_combined_page, root_folder + "/target/html/guide.html"))
+
+    guide_template = fill_html_sidebars(html_template, guide_sidebar_nested, "", "")
+    guide_template = guide_template.replace("/*$$_EXTRA_CSS$$*/", guide_extra_css)
 
     for guide in guides_rendered:
         entry_name = guide[0]
         html_path_name = entry_name.replace(" ", "")
         guide_content = guide[1]
         guide_content = guide_content.replace("$$ROOT_RELATIVE$$", html_root)
-        formatted_guide = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-        formatted_guide = formatted_guide.replace("$$SIDEBAR_GUIDE$$", guide_sidebar_nested)
-        formatted_guide = formatted_guide.replace("$$SIDEBAR_RELEASES$$", "")
-        formatted_guide = formatted_guide.replace("$$SIDEBAR_API$$", "")
-        formatted_guide = formatted_guide.replace("$$TITLE$$", entry_name)
-        formatted_guide = formatted_guide.replace("$$CONTENT$$", guide_content)
-        extra_css = """
-        main > div { max-width: 80ch; }
-        main > div > p { margin-left: 10px; margin-top: 10px; }
-        main p, main a, main strong { font-family: "Source Serif Pro", serif; font-size: 16px; }
-        main > div > h3 { margin: 10px; }
-        main .warning h4 { margin-bottom: 10px; }
-        main .warning {
-            padding: 10px;
-            border-radius: 5px;
-            border: 1px dashed #facb26;
-            margin: 10px;
-            background: #fff8be;
-            color: #222;
-            box-shadow: 0px 0px 20px #facb2655;
-        }
-        main code.expand { display: block; margin-top: 20px; padding: 10px; border-radius: 5px; }
-        """
-        formatted_guide = formatted_guide.replace("/*$$_EXTRA_CSS$$*/", extra_css)
-        write_file(formatted_guide, root_folder + "/target/html/guide/" + current_version + "/" + html_path_name + ".html")
-
-    releases_string = "<ul>"
+        formatted_guide = fill_html_template(guide_template, {"TITLE": entry_name, "CONTENT": guide_content})
+        io_jobs.append(io_pool.submit(write_file, formatted_guide, root_folder + "/target/html/guide/" + current_version + "/" + html_path_name + ".html"))
 
+    # one pass over the versions for the release folders and the release / api sidebars
+    releases_string = ["<ul>"]
+    api_sidebar_string = ["<ul>"]
     for version in all_versions:
         create_folder(root_folder + "/target/html/release/" + version)
         create_folder(root_folder + "/target/html/release/" + version + "/files")
+        releases_string.append("<li><a href=\"" + html_root + "/release/" + version + "\">" + version + "</a></li>")
+        api_sidebar_string.append("<li><a href=\"" + html_root + "/api/" + version + "\">" + version + "</a></li>")
+    releases_string.append("</ul>")
+    api_sidebar_string.append("</ul>")
+    releases_string = "".join(releases_string)
+    api_sidebar_string = "".join(api_sidebar_string)
 
-    for version in all_versions:
-        releases_string += "<li><a href=\"" + html_root + "/release/" + version + "\">" + version + "</a></li>"
+    release_template = fill_html_sidebars(html_template, "", releases_string, "")
 
-    releases_string += "</ul>"
-
-    releases_combined_page = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-    releases_combined_page = releases_combined_page.replace("$$SIDEBAR_GUIDE$$", "")
-    releases_combined_page = releases_combined_page.replace("$$SIDEBAR_RELEASES$$", releases_string)
-    releases_combined_page = releases_combined_page.replace("$$SIDEBAR_API$$", "")
-    releases_combined_page = releases_combined_page.replace("$$TITLE$$", "Choose release version")
-    releases_combined_page = releases_combined_page.replace("$$CONTENT$$", releases_string)
-    write_file(releases_combined_page, root_folder + "/target/html/releases.html")
+    releases_combined_page = fill_html_template(release_template, {"TITLE": "Choose release version", "CONTENT": releases_string})
+    io_jobs.append(io_pool.submit(write_file, releases_combined_page, root_folder + "/target/html/releases.html"))
 
     for version in all_versions:
         release_announcement = read_file(root_folder + "/api/_patches/html/release/" + version + ".html")
-        release_page = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-        release_page = release_page.replace("$$SIDEBAR_GUIDE$$", "")
-        release_page = release_page.replace("$$SIDEBAR_RELEASES$$", releases_string)
-        release_page = release_page.replace("$$SIDEBAR_API$$", "")
-        release_page = release_page.replace("$$TITLE$$", "Release notes - Azul GUI v" + version)
-        release_page = release_page.replace("$$CONTENT$$", release_announcement)
-        write_file(release_page, root_folder + "/target/html/release/" + version + ".html")
-
-    api_sidebar_string = "<ul>"
-    for version in all_versions:
-        api_sidebar_string += "<li><a href=\"" + html_root + "/api/" + version + "\">" + version + "</a></li>"
-    api_sidebar_string += "</ul>"
-
-    for version in all_versions:
-
-        api_page_contents = ""
-        api_page_contents += read_file(root_folder + "/api/_patches/html/api-header.html")
-        api_page_contents += "<ul>"
-
-        if "doc" in apiData[version].keys():
-            api_page_contents += "<p class=\"version doc\">" + format_doc(apiData[version]["doc"]) + "</p>"
-
-        for module_name in apiData[version].keys():
-
-            api_page_contents += "<li class=\"m\" id=\"m." + module_name + "\">"
-
-            module = apiData[version][module_name]
-
-            if "doc" in module.keys():
-                api_page_contents += "<p class=\"m doc\">" + format_doc(module["doc"]) + "</p>"
-
-            api_page_contents += "<h3>mod <a href=\"#m." + module_name + "\">" + module_name + "</a>:</h3>"
+        release_page = fill_html_template(release_template, {"TITLE": "Release notes - Azul GUI v" + version, "CONTENT": release_announcement})
+        io_jobs.append(io_pool.submit(write_file, release_page, root_folder + "/target/html/release/" + version + ".html"))
 
-            api_page_contents += "<ul>"
+    api_combined_template = fill_html_sidebars(html_template, "", "", api_sidebar_string)
+    api_template = api_combined_template.replace("/*$$_EXTRA_CSS$$*/", api_extra_css)
 
-            for class_name in module["classes"].keys():
-                c = module["classes"][class_name]
-                is_boxed_object = "is_boxed_object" in c.keys() and c["is_boxed_object"]
-                treat_external_as_ptr = "external" in c.keys() and is_boxed_object
-                class_has_custom_destructor = "custom_destructor" in c.keys() and c["custom_destructor"]
-                class_has_recursive_destructor = has_recursive_destructor(apiData[version], c)
-
-                destructor_warning = ""
-                if class_has_custom_destructor or treat_external_as_ptr or class_has_recursive_destructor:
-                    destructor_warning = "&nbsp;<span class=\"chd\">has destructor</span>"
-
-                if "enum_fields" in c.keys():
-                    api_page_contents += "<li class=\"st e pbi\" id=\"st." + class_name + "\">"
-                    if "doc" in c.keys():
-                        api_page_contents += "<p class=\"class doc\">" + format_doc(c["doc"]) + "</p>"
-                    enum_type = "enum"
-                    if enum_is_union(c["enum_fields"]):
-                        enum_type = "union enum"
-
-                    api_page_contents += "<h4>" + enum_type + " <a href=\"#st." + class_name + "\">" + class_name + "</a>" + destructor_warning + "</h4>"
-                    for enum_variant in c["enum_fields"]:
-                        enum_variant_name = list(enum_variant.keys())[0]
-                        if "doc" in enum_variant[enum_variant_name]:
-                            api_page_contents += "<p class=\"v doc\">" + format_doc(enum_variant[enum_variant_name]["doc"]) + "</p>"
-
-                        if "type" in enum_variant[enum_variant_name]:
-                            enum_variant_type = enum_variant[enum_variant_name]["type"]
-                            analyzed_variant_type = analyze_type(enum_variant_type)
-
-                            if is_primitive_arg(analyzed_variant_type[1]):
-                                api_page_contents += "<p class=\"f\">" + enum_variant_name + "(" + enum_variant_type + ")</p>"
-                            else:
-                                api_page_contents += "<p class=\"f\">" + enum_variant_name + "(" + analyzed_variant_type[0] + "<a href=\"#st." + analyzed_variant_type[1] + "\">" + analyzed_variant_type[1] +"</a>" + analyzed_variant_type[2] + ")</p>"
-                        else:
-                            api_page_contents += "<p class=\"f\">" + enum_variant_name + "</p>"
-
-                elif "struct_fields" in c.keys():
-                    api_page_contents += "<li class=\"st s pbi\" id=\"st." + class_name + "\">"
-                    if "doc" in c.keys():
-                        api_page_contents += "<p class=\"class doc\">" + format_doc(c["doc"]) + "</p>"
-                    api_page_contents += "<h4>struct <a href=\"#st." + class_name + "\">" + class_name + "</a>" + destructor_warning + "</h4>"
-                    for struct_field in c["struct_fields"]:
-                        struct_field_name = list(struct_field.keys())[0]
-                        struct_type = struct_field[struct_field_name]["type"]
-                        analyzed_struct_type = analyze_type(struct_type)
-
-                        if "doc" in struct_field[struct_field_name]:
-                            api_page_contents += "<p class=\"f doc\">" + format_doc(struct_field[struct_field_name]["doc"]) + "</p>"
-
-                        if is_primitive_arg(analyzed_struct_type[1]):
-                            api_page_contents += "<p class=\"f\">" + struct_field_name + ": " + struct_type + "</p>"
-                        else:
-                            api_page_contents += "<p class=\"f\">" + struct_field_name + ": " + analyzed_struct_type[0] + "<a href=\"#st." + analyzed_struct_type[1] + "\">" + analyzed_struct_type[1] +"</a>" + analyzed_struct_type[2] + "</p>"
-
-                elif "callback_typedef" in c.keys():
-                    api_page_contents += "<li class=\"pbi fnty\" id=\"st." + class_name + "\">"
-                    if "doc" in c.keys():
-                        api_page_contents += "<p class=\"class doc\">" + format_doc(c["doc"]) + "</p>"
-                    api_page_contents += "<h4>fnptr <a href=\"#fnty." + class_name + "\">" + class_name + "</a></h4>"
-                    callback_typedef = c["callback_typedef"]
-
-                    if "fn_args" in callback_typedef:
-                        api_page_contents += "<ul>"
-                        for fn_arg in callback_typedef["fn_args"]:
-
-                            if "doc" in fn_arg.keys():
-                                api_page_contents += "<p class=\"arg doc\">" + format_doc(fn_arg["doc"]) + "</p>"
-
-                            fn_arg_type = fn_arg["type"]
-                            analyzed_fn_arg_type = analyze_type(fn_arg_type)
-                            fn_arg_ref = fn_arg["ref"]
-
-                            fn_arg_ref_html = ""
-                            if (fn_arg_ref == "value"):
-                                fn_arg_ref_html = ""
-                            elif (fn_arg_ref == "ref"):
-                                fn_arg_ref_html = "&"
-                            elif (fn_arg_ref == "refmut"):
-                                fn_arg_ref_html = "&mut "
-
-                            if is_primitive_arg(analyzed_fn_arg_type[1]):
-                                api_page_contents += "<li><p class=\"f\">arg " + analyzed_fn_arg_type[1] + "</p></li>"
-                            else:
-                                api_page_contents += "<li><p class=\"fnty arg\">arg " + fn_arg_ref_html + " <a href=\"#st." + analyzed_fn_arg_type[1] + "\">" + fn_arg_type + "</a></p></li>"
-                        api_page_contents += "</ul>"
-
-                    if "returns" in callback_typedef.keys():
-                        if "doc" in callback_typedef["returns"].keys():
-                            api_page_contents += "<p class=\"ret doc\">" + format_doc(callback_typedef["returns"]["doc"]) + "</p>"
-                        return_type = callback_typedef["returns"]["type"]
-                        analyzed_return_type = analyze_type(return_type)
-                        if is_primitive_arg(analyzed_fn_arg_type[1]):
-                            api_page_contents += "<p class=\"fnty ret\">-&gt;&nbsp;" + analyzed_return_type[1] + "</p>"
-                        else:
-                            api_page_contents += "<p class=\"fnty ret\">-&gt;&nbsp;<a href=\"#st." + analyzed_return_type[1] + "\">" + analyzed_return_type[1] + "</a></p>"
-
-                if "constructors" in c.keys():
-                    api_page_contents += "<ul>"
-                    for function_name in c["constructors"]:
-                        f = c["constructors"][function_name]
-                        if "doc" in f:
-                            api_page_contents += "<p class=\"cn doc\">" + format_doc(c["constructors"][function_name]["doc"]) + "</p>"
-                        arg_string = ""
-                        if "fn_args" in f:
-                            args = f["fn_args"]
-                            for arg in args:
-                                arg_name = list(arg.keys())[0]
-                                arg_val = arg[arg_name]
-                                if "doc" in arg.keys():
-                                    arg_string += "<p class=\"arg doc\">" + arg["doc"] + "</p>"
-
-                                analyzed_arg_val = analyze_type(arg_val)
-                                if is_primitive_arg(analyzed_arg_val[1]):
-                                    arg_string += "<li><p class=\"arg\">arg " + arg_name + ": " + analyzed_arg_val[1] + "</p></li>"
-                                else:
-                                    arg_string += "<li><p class=\"arg\">arg " + arg_name + ": " + analyzed_arg_val[0] + "<a href=\"#st." + analyzed_arg_val[1] + "\">" + analyzed_arg_val[1] + "</a>" + analyzed_arg_val[2] + "</p></li>"
-
-                        api_page_contents += "<li class=\"cn\" id=\"" + class_name + "." + function_name + "\">"
-                        api_page_contents += "<p>constructor <a href=\"#" + class_name + "." + function_name + "\">" + function_name + "</a>:</p>"
-                        api_page_contents += "<ul>"
-                        if not(len(arg_string) == 0):
-                            api_page_contents += arg_string
-                        if "returns" in f.keys():
-                            api_page_contents += "<li>"
-                            if "doc" in f["returns"].keys():
-                                api_page_contents += "<p class=\"ret doc\">" + format_doc(f["returns"]["doc"]) + "</p>"
-                            return_type = f["returns"]["type"]
-                            analyzed_return_type = analyze_type(return_type)
-                            if is_primitive_arg(analyzed_return_type[1]):
-                                api_page_contents += "<p class=\"cn ret\">-&gt;&nbsp;" + analyzed_return_type[1] + "</p>"
-                            else:
-                                api_page_contents += "<p class=\"cn ret\">-&gt;&nbsp;" + analyzed_return_type[0] + "<a href=\"#st."+ analyzed_return_type[1] + "\">" + analyzed_return_type[1] + "</a>" + analyzed_return_type[2] + "</p>"
-                            api_page_contents += "</li>"
-
-                        api_page_contents += "<li><p class=\"ret\">-&gt;&nbsp;<a href=\"#st." + class_name + "\">" + class_name + "</a></p></li>"
-                        api_page_contents += "</ul>"
-                        api_page_contents += "</li>"
-
-                    api_page_contents += "</ul>"
-
-                if "functions" in c.keys():
-                    api_page_contents += "<ul>"
-                    for function_name in c["functions"]:
-                        f = c["functions"][function_name]
-                        if "doc" in f:
-                            api_page_contents += "<p class=\"fn doc\">" + format_doc(c["functions"][function_name]["doc"]) + "</p>"
-                        arg_string = ""
-                        self_arg = ""
-                        if "fn_args" in f:
-                            args = f["fn_args"]
-                            for arg in args:
-                                arg_name = list(arg.keys())[0]
-                                arg_val = arg[arg_name]
-
-                                if arg_name == "self":
-                                    if arg_val == "value":
-                                        self_arg = "self"
-                                    elif arg_val == "ref":
-                                        self_arg = "&self"
-                                    elif arg_val == "refmut":
-                                        self_arg = "&mut self"
-                                else:
-                                    if "doc" in arg.keys():
-                                        arg_string += "<p class=\"arg doc\">" + arg["doc"] + "</p>"
-
-                                    analyzed_arg_val = analyze_type(arg_val)
-                                    if is_primitive_arg(analyzed_arg_val[1]):
-                                        arg_string += "<li><p class=\"arg\">arg " + arg_name + ": " + analyzed_arg_val[1] + "</p></li>"
-                                    else:
-                                        arg_string += "<li><p class=\"arg\">arg " + arg_name + ": " + analyzed_arg_val[0] + "<a href=\"#st." + analyzed_arg_val[1] + "\">" + analyzed_arg_val[1] + "</a>" + analyzed_arg_val[2] + "</p></li>"
-
-                        api_page_contents += "<li class=\"fn\" id=\"" + class_name + "." + function_name + "\">"
-                        api_page_contents += "<p>fn <a href=\"#" + class_name + "." + function_name + "\">" + function_name + "</a>:</p>"
-                        api_page_contents += "<ul>"
-                        api_page_contents += "<li><p class=\"arg\">" + self_arg + "</p></li>"
-                        if not(len(arg_string) == 0):
-                            api_page_contents += arg_string
-                        if "returns" in f.keys():
-                            api_page_contents += "<li>"
-                            if "doc" in f["returns"].keys():
-                                api_page_contents += "<p class=\"ret doc\">" + format_doc(f["returns"]["doc"]) + "</p>"
-                            return_type = f["returns"]["type"]
-                            analyzed_return_type = analyze_type(return_type)
-                            if is_primitive_arg(analyzed_return_type[1]):
-                                api_page_contents += "<p class=\"fn ret\">-&gt;&nbsp;" + analyzed_return_type[1] + "</p>"
-                            else:
-                                api_page_contents += "<p class=\"fn ret\">-&gt;&nbsp;" + analyzed_return_type[0] + "<a href=\"#st."+ analyzed_return_type[1] + "\">" + analyzed_return_type[1] + "</a>" + analyzed_return_type[2] + "</p>"
-                            api_page_contents += "</li>"
-
-                        api_page_contents += "</ul>"
-                        api_page_contents += "</li>"
-
-                    api_page_contents += "</ul>"
-
-                api_page_contents += "</li>"
-
-            api_page_contents += "</ul>"
+    # old versions in the api.json don't change, so their rendered api pages
+    # are cached in target/docs-cache/api/<hash of the version>.html
+    api_page_cache_files = {}
+    for version in all_versions:
+        api_page_cache_files[version] = docs_cache_folder + "/api/" + get_api_page_hash(apiData, version) + ".html"
+    uncached_versions = [version for version in all_versions if not(os.path.exists(api_page_cache_files[version]))]
+
+    # the api pages of the different versions don't depend on each other,
+    # so they are rendered on multiple processes if there is more than one version
+    if len(uncached_versions) > 1:
+        with ProcessPoolExecutor(initializer=init_api_page_worker, initargs=(apiData,)) as pool:
+            rendered_api_pages = list(pool.map(render_worker_api_page, uncached_versions))
+    else:
+        rendered_api_pages = [render_api_page(apiData, version) for version in uncached_versions]
 
-            api_page_contents += "</li>"
+    os.makedirs(docs_cache_folder + "/api", exist_ok=True)
+    prune_api_page_cache(set(api_page_cache_files.values()))
+    api_pages = dict(zip(uncached_versions, rendered_api_pages))
+    for version in all_versions:
+        if version in api_pages:
+            io_jobs.append(io_pool.submit(write_api_page_cache, api_page_cache_files[version], api_pages[version]))
+        else:
+            api_pages[version] = read_api_page_cache(api_page_cache_files[version])
 
-        api_page_contents += "</ul>"
+    for version in all_versions:
+        api_page_contents = api_pages[version]
+        api_page_values = {"TITLE": "v" + version, "CONTENT": api_page_contents}
+        io_jobs.append(io_pool.submit(write_html_page, root_folder + "/target/html/api/" + version + ".html", api_template, api_page_values))
 
-        releases_string = "<ul>"
-        for version in all_versions:
-            releases_string += "<li><a href=\"./" + version + "\">" + version + "</a></li>"
-        releases_string += "</ul>"
+    api_combined_page = fill_html_template(api_combined_template, {"TITLE": "Choose API version", "CONTENT": api_sidebar_string})
+    io_jobs.append(io_pool.submit(write_file, api_combined_page, root_folder + "/target/html/api.html"))
 
-        final_html = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-        extra_css = "\
-        body > .center > main > div > ul * { font-size: 12px; font-weight: normal; list-style-type: none; font-family: monospace; }\
-        body > .center > main > div > ul > li ul { margin-left: 20px; }\
-        body > .center > main > div > ul > li.m { margin-top: 40px; margin-bottom: 20px; }\
-        body > .center > main > div > ul > li.m > ul > li { margin-bottom: 15px; }\
-        body > .center > main > div > ul > li.m > ul > li.st.e { color: #2b6a2d; }\
-        body > .center > main > div > ul > li.m > ul > li.st.s { color: #905; }\
-        body > .center > main > div > ul > li.m > ul > li.fnty,\
-        body > .center > main > div > ul > li.m > ul > li .arg { color: #4c1c1a; }\
-        body > .center > main > div > ul > li.m > ul > li.st .f { margin-left: 20px; }\
-        body > .center > main > div > ul > li.m > ul > li.st .v.doc { margin-left: 20px; }\
-        body > .center > main > div > ul > li.m > ul > li.st .cn { margin-left: 20px; color: #07a; }\
-        body > .center > main > div > ul > li.m > ul > li.st .fn { margin-left: 20px; color: #004e92; }\
-        body > .center > main > div > ul > li.m > ul > li p.ret,\
-        body > .center > main > div > ul > li.m > ul > li p.fn.ret,\
-        body > .center > main > div > ul > li.m > ul > li p.ret.doc { margin-left: 0px; }\
-        body > .center > main > div p.doc { margin-top: 5px !important; color: black !important; max-width: 70ch !important; font-weight: bolder; }\
-        body > .center > main > div a { color: inherit !important; }\
-        "
-        final_html = final_html.replace("/*$$_EXTRA_CSS$$*/", extra_css)
-        final_html = final_html.replace("$$SIDEBAR_RELEASES$$", "")
-        final_html = final_html.replace("$$SIDEBAR_GUIDE$$", "")
-        final_html = final_html.replace("$$SIDEBAR_API$$", api_sidebar_string)
-        final_html = final_html.replace("$$TITLE$$", "v" + version)
-        final_html = final_html.replace("$$CONTENT$$", api_page_contents)
-        write_file(final_html, root_folder + "/target/html/api/" + version + ".html")
-
-    api_combined_page = html_template.replace("$$ROOT_RELATIVE$$", html_root)
-    api_combined_page = api_combined_page.replace("$$SIDEBAR_GUIDE$$", "")
-    api_combined_page = api_combined_page.replace("$$SIDEBAR_RELEASES$$", "")
-    api_combined_page = api_combined_page.replace("$$SIDEBAR_API$$", api_sidebar_string)
-    api_combined_page = api_combined_page.replace("$$TITLE$$", "Choose API version")
-    api_combined_page = api_combined_page.replace("$$CONTENT$$", api_sidebar_string)
-    write_file(api_combined_page, root_folder + "/target/html/api.html")
+    # wait until all files are written, re-raises the first error
+    io_pool.shutdown(wait=True)
+    for job in io_jobs:
+        job.result()
 
 def build_azulc():
     # enable features="image_loading, font_loading" to enable layouting
@@ -3729,7 +3882,8 @@ def generate_license():
     # windows
     os.system('cd "' + root_folder + '/azul-dll" && cargo license --filter-platform=x86_64-pc-windows-msvc --avoid-build-deps --avoid-dev-deps -j > ../LICENSE-WINDOWS.json')
     license_template = read_file(root_folder + "/LICENSE")
-    license_authors = read_file(root_folder + "/LICENSE-WINDOWS.json")
+    # NOTE: not read_file(), the file is regenerated by cargo on every call
+    license_authors = read_file.__wrapped__(root_folder + "/LICENSE-WINDOWS.json")
     license_json = json.loads(license_authors)
     license_authors_formatted = format_license_authors(license_json)
     remove_unused_crates(license_json, root_folder + "/../azul-v1.0-beta1")